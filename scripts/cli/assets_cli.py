@@ -0,0 +1,393 @@
+"""
+Assets CLI Handler
+Command-line interface for .zko asset commands
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List
+from common import BaseScript
+from tools import zko_mesh
+from tools.zko import ZkoFormatError, ZkoReader, ZkoReport, get_engine_zko_version
+from tools.zko_compact import ZkoCompactionResult, compact_zko
+from tools.zko_size import ZkoSizeReport, parse_budgets, zko_size_report
+from tools.zko_validation import DEFAULT_CACHE_PATH, ZkoCorpusValidator, ZkoFileCheck
+
+
+def add_assets_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add assets subcommand arguments"""
+    assets_subparsers = parser.add_subparsers(dest='assets_command', help='Asset commands')
+
+    inspect_parser = assets_subparsers.add_parser('inspect', help='Inspect a .zko file without loading it')
+    inspect_parser.add_argument('file', help='Path to the .zko file')
+    inspect_parser.add_argument('--expected-version', metavar='X.Y.Z',
+                                help='ZKO version to check the header against '
+                                     '(default: ZKO_VERSION from the engine sources)')
+    inspect_parser.add_argument('--json', action='store_true',
+                                help='Print the inspection report as JSON')
+    inspect_parser.add_argument('--limit', type=int, default=20, metavar='N',
+                                help='Maximum objects and components listed (default: 20, 0 = all)')
+
+    validate_parser = assets_subparsers.add_parser('validate', help='Validate every .zko file below a directory')
+    validate_parser.add_argument('directory', help='Directory to scan (or a single .zko file)')
+    validate_parser.add_argument('--expected-version', metavar='X.Y.Z',
+                                 help='ZKO version to check headers against '
+                                      '(default: ZKO_VERSION from the engine sources)')
+    validate_parser.add_argument('--incremental', action='store_true',
+                                 help='Skip files whose size and modification time did not change since the last run')
+    validate_parser.add_argument('--jobs', type=int, metavar='N',
+                                 help='Worker processes (default: number of CPUs)')
+    validate_parser.add_argument('--cache', metavar='FILE',
+                                 help=f'Result cache for --incremental (default: {DEFAULT_CACHE_PATH})')
+    validate_parser.add_argument('--json', action='store_true',
+                                 help='Print per-file results as JSON')
+
+    meshes_parser = assets_subparsers.add_parser('meshes', help='Show mesh statistics of a .zko file')
+    meshes_parser.add_argument('file', help='Path to the .zko file')
+    meshes_parser.add_argument('--json', action='store_true',
+                               help='Print mesh statistics as JSON')
+
+    report_parser = assets_subparsers.add_parser('report', help='Attribute the size of a .zko file and check budgets')
+    report_parser.add_argument('file', help='Path to the .zko file')
+    report_parser.add_argument('--budget', action='append', default=[], metavar='KEY=SIZE',
+                               help='Size budget, e.g. textures=4MiB (category total), texture=1MiB (each texture) '
+                                    'or total=8MB. Can be repeated')
+    report_parser.add_argument('--budget-file', metavar='FILE',
+                               help='JSON object of budgets, e.g. {"textures": "4MiB", "action": "256K"}; '
+                                    '--budget entries override it')
+    report_parser.add_argument('--json', action='store_true',
+                               help='Print the size report as JSON')
+    report_parser.add_argument('--limit', type=int, default=20, metavar='N',
+                               help='Maximum entries listed (default: 20, 0 = all)')
+
+    compact_parser = assets_subparsers.add_parser(
+        'compact', help='Remove unreferenced components and merge identical ones in a .zko file'
+    )
+    compact_parser.add_argument('file', help='Path to the .zko file')
+    compact_parser.add_argument('output', nargs='?',
+                                help='Where to write the compacted file (may be the input file)')
+    compact_parser.add_argument('--dry-run', action='store_true',
+                                help='Only show what would be removed')
+    compact_parser.add_argument('--no-prune', action='store_true',
+                                help='Keep meshes and textures that no object references')
+    compact_parser.add_argument('--no-dedupe', action='store_true',
+                                help='Keep meshes and textures with identical data')
+    compact_parser.add_argument('--json', action='store_true',
+                                help='Print the compaction result as JSON')
+
+
+def show_zko_report(base: BaseScript, report: ZkoReport, limit: int = 20) -> None:
+    """Display a .zko inspection report to user"""
+    base.print_header("ZKO FILE INSPECTION")
+    base.print_status(f"File: {report.path} ({report.file_size / 1024:.1f} KiB)")
+
+    if report.version is None:
+        base.print_error("No header found")
+    elif report.compatible is None:
+        base.print_status(f"Version: {report.version}")
+    elif report.compatible:
+        base.print_success(f"Version: {report.version} (compatible with {report.expected_version})")
+    else:
+        base.print_error(f"Version: {report.version} (engine expects {report.expected_version}-compatible files)")
+
+    print("\nSections:")
+    for section in report.sections:
+        count = f" x{section.count}" if section.count > 1 else ""
+        print(f"  {section.name + count:<20} offset {section.offset:>12}  {section.size / 1024:>12.1f} KiB")
+
+    shown = report.objects if limit <= 0 else report.objects[:limit]
+    print(f"\nObjects ({len(report.objects)}):")
+    for obj in shown:
+        refs = [f"{label}={ref}" for label, ref in
+                (("mesh", obj.mesh_ref), ("texture", obj.texture_ref), ("skeleton", obj.skeleton_ref)) if ref]
+        name = f" '{obj.name}'" if obj.name else ""
+        print(f"  - {obj.type:<8} {obj.ref_id}{name}  {obj.size / 1024:.1f} KiB"
+              + (f"  ({', '.join(refs)})" if refs else ""))
+    if len(shown) < len(report.objects):
+        print(f"  ... and {len(report.objects) - len(shown)} more (use --limit 0 to list all)")
+
+    shown = report.components if limit <= 0 else report.components[:limit]
+    print(f"\nComponents ({len(report.components)}):")
+    for component in shown:
+        print(f"  - {component.kind:<8} {component.ref_id}  {component.size / 1024:.1f} KiB")
+    if len(shown) < len(report.components):
+        print(f"  ... and {len(report.components) - len(shown)} more (use --limit 0 to list all)")
+
+    if report.hierarchy:
+        print(f"\nHierarchy: root {report.hierarchy.root_ref}, {report.hierarchy.node_count} nodes, "
+              f"depth {report.hierarchy.max_depth}")
+
+    if report.actions:
+        print(f"\nActions ({len(report.actions)}):")
+        for action in report.actions:
+            print(f"  - {action.name}: {action.duration:.2f}s, {action.tracks} tracks, {action.size / 1024:.1f} KiB")
+
+    print()
+    if report.issues:
+        for issue in report.issues:
+            where = f" at byte {issue.offset}" if issue.offset is not None else ""
+            base.print_error(f"{issue.message}{where}")
+    elif report.valid:
+        base.print_success("File structure is valid")
+
+
+def handle_inspect_command(args, base: BaseScript) -> int:
+    """Handle assets inspect subcommand"""
+    expected_version = args.expected_version or get_engine_zko_version(base.project_root)
+    try:
+        with ZkoReader(Path(args.file)) as reader:
+            report = reader.inspect(expected_version)
+    except OSError as e:
+        base.print_error(f"Cannot read {args.file}: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(dict(asdict(report), valid=report.valid), indent=2))
+    else:
+        show_zko_report(base, report, args.limit)
+    return 0 if report.valid else 1
+
+
+def show_validation_results(base: BaseScript, checks: List[ZkoFileCheck], expected_version: str,
+                            duration: float) -> None:
+    """Display corpus validation results to user"""
+    base.print_header("ZKO CORPUS VALIDATION")
+    base.print_status(f"Expected ZKO version: {expected_version or 'not checked'}")
+    print()
+
+    for check in checks:
+        if check.status == "incompatible":
+            base.print_error(f"{check.path}: version {check.version} is not compatible")
+        elif check.status == "corrupt":
+            for issue in check.issues:
+                where = f" (byte {issue.offset})" if issue.offset is not None else ""
+                base.print_error(f"{check.path}: {issue.message}{where}")
+
+    counts = {status: sum(1 for check in checks if check.status == status)
+              for status in ("ok", "incompatible", "corrupt")}
+    cached = sum(1 for check in checks if check.cached)
+    print()
+    base.print_status(f"{len(checks)} files checked in {duration:.2f}s ({cached} unchanged since last run)")
+    if counts["incompatible"] or counts["corrupt"]:
+        base.print_error(f"{counts['ok']} ok, {counts['incompatible']} incompatible, {counts['corrupt']} corrupt")
+    else:
+        base.print_success(f"All {counts['ok']} files are valid")
+
+
+def handle_validate_command(args, base: BaseScript) -> int:
+    """Handle assets validate subcommand"""
+    directory = Path(args.directory)
+    if not directory.exists():
+        base.print_error(f"{directory} does not exist")
+        return 1
+
+    expected_version = args.expected_version or get_engine_zko_version(base.project_root)
+    cache_file = Path(args.cache) if args.cache else base.project_root / DEFAULT_CACHE_PATH
+    validator = ZkoCorpusValidator(cache_file, args.jobs)
+
+    start = time.monotonic()
+    checks = validator.validate(directory, expected_version, incremental=args.incremental)
+    duration = time.monotonic() - start
+    validator.save()
+
+    if args.json:
+        print(json.dumps([dict(asdict(check), status=check.status) for check in checks], indent=2))
+    else:
+        show_validation_results(base, checks, expected_version, duration)
+    return 0 if all(check.status == "ok" for check in checks) else 1
+
+
+def handle_meshes_command(args, base: BaseScript) -> int:
+    """Handle assets meshes subcommand"""
+    try:
+        stats = zko_mesh.mesh_statistics(Path(args.file))
+    except OSError as e:
+        base.print_error(f"Cannot read {args.file}: {e}")
+        return 1
+    except ZkoFormatError as e:
+        base.print_error(f"{args.file}: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return 0
+
+    base.print_header("ZKO MESHES")
+    for mesh in stats:
+        print(f"  - {mesh['ref_id']} ({mesh['draw_mode']}): {mesh['vertices']} vertices, "
+              f"{mesh['indices']} indices, {mesh['bytes'] / 1024:.1f} KiB")
+        for name, attribute in mesh['attributes'].items():
+            print(f"      {name:<16} {attribute['type']:<24} x{attribute['count']:<10} "
+                  f"{attribute['bytes'] / 1024:.1f} KiB")
+        if mesh['bounds']:
+            print(f"      bounds min {mesh['bounds']['min']} max {mesh['bounds']['max']}")
+    print()
+    base.print_status(f"{len(stats)} meshes, {sum(mesh['vertices'] for mesh in stats)} vertices, "
+                      f"{sum(mesh['bytes'] for mesh in stats) / 1024:.1f} KiB of attribute data")
+    if zko_mesh.numpy is None:
+        base.print_warning("Install numpy to compute bounding boxes")
+    return 0
+
+
+def load_budgets(args) -> Dict[str, int]:
+    """
+    Collect size budgets from --budget-file and --budget arguments
+
+    Raises:
+        ValueError: On unreadable budget files, unknown keys or invalid sizes
+    """
+    specs = {}
+    if args.budget_file:
+        try:
+            with open(args.budget_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"cannot read budget file {args.budget_file}: {e}")
+        if not isinstance(data, dict):
+            raise ValueError(f"budget file {args.budget_file} must contain a JSON object")
+        specs.update(data)
+    for budget in args.budget:
+        key, separator, size = budget.partition('=')
+        if not separator:
+            raise ValueError(f"invalid budget '{budget}' (expected KEY=SIZE)")
+        specs[key.strip()] = size
+    return parse_budgets(specs)
+
+
+def show_size_report(base: BaseScript, report: ZkoSizeReport, limit: int = 20) -> None:
+    """Display a .zko size report to user"""
+    base.print_header("ZKO SIZE REPORT")
+    base.print_status(f"File: {report.path} ({report.file_size / 1024:.1f} KiB)")
+
+    print("\nCategories:")
+    for category, size in sorted(report.categories.items(), key=lambda item: item[1], reverse=True):
+        if size:
+            share = size * 100 / report.file_size
+            print(f"  {category:<12} {size / 1024:>12.1f} KiB  {share:>5.1f}%")
+
+    shown = report.largest(limit)
+    print(f"\nLargest entries ({len(report.entries)}):")
+    for entry in shown:
+        share = entry.size * 100 / report.file_size
+        largest_field = max(entry.fields.items(), key=lambda item: item[1], default=None)
+        detail = f"  ({largest_field[0]} {largest_field[1] * 100 / entry.size:.0f}%)" if largest_field else ""
+        print(f"  {entry.category:<10} {entry.name:<32} {entry.size / 1024:>12.1f} KiB  {share:>5.1f}%{detail}")
+    if len(shown) < len(report.entries):
+        print(f"  ... and {len(report.entries) - len(shown)} more (use --limit 0 to list all)")
+
+    print()
+    for violation in report.violations:
+        what = f"{violation.budget} '{violation.entry}'" if violation.entry is not None else violation.budget
+        base.print_error(f"{what} is {violation.size / 1024:.1f} KiB, budget is {violation.limit / 1024:.1f} KiB")
+
+
+def handle_report_command(args, base: BaseScript) -> int:
+    """Handle assets report subcommand"""
+    try:
+        budgets = load_budgets(args)
+    except ValueError as e:
+        base.print_error(str(e))
+        return 1
+
+    try:
+        report = zko_size_report(Path(args.file), budgets)
+    except OSError as e:
+        base.print_error(f"Cannot read {args.file}: {e}")
+        return 1
+    except ZkoFormatError as e:
+        base.print_error(f"{args.file}: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(dict(asdict(report), budgets=budgets), indent=2))
+    else:
+        show_size_report(base, report, args.limit)
+        if budgets and not report.violations:
+            base.print_success(f"Within all {len(budgets)} size budgets")
+    return 1 if report.violations else 0
+
+
+def show_compaction_result(base: BaseScript, result: ZkoCompactionResult) -> None:
+    """Display a .zko compaction result to user"""
+    base.print_header("ZKO COMPACTION")
+    base.print_status(f"File: {result.input_path}")
+
+    reasons = {"unreferenced": "not referenced by any object", "shadowed": "ref id already used"}
+    print(f"\nRemoved components ({len(result.removed)}):")
+    for change in result.removed:
+        reason = f"identical to {change.merged_into}" if change.merged_into else reasons[change.reason]
+        print(f"  - {change.kind:<8} {change.ref_id:<32} {change.size / 1024:>12.1f} KiB  ({reason})")
+    if result.rewritten_objects:
+        print(f"\nObjects rewritten to merged components: {result.rewritten_objects}")
+
+    print()
+    saved = f"{result.input_size / 1024:.1f} KiB -> {result.output_size / 1024:.1f} KiB " \
+            f"({result.saved / 1024:.1f} KiB saved)"
+    if result.output_path is None:
+        base.print_status(f"Dry run: {saved}")
+    else:
+        base.print_success(f"Wrote {result.output_path}: {saved}")
+
+
+def handle_compact_command(args, base: BaseScript) -> int:
+    """Handle assets compact subcommand"""
+    if not args.output and not args.dry_run:
+        base.print_error("No output file given (use --dry-run to only show the changes)")
+        return 1
+
+    output = None if args.dry_run else Path(args.output)
+    try:
+        result = compact_zko(Path(args.file), output, prune=not args.no_prune, deduplicate=not args.no_dedupe)
+        if output is not None:
+            with ZkoReader(output) as reader:
+                issues = reader.inspect().issues
+        else:
+            issues = []
+    except OSError as e:
+        base.print_error(f"Cannot compact {args.file}: {e}")
+        return 1
+    except ZkoFormatError as e:
+        base.print_error(f"{args.file}: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(dict(asdict(result), saved=result.saved), indent=2))
+    else:
+        show_compaction_result(base, result)
+    for issue in issues:
+        where = f" at byte {issue.offset}" if issue.offset is not None else ""
+        base.print_error(f"{result.output_path}: {issue.message}{where}")
+    return 1 if issues else 0
+
+
+def handle_assets_command(args, project_root: Path = None) -> int:
+    """
+    Handle assets subcommand
+
+    Args:
+        args: Parsed command line arguments
+        project_root: Root directory of the project
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    base = BaseScript("Zernikalos Assets")
+    if project_root:
+        base.project_root = project_root
+
+    if args.assets_command == 'inspect':
+        return handle_inspect_command(args, base)
+    elif args.assets_command == 'validate':
+        return handle_validate_command(args, base)
+    elif args.assets_command == 'meshes':
+        return handle_meshes_command(args, base)
+    elif args.assets_command == 'report':
+        return handle_report_command(args, base)
+    elif args.assets_command == 'compact':
+        return handle_compact_command(args, base)
+
+    base.print_error("No assets command specified (use: inspect, validate, meshes, report, compact)")
+    return 1
@@ -4,6 +4,7 @@ Main argument parser with subcommands for Zernikalos management
 """
 
 import argparse
+from tools import GRADLE_PROFILES
 from .common_args import add_common_arguments
 
 
@@ -38,11 +39,22 @@ Examples:
   # Info/Status
   python3 zmanager.py status
   python3 zmanager.py info
+  
+  # Assets
+  python3 zmanager.py assets inspect model.zko
+  
+  # Gradle execution profile (ci-cold, local-warm, release)
+  python3 zmanager.py --gradle-profile local-warm publish --maven
         """
     )
     
     # Add common arguments
     add_common_arguments(parser)
+    parser.add_argument('--gradle-profile', choices=list(GRADLE_PROFILES),
+                       help='Gradle execution profile applied to every Gradle call '
+                            '(default: $ZMANAGER_GRADLE_PROFILE or "default")')
+    parser.add_argument('--trace', metavar='FILE',
+                       help='Write a Chrome trace-event JSON file with timings of every step and subprocess')
     
     # Create subparsers
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -50,6 +62,7 @@ Examples:
     # Import argument functions from handlers
     from .version_cli import add_version_arguments, add_release_arguments
     from .publisher_cli import add_publish_arguments, add_status_arguments, add_info_arguments
+    from .assets_cli import add_assets_arguments
     
     # Version subcommand
     version_parser = subparsers.add_parser('version', help='Version management commands')
@@ -71,5 +84,9 @@ Examples:
     info_parser = subparsers.add_parser('info', help='Show detailed information about packages and artifacts')
     add_info_arguments(info_parser)
     
+    # Assets subcommand
+    assets_parser = subparsers.add_parser('assets', help='Inspect and check .zko asset files')
+    add_assets_arguments(assets_parser)
+    
     return parser
 
@@ -24,13 +24,25 @@ def add_publish_arguments(parser: argparse.ArgumentParser) -> None:
                              help='Publish NPM packages only')
     publish_group.add_argument('--maven', action='store_true',
                              help='Publish Maven artifacts only')
+    parser.add_argument('--parallel', action='store_true',
+                       help='With --all, publish NPM and Maven concurrently')
+    parser.add_argument('--npm-timeout', type=float, metavar='SECONDS',
+                       help='Timeout for the NPM target when using --parallel')
+    parser.add_argument('--maven-timeout', type=float, metavar='SECONDS',
+                       help='Timeout for the Maven target when using --parallel')
+    parser.add_argument('--npm-all-packages', action='store_true',
+                       help='Publish every non-test npm package in dependency order, not just zernikalos')
+    parser.add_argument('--npm-jobs', type=int, default=4, metavar='N',
+                       help='Maximum npm packages published at once with --npm-all-packages (default: 4)')
     add_common_arguments(parser)
 
 
 def add_status_arguments(parser: argparse.ArgumentParser) -> None:
     """Add status subcommand arguments"""
-    # No arguments needed for status, but function for consistency
-    pass
+    parser.add_argument('--probe-timeout', type=float, default=60.0, metavar='SECONDS',
+                       help='Timeout for each tool probe (default: 60)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached tool availability and probe again')
 
 
 def add_info_arguments(parser: argparse.ArgumentParser) -> None:
@@ -104,6 +116,12 @@ def show_publish_result(base: BaseScript, result: PublishResult) -> None:
                     base.print_error(f"NPM error: {result.details['npm']['error']}")
                 if result.details.get('maven', {}).get('error'):
                     base.print_error(f"Maven error: {result.details['maven']['error']}")
+    
+    if result.target == 'all' and result.details and result.details.get('concurrent'):
+        for target in ('npm', 'maven'):
+            duration = result.details.get(target, {}).get('duration')
+            if duration is not None:
+                base.print_status(f"{target} target took {duration:.1f}s")
 
 
 def show_status_info(base: BaseScript, status: StatusInfo) -> None:
@@ -123,17 +141,25 @@ def show_status_info(base: BaseScript, status: StatusInfo) -> None:
     print(f"  - Android: {'✅' if status.android_build_exists else '❌'} {android_build}")
     
     print(f"\nTools status:")
-    print(f"  - Gradle: {'✅' if status.gradle_available else '❌'} {status.gradle_version or 'Not available'}")
+    print(f"  - Gradle: {'✅' if status.gradle_available else '❌'} {status.gradle_version or 'Not available'}"
+          f"{_format_latency(status, 'gradle')}")
     if status.gradle_available and status.gradlew_path:
         print(f"    Path: {status.gradlew_path}")
     
-    print(f"  - npm: {'✅' if status.npm_available else '❌'} {status.npm_version or 'Not available'}")
+    print(f"  - npm: {'✅' if status.npm_available else '❌'} {status.npm_version or 'Not available'}"
+          f"{_format_latency(status, 'npm')}")
     
     print(f"\nGitHub credentials:")
     print(f"  - User: {'✅' if status.github_user else '❌'} {status.github_user or 'Not set'}")
     print(f"  - Token: {'✅' if status.github_token_set else '❌'} {'Set' if status.github_token_set else 'Not set'}")
 
 
+def _format_latency(status: StatusInfo, tool: str) -> str:
+    """Format a tool probe latency for display"""
+    latency = status.probe_latencies.get(tool)
+    return f" (probe: {latency:.2f}s)" if latency is not None else ""
+
+
 def show_publish_info(base: BaseScript, info: PublishInfo) -> None:
     """Display publish information to user"""
     base.print_header("DETAILED PROJECT INFORMATION")
@@ -143,8 +169,15 @@ def show_publish_info(base: BaseScript, info: PublishInfo) -> None:
     
     # Show NPM package info
     base.print_status("NPM Packages Information:")
-    # The actual info display is handled by the publisher's run() method
-    # when enabled_publications is None
+    if info.npm_packages:
+        for package in info.npm_packages:
+            print(f"  - {package['name']} (v{package['version']}): "
+                  f"{package['files']} files, {package['size'] / 1024:.1f} KiB")
+            internal = [dep for dep in package['dependencies'] if dep.startswith('@zernikalos/')]
+            if internal:
+                print(f"    depends on: {', '.join(internal)}")
+    else:
+        print("  No packages found in build/js/packages/@zernikalos/")
     
     print()  # Add spacing
     
@@ -182,12 +215,19 @@ def handle_publish_command(args, project_root: Path = None) -> int:
     # Execute publish action
     if args.all:
         base.print_header("PUBLISHING ALL ARTIFACTS")
-        result = manager.publish_all(credentials)
+        result = manager.publish_all(
+            credentials,
+            concurrent=args.parallel,
+            npm_timeout=args.npm_timeout,
+            maven_timeout=args.maven_timeout,
+            npm_all_packages=args.npm_all_packages,
+            npm_max_workers=args.npm_jobs
+        )
         show_publish_result(base, result)
         return 0 if result.success else 1
     elif args.npm:
         base.print_header("PUBLISHING NPM PACKAGES")
-        result = manager.publish_npm(credentials)
+        result = manager.publish_npm(credentials, args.npm_all_packages, args.npm_jobs)
         show_publish_result(base, result)
         return 0 if result.success else 1
     elif args.maven:
@@ -200,12 +240,13 @@ def handle_publish_command(args, project_root: Path = None) -> int:
         return 1
 
 
-def handle_status_command(project_root: Path = None) -> int:
+def handle_status_command(project_root: Path = None, args=None) -> int:
     """
     Handle status subcommand
     
     Args:
         project_root: Root directory of the project
+        args: Optional parsed command line arguments
         
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -218,7 +259,9 @@ def handle_status_command(project_root: Path = None) -> int:
         return 1
     
     manager = PublisherManager(project_root)
-    status = manager.get_status()
+    probe_timeout = getattr(args, 'probe_timeout', 60.0) if args else 60.0
+    refresh = getattr(args, 'refresh', False) if args else False
+    status = manager.get_status(probe_timeout=probe_timeout, refresh=refresh)
     
     # Set credentials info if available
     if base.github_user:
@@ -259,19 +302,8 @@ def handle_info_command(args, project_root: Path = None) -> int:
     # Also run the actual info display from publishers
     if credentials:
         try:
-            from publishing.npm_publisher import NpmPublisher
             from publishing.maven_publisher import MavenPublisher
             
-            base.print_status("NPM Packages Information:")
-            npm_publisher = NpmPublisher(
-                project_root=project_root,
-                enabled_publications=None,  # None = show info
-                credentials=credentials
-            )
-            npm_publisher.run()
-            
-            print()  # Add spacing
-            
             base.print_status("Maven Artifacts Information:")
             maven_publisher = MavenPublisher(
                 project_root=project_root,
@@ -5,10 +5,12 @@ Command-line interface for version management commands
 
 import argparse
 from pathlib import Path
+from typing import Optional
 from common import BaseScript, validate_version
 from versioning import VersionManager
 from versioning.types import VersionInfo
 from tools import VersionBump
+from workflow import build_release_workflow, format_result
 
 
 def add_version_arguments(parser: argparse.ArgumentParser) -> None:
@@ -21,6 +23,12 @@ def add_version_arguments(parser: argparse.ArgumentParser) -> None:
                        help='Create local release without pushing to remote')
     parser.add_argument('--show-next', action='store_true',
                        help='Show calculated next version based on Conventional Commits')
+    parser.add_argument('--batched', action='store_true',
+                       help='Run all Gradle release steps in a single Gradle invocation')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume an interrupted release of VERSION, skipping steps already completed')
+    parser.add_argument('--gradle-version-files', action='store_true',
+                       help="Generate version files with Gradle's updateVersion task instead of natively")
 
 
 def add_release_arguments(parser: argparse.ArgumentParser) -> None:
@@ -34,6 +42,18 @@ def add_release_arguments(parser: argparse.ArgumentParser) -> None:
     add_common_arguments(parser)
     parser.add_argument('--no-publish', action='store_true',
                        help='Only create version, do not publish')
+    parser.add_argument('--parallel-publish', action='store_true',
+                       help='Publish NPM and Maven artifacts concurrently')
+    parser.add_argument('--batched', action='store_true',
+                       help='Run all Gradle release steps in a single Gradle invocation')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume an interrupted release of VERSION, skipping steps already completed')
+    parser.add_argument('--gradle-version-files', action='store_true',
+                       help="Generate version files with Gradle's updateVersion task instead of natively")
+    parser.add_argument('--workflow', action='store_true',
+                       help='Run release, push and publish steps as a dependency graph, in parallel where possible')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Print the workflow plan (stages, estimated critical path) without running it')
 
 
 def confirm_release(base: BaseScript, current_version: str, new_version: str, no_push: bool) -> bool:
@@ -132,6 +152,61 @@ def show_next_version_info(base: BaseScript, version_info: VersionInfo) -> None:
     print(f"  npm:   {version_info.npm_version}")
 
 
+def validate_release_or_resume(base: BaseScript, manager: VersionManager, version: str, resume: bool) -> bool:
+    """
+    Validate prerequisites for a new release, or that an interrupted one can be resumed
+    
+    A resumed release leaves a dirty working tree (and possibly the release tag)
+    behind, so the usual clean-tree and tag checks do not apply to it.
+    """
+    if resume:
+        if not manager.has_resumable_release(version):
+            base.print_error(f"No interrupted release of v{version} to resume (build/release-state.json)")
+            interrupted = manager.resumable_version()
+            if interrupted:
+                base.print_status(f"The interrupted release is v{interrupted}: rerun with '{interrupted} --resume'")
+            return False
+        base.print_status(f"Resuming interrupted release of v{version}")
+        return True
+    
+    validation = manager.validate_release(version)
+    if not validation.is_valid:
+        if validation.error_message:
+            base.print_error(validation.error_message)
+        return False
+    return True
+
+
+def resumed_release_version(base: BaseScript, manager: VersionManager) -> Optional[str]:
+    """
+    Get the version to resume for --auto --resume
+    
+    Recalculating the version would be wrong here: the interrupted release has
+    already changed VERSION.txt and possibly created the tag it bumps from, so
+    the version comes from the checkpoint journal instead.
+    """
+    version = manager.resumable_version()
+    if not version:
+        base.print_error("No interrupted release to resume (build/release-state.json)")
+        return None
+    base.print_status(f"Version of the interrupted release: {version}")
+    return version
+
+
+def show_release_steps(base: BaseScript, release_result, version: str) -> None:
+    """Show progress for each completed release step"""
+    for step in release_result.steps_completed:
+        prefix = "↷ (checkpoint)" if step in release_result.steps_skipped else "✓"
+        if step == "set_version":
+            base.print_status(f"{prefix} Set version to {version}")
+        elif step == "upgrade_kotlin_package_lock":
+            base.print_status(f"{prefix} Upgraded Kotlin package lock")
+        elif step == "update_version":
+            base.print_status(f"{prefix} Generated version-dependent files")
+        elif step == "release_commit":
+            base.print_status(f"{prefix} Created release commit and tag")
+
+
 def handle_version_command(args, project_root: Path = None) -> int:
     """
     Handle version subcommand
@@ -147,8 +222,12 @@ def handle_version_command(args, project_root: Path = None) -> int:
     if project_root:
         base.project_root = project_root
     
-    manager = VersionManager(project_root)
-    
+    with VersionManager(project_root, native_version_files=not args.gradle_version_files) as manager:
+        return run_version_command(base, manager, args)
+
+
+def run_version_command(base: BaseScript, manager: VersionManager, args) -> int:
+    """Run the version subcommand with an open VersionManager"""
     # Handle --show-next flag
     if args.show_next:
         version_info = manager.calculate_next_version()
@@ -160,9 +239,13 @@ def handle_version_command(args, project_root: Path = None) -> int:
         return 0
     
     # Determine version (either from --auto or explicit version)
-    if args.auto:
-        # Calculate version automatically
-        version_info = manager.calculate_next_version()
+    if args.auto and args.resume:
+        version = resumed_release_version(base, manager)
+        if not version:
+            return 1
+    elif args.auto:
+        # Calculate version automatically (only the version is needed, not the commit list)
+        version_info = manager.calculate_next_version(collect_commits=False)
         if not version_info:
             base.print_error("Failed to calculate next version")
             return 1
@@ -181,10 +264,7 @@ def handle_version_command(args, project_root: Path = None) -> int:
         version = args.version
     
     # Validate and check prerequisites
-    validation = manager.validate_release(version)
-    if not validation.is_valid:
-        if validation.error_message:
-            base.print_error(validation.error_message)
+    if not validate_release_or_resume(base, manager, version, args.resume):
         return 1
     
     # Get current version for confirmation
@@ -200,26 +280,20 @@ def handle_version_command(args, project_root: Path = None) -> int:
     
     # Execute release
     base.print_status(f"Starting release process for version {version}...")
-    release_result = manager.execute_release(version)
+    release_result = manager.execute_release(version, batched=args.batched, resume=args.resume)
     
     if not release_result.success:
         base.print_error(f"Release failed: {release_result.error_message}")
         if release_result.steps_completed:
             base.print_status(f"Completed steps: {', '.join(release_result.steps_completed)}")
+        base.print_status(f"Fix the problem and rerun with '{version} --resume' to continue from the failed step")
         return 1
     
-    # Show progress for each step
-    for step in release_result.steps_completed:
-        if step == "set_version":
-            base.print_status(f"✓ Set version to {version}")
-        elif step == "upgrade_kotlin_package_lock":
-            base.print_status("✓ Upgraded Kotlin package lock")
-        elif step == "update_version":
-            base.print_status("✓ Generated version-dependent files")
-        elif step == "release_commit":
-            base.print_status("✓ Created release commit and tag")
+    show_release_steps(base, release_result, version)
     
     base.print_success("Release files generated successfully!")
+    if release_result.gradle_profile and release_result.gradle_profile != 'default':
+        base.print_status(f"Gradle profile: {release_result.gradle_profile}")
     
     # Push changes (if not --no-push)
     if not args.no_push:
@@ -228,12 +302,15 @@ def handle_version_command(args, project_root: Path = None) -> int:
         
         if not push_result.success:
             base.print_error(f"Failed to push: {push_result.error_message}")
+            base.print_status(f"Rerun with '{version} --resume' to retry the push without repeating the release steps")
             return 1
         
+        manager.finish_release()
         base.print_success("Changes pushed successfully!")
         base.print_success(f"CI/CD pipeline will now build and publish version {version}")
         show_next_steps(base, version)
     else:
+        manager.finish_release()
         show_local_release_info(base, version)
     
     return 0
@@ -248,28 +325,34 @@ def handle_release_command(args, project_root: Path = None) -> int:
     if not base.check_directory():
         return 1
     
-    manager = VersionManager(project_root)
+    if args.workflow:
+        # The workflow schedules the Gradle steps and both publishes itself
+        ignored = [flag for flag, used in (("--batched", args.batched),
+                                           ("--parallel-publish", args.parallel_publish)) if used]
+        if ignored:
+            base.print_error(f"{' and '.join(ignored)} cannot be combined with --workflow "
+                             "(the workflow already runs independent steps concurrently)")
+            return 1
     
+    with VersionManager(project_root, native_version_files=not args.gradle_version_files) as manager:
+        return run_release_command(base, manager, args)
+
+
+def run_release_command(base: BaseScript, manager: VersionManager, args) -> int:
+    """Run the release subcommand with an open VersionManager"""
     # Determine version
-    if args.auto:
-        # Calculate version automatically
-        version_info = manager.calculate_next_version()
+    if args.auto and args.resume:
+        version = resumed_release_version(base, manager)
+        if not version:
+            return 1
+    elif args.auto:
+        # Calculate version automatically (only the version is needed, not the commit list)
+        version_info = manager.calculate_next_version(collect_commits=False)
         if not version_info:
             base.print_error("Failed to calculate next version")
             return 1
         version = version_info.next_version
         base.print_status(f"Auto-calculated version: {version}")
-        
-        # Get current version for confirmation
-        current_version = manager.get_current_version()
-        if not current_version:
-            base.print_error("Could not read VERSION.txt")
-            return 1
-        
-        # Confirm with user (using CLI helper)
-        if not confirm_release(base, current_version, version, False):
-            base.print_error("Release cancelled")
-            return 1
     else:
         if not args.version:
             base.print_error("version is required unless --auto is used")
@@ -280,47 +363,51 @@ def handle_release_command(args, project_root: Path = None) -> int:
             return 1
         
         version = args.version
-        
-        # Get current version for confirmation
-        current_version = manager.get_current_version()
-        if not current_version:
-            base.print_error("Could not read VERSION.txt")
-            return 1
-        
-        # Confirm with user
-        if not confirm_release(base, current_version, version, False):
-            base.print_error("Release cancelled")
-            return 1
+    
+    # Show the workflow plan without touching anything
+    if args.dry_run:
+        skip_steps = manager.completed_release_steps(version) if args.resume else []
+        workflow = build_release_workflow(manager, version, push=True,
+                                          publish=not args.no_publish, skip_steps=skip_steps)
+        base.print_header(f"RELEASE PLAN v{version}")
+        for line in format_result(workflow.plan()):
+            print(line)
+        return 0
+    
+    # Get current version for confirmation
+    current_version = manager.get_current_version()
+    if not current_version:
+        base.print_error("Could not read VERSION.txt")
+        return 1
+    
+    # Confirm with user (using CLI helper)
+    if not confirm_release(base, current_version, version, False):
+        base.print_error("Release cancelled")
+        return 1
     
     # Validate and check prerequisites
-    validation = manager.validate_release(version)
-    if not validation.is_valid:
-        if validation.error_message:
-            base.print_error(validation.error_message)
+    if not validate_release_or_resume(base, manager, version, args.resume):
         return 1
     
+    if args.workflow:
+        return run_release_workflow(base, manager, version, args)
+    
     # Execute version release
     base.print_status(f"Starting release process for version {version}...")
-    release_result = manager.execute_release(version)
+    release_result = manager.execute_release(version, batched=args.batched, resume=args.resume)
     
     if not release_result.success:
         base.print_error(f"Release failed: {release_result.error_message}")
         if release_result.steps_completed:
             base.print_status(f"Completed steps: {', '.join(release_result.steps_completed)}")
+        base.print_status(f"Fix the problem and rerun with '{version} --resume' to continue from the failed step")
         return 1
     
-    # Show progress for each step
-    for step in release_result.steps_completed:
-        if step == "set_version":
-            base.print_status(f"✓ Set version to {version}")
-        elif step == "upgrade_kotlin_package_lock":
-            base.print_status("✓ Upgraded Kotlin package lock")
-        elif step == "update_version":
-            base.print_status("✓ Generated version-dependent files")
-        elif step == "release_commit":
-            base.print_status("✓ Created release commit and tag")
+    show_release_steps(base, release_result, version)
     
     base.print_success("Release files generated successfully!")
+    if release_result.gradle_profile and release_result.gradle_profile != 'default':
+        base.print_status(f"Gradle profile: {release_result.gradle_profile}")
     
     # Push changes
     base.print_status("Pushing changes to remote repository...")
@@ -328,8 +415,10 @@ def handle_release_command(args, project_root: Path = None) -> int:
     
     if not push_result.success:
         base.print_error(f"Failed to push: {push_result.error_message}")
+        base.print_status(f"Rerun with '{version} --resume' to retry the push without repeating the release steps")
         return 1
     
+    manager.finish_release()
     base.print_success("Changes pushed successfully!")
     base.print_success(f"CI/CD pipeline will now build and publish version {version}")
     
@@ -344,10 +433,52 @@ def handle_release_command(args, project_root: Path = None) -> int:
         else:
             base.print_status("Publishing artifacts...")
             publisher_manager = PublisherManager(base.project_root)
-            result = publisher_manager.publish_all(credentials)
+            result = publisher_manager.publish_all(credentials, concurrent=args.parallel_publish)
             if not result.success:
                 base.print_warning("Some artifacts failed to publish")
     
     show_next_steps(base, version)
     return 0
 
+
+def run_release_workflow(base: BaseScript, manager: VersionManager, version: str, args) -> int:
+    """
+    Run the release as a dependency graph (--workflow)
+    
+    Independent steps run concurrently, e.g. the push runs while the JS bundle
+    is built. Per-step timing and the critical path are shown at the end.
+    """
+    credentials = None
+    if not args.no_publish:
+        from cli.publisher_cli import get_credentials_from_args
+        
+        # Ask for credentials up front rather than in the middle of parallel steps
+        credentials = get_credentials_from_args(args, base)
+        if not credentials:
+            base.print_warning("Skipping publish due to missing credentials")
+    
+    skip_steps = manager.start_release(version, resume=args.resume)
+    workflow = build_release_workflow(manager, version, credentials=credentials, push=True,
+                                      publish=credentials is not None, skip_steps=skip_steps)
+    
+    base.print_status(f"Starting release workflow for version {version}...")
+    result = workflow.run()
+    
+    print()
+    base.print_header("RELEASE WORKFLOW SUMMARY")
+    for line in format_result(result):
+        print(line)
+    print()
+    
+    release_ok = all(result.steps[step].status == "success" for step in ("release_commit", "push"))
+    if not release_ok:
+        base.print_error("Release failed")
+        base.print_status(f"Fix the problem and rerun with '{version} --resume' to continue from the failed step")
+        return 1
+    
+    manager.finish_release()
+    if not result.success:
+        base.print_warning("Some artifacts failed to publish")
+    
+    show_next_steps(base, version)
+    return 0
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional, Any, List, Dict
 from dataclasses import dataclass
 from common import BaseScript
+from tools.tracing import span
+from .fingerprint import BuildFingerprint
 
 
 @dataclass
@@ -35,6 +37,8 @@ class BaseBuilder(BaseScript, ABC):
         # Keep None to distinguish between "show info" (None) and "publish nothing" ([])
         self.enabled_publications = enabled_publications
         self.credentials = credentials
+        # Whether run() verifies (and if needed rebuilds) the artifacts; False when the caller already did
+        self.verify_build = True
         # Sync credentials with parent class attributes for compatibility
         if credentials:
             self._sync_credentials_to_attributes()
@@ -178,6 +182,35 @@ class BaseBuilder(BaseScript, ABC):
         self.print_warning(f"Build directory '{build_dir}' does not exist")
         self.print_status("Building automatically...")
     
+    def _build_if_stale(self, target: str, artifacts: List[str], inputs: Optional[List[str]] = None) -> bool:
+        """
+        Rebuild only when the build fingerprint says the artifacts are stale
+        
+        Args:
+            target: Fingerprint target name (e.g., 'npm', 'maven')
+            artifacts: Artifact paths relative to the project root
+            inputs: Extra inputs for this target on top of the common build inputs
+            
+        Returns:
+            True if artifacts are up to date or were rebuilt successfully, False otherwise
+        """
+        fingerprint = BuildFingerprint(self.project_root)
+        with span(f"fingerprint.{target}", "fingerprint") as s:
+            needs_rebuild, reason = fingerprint.needs_rebuild(target, artifacts, inputs)
+            s.set(needs_rebuild=needs_rebuild, reason=reason)
+        
+        if not needs_rebuild:
+            self.print_status(f"Skipping build: {reason}")
+            return True
+        
+        self.print_warning(f"Rebuild required: {reason}")
+        self.print_status("Building automatically...")
+        if not self.build():
+            return False
+        
+        fingerprint.record(target, artifacts, inputs)
+        return True
+    
     @abstractmethod
     def _publish_publication(self, pub_id: str) -> bool:
         """
@@ -261,15 +294,15 @@ class BaseBuilder(BaseScript, ABC):
             return 1
         
         # Check required tool (npm/gradle)
-        if not self._check_tool():
+        if not self._run_phase("check_tool", self._check_tool):
             return 1
         
         # Setup authentication
-        if not self.authentication():
+        if not self._run_phase("authentication", self.authentication):
             return 1
         
         # Verify build (may trigger auto-build)
-        if not self.build_verify():
+        if self.verify_build and not self._run_phase("build_verify", self.build_verify):
             return 1
         
         # Determine action based on enabled_publications
@@ -279,5 +312,12 @@ class BaseBuilder(BaseScript, ABC):
         elif not self.enabled_publications:
             return 0
         else:
-            return 0 if self.publish() else 1
+            return 0 if self._run_phase("publish", self.publish) else 1
+    
+    def _run_phase(self, phase: str, func) -> bool:
+        """Run a phase of the publishing flow inside a tracing span"""
+        with span(f"{type(self).__name__}.{phase}") as s:
+            success = func()
+            s.set(success=success)
+            return success
 
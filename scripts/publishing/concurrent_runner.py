@@ -0,0 +1,192 @@
+"""
+Concurrent Runner
+Runs independent publish targets in parallel with per-target output buffers
+"""
+
+import io
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Any
+
+
+# Seconds to wait for timed out targets to wind down before stdout is restored
+TIMEOUT_GRACE = 10.0
+
+
+class ThreadOutputRouter(io.TextIOBase):
+    """
+    Text stream that routes writes to a per-thread buffer
+
+    Threads registered with the router write into their own buffer; any other
+    thread (e.g. the main thread) writes straight through to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+        self._buffers: Dict[int, io.StringIO] = {}
+        self._lock = threading.Lock()
+
+    def register(self, buffer: io.StringIO) -> None:
+        """Route writes from the calling thread into buffer"""
+        with self._lock:
+            self._buffers[threading.get_ident()] = buffer
+
+    def unregister(self) -> None:
+        """Stop routing writes from the calling thread"""
+        with self._lock:
+            self._buffers.pop(threading.get_ident(), None)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            buffer = self._buffers.get(threading.get_ident())
+        if buffer is not None:
+            return buffer.write(text)
+        return self._stream.write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+@dataclass
+class TargetOutcome:
+    """Outcome of a single concurrently executed target"""
+    name: str
+    result: Any = None
+    output: str = ""
+    duration: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class _TargetState:
+    """Book-keeping for a running target"""
+    name: str
+    buffer: io.StringIO = field(default_factory=io.StringIO)
+    started: float = 0.0
+    deadline: Optional[float] = None
+
+
+def run_concurrently(
+    targets: Dict[str, Callable[[], Any]],
+    timeouts: Optional[Dict[str, Optional[float]]] = None,
+    echo: bool = True
+) -> Dict[str, TargetOutcome]:
+    """
+    Run several targets at the same time and collect their outcomes
+
+    Each target runs in its own daemon thread with sys.stdout/sys.stderr captured
+    into a private buffer. A target's output is echoed as one contiguous, prefixed
+    block as soon as it finishes, so lines from different targets never interleave.
+    Only Python-level writes are captured: subprocesses must be run with their
+    output captured (as GradleTool and NpmTool do) and print it themselves, since
+    a child writing to the inherited file descriptors bypasses the buffers.
+
+    A target that exceeds its timeout is reported as timed out. The runner cannot
+    stop its thread, so targets must enforce the same timeout on their
+    subprocesses (see the `deadline` of tracing.run). Timed out threads get
+    TIMEOUT_GRACE seconds to return before stdout is restored; a thread still
+    running after that is abandoned (daemon) so it cannot block interpreter shutdown.
+
+    Args:
+        targets: Mapping of target name to a zero-argument callable
+        timeouts: Optional mapping of target name to timeout in seconds (None = no limit)
+        echo: Whether to print each target's buffered output when it finishes
+
+    Returns:
+        Mapping of target name to TargetOutcome, in the same order as targets
+    """
+    timeouts = timeouts or {}
+    completions: "queue.Queue[str]" = queue.Queue()
+    outcomes: Dict[str, TargetOutcome] = {name: TargetOutcome(name=name) for name in targets}
+    states: Dict[str, _TargetState] = {}
+    threads: Dict[str, threading.Thread] = {}
+
+    stdout_router = ThreadOutputRouter(sys.stdout)
+    stderr_router = ThreadOutputRouter(sys.stderr)
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+
+    def worker(name: str, func: Callable[[], Any], state: _TargetState) -> None:
+        stdout_router.register(state.buffer)
+        stderr_router.register(state.buffer)
+        try:
+            outcomes[name].result = func()
+        except Exception as e:
+            outcomes[name].error = str(e)
+        finally:
+            stdout_router.unregister()
+            stderr_router.unregister()
+            completions.put(name)
+
+    sys.stdout, sys.stderr = stdout_router, stderr_router
+    try:
+        for name, func in targets.items():
+            now = time.monotonic()
+            timeout = timeouts.get(name)
+            state = _TargetState(
+                name=name,
+                started=now,
+                deadline=now + timeout if timeout else None
+            )
+            states[name] = state
+            threads[name] = threading.Thread(
+                target=worker,
+                args=(name, func, state),
+                name=f"publish-{name}",
+                daemon=True
+            )
+            threads[name].start()
+
+        pending: List[str] = list(targets)
+        while pending:
+            deadlines = [states[name].deadline for name in pending if states[name].deadline]
+            wait = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            try:
+                finished = completions.get(timeout=wait)
+            except queue.Empty:
+                finished = None
+
+            if finished is not None and finished in pending:
+                _finish(outcomes[finished], states[finished], timed_out=False, echo=echo)
+                pending.remove(finished)
+
+            now = time.monotonic()
+            for name in list(pending):
+                deadline = states[name].deadline
+                if deadline is not None and now >= deadline:
+                    _finish(outcomes[name], states[name], timed_out=True, echo=echo)
+                    pending.remove(name)
+
+        # Keep routing output of timed out targets (killing their subprocesses) away from the terminal
+        grace_end = time.monotonic() + TIMEOUT_GRACE
+        for name, outcome in outcomes.items():
+            if outcome.timed_out:
+                threads[name].join(max(0.0, grace_end - time.monotonic()))
+                outcome.output = states[name].buffer.getvalue()
+    finally:
+        sys.stdout, sys.stderr = original_stdout, original_stderr
+
+    return outcomes
+
+
+def _finish(outcome: TargetOutcome, state: _TargetState, timed_out: bool, echo: bool) -> None:
+    """Record a finished (or timed out) target and echo its buffered output"""
+    outcome.duration = time.monotonic() - state.started
+    outcome.timed_out = timed_out
+    outcome.output = state.buffer.getvalue()
+    if timed_out:
+        outcome.error = f"Timed out after {outcome.duration:.1f}s"
+
+    if echo:
+        # Written from the main thread, so it goes straight to the real stream
+        status = "timed out" if timed_out else "finished"
+        print(f"[{outcome.name}] {status} in {outcome.duration:.1f}s")
+        for line in outcome.output.splitlines():
+            print(f"[{outcome.name}] {line}")
@@ -0,0 +1,126 @@
+"""
+Build Fingerprint
+Content fingerprints of build inputs and artifacts to decide whether a rebuild is needed
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from tools.hashing import DEFAULT_CACHE_PATH, HashingEngine
+
+
+# Sources every build target depends on (relative to the project root)
+BUILD_INPUTS = [
+    "src",
+    "VERSION.txt",
+    "build.gradle.kts",
+    "settings.gradle.kts",
+    "gradle.properties",
+    "gradle/libs.versions.toml",
+]
+
+MANIFEST_PATH = Path("build") / "zmanager" / "fingerprints.json"
+
+
+class BuildFingerprint:
+    """
+    Tracks which inputs produced which artifacts for each build target
+
+    After a successful build, record() stores a digest of the inputs and of the
+    produced artifacts in build/zmanager/fingerprints.json. needs_rebuild()
+    recomputes both: if the inputs changed the artifacts are stale, and if the
+    artifacts changed (or no manifest exists) their provenance is unknown.
+    Either way a rebuild is required; otherwise the build can be skipped.
+    """
+
+    def __init__(self, project_root: Path, manifest_file: Optional[Path] = None):
+        """
+        Initialize fingerprint tracker
+
+        Args:
+            project_root: Root directory of the project
+            manifest_file: Manifest location (default: build/zmanager/fingerprints.json)
+        """
+        self.project_root = project_root
+        self.manifest_file = manifest_file or project_root / MANIFEST_PATH
+        self.hasher = HashingEngine(cache_file=project_root / DEFAULT_CACHE_PATH)
+
+    def hash_paths(self, paths: List[str]) -> str:
+        """
+        Compute one digest over files and directory trees
+
+        Args:
+            paths: Files or directories relative to the project root
+
+        Returns:
+            Hex digest
+        """
+        return self.hasher.hash_tree(paths, self.project_root)
+
+    def needs_rebuild(self, target: str, artifacts: List[str], inputs: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """
+        Decide whether a target must be rebuilt
+
+        Args:
+            target: Target name (e.g., 'npm', 'maven')
+            artifacts: Artifact files or directories produced by the target
+            inputs: Extra inputs for this target on top of BUILD_INPUTS
+
+        Returns:
+            Tuple of (needs_rebuild, human readable reason)
+        """
+        if not any((self.project_root / artifact).exists() for artifact in artifacts):
+            return True, "build artifacts are missing"
+
+        entry = self._load().get(target)
+        if not entry:
+            return True, "no build fingerprint recorded for the current artifacts"
+
+        try:
+            if entry.get("inputs") != self.hash_paths(BUILD_INPUTS + (inputs or [])):
+                return True, "sources changed since the last build"
+
+            if entry.get("artifacts") != self.hash_paths(artifacts):
+                return True, "build artifacts changed since they were fingerprinted"
+        finally:
+            self.hasher.save()
+
+        return False, "build artifacts are up to date"
+
+    def record(self, target: str, artifacts: List[str], inputs: Optional[List[str]] = None) -> None:
+        """
+        Record the fingerprint of a freshly built target
+
+        Args:
+            target: Target name
+            artifacts: Artifact files or directories produced by the target
+            inputs: Extra inputs for this target on top of BUILD_INPUTS
+        """
+        manifest = self._load()
+        manifest[target] = {
+            "inputs": self.hash_paths(BUILD_INPUTS + (inputs or [])),
+            "artifacts": self.hash_paths(artifacts),
+        }
+        self._save(manifest)
+        self.hasher.save()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_file, "r") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save(self, manifest: Dict[str, dict]) -> None:
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.manifest_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_file)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
@@ -8,6 +8,10 @@ from pathlib import Path
 from .base_builder import BaseBuilder, GitHubCredentials
 
 
+# Build outputs produced by `gradlew build` (Android AARs and JVM jars)
+MAVEN_ARTIFACTS = ["build/outputs", "build/libs"]
+
+
 class MavenPublisher(BaseBuilder):
     """Main class for Maven/Android artifact publishing functionality"""
     
@@ -43,12 +47,8 @@ class MavenPublisher(BaseBuilder):
         return self.gradle.build()
     
     def build_verify(self) -> bool:
-        """Verify that build directory exists and artifacts are ready"""
-        build_dir = self.project_root / "build"
-        if not build_dir.exists():
-            self._print_build_auto("build")
-            return self.build()
-        return True
+        """Verify that build artifacts exist and match the current sources, rebuilding otherwise"""
+        return self._build_if_stale("maven", MAVEN_ARTIFACTS)
     
     def _publish_publication(self, pub_id: str) -> bool:
         """
@@ -9,6 +9,11 @@ from common import BaseScript
 from .base_builder import BaseBuilder, GitHubCredentials
 
 
+# Build outputs published by npm and inputs specific to the JS build
+NPM_ARTIFACTS = ["build/js/packages/@zernikalos"]
+NPM_INPUTS = ["webpack.config.d"]
+
+
 class NpmPublisher(BaseBuilder):
     """Main class for NPM package publishing functionality"""
 
@@ -16,7 +21,8 @@ class NpmPublisher(BaseBuilder):
         self, 
         project_root: Path = None,
         enabled_publications: Optional[List[str]] = None,
-        credentials: Optional[GitHubCredentials] = None
+        credentials: Optional[GitHubCredentials] = None,
+        max_workers: int = 4
     ):
         super().__init__(
             "Zernikalos NPM Publisher", 
@@ -25,11 +31,15 @@ class NpmPublisher(BaseBuilder):
         )
         if project_root:
             self.project_root = project_root
+        # Maximum number of packages published at once by the "packages" publication
+        self.max_workers = max_workers
     
     def get_available_publications(self) -> List[Dict[str, str]]:
         """Get list of available publications"""
         return [
-            {"id": "all", "name": "All Packages", "description": "Publish main zernikalos package"}
+            {"id": "all", "name": "All Packages", "description": "Publish main zernikalos package"},
+            {"id": "packages", "name": "Workspace Packages",
+             "description": "Publish every non-test package concurrently, in dependency order"}
         ]
     
     def authentication(self) -> bool:
@@ -49,12 +59,8 @@ class NpmPublisher(BaseBuilder):
         return self.gradle.js_browser_production_webpack()
     
     def build_verify(self) -> bool:
-        """Verify that build directory exists and artifacts are ready"""
-        build_dir = self.project_root / "build" / "js"
-        if not build_dir.exists():
-            self._print_build_auto("build/js")
-            return self.build()
-        return True
+        """Verify that build artifacts exist and match the current sources, rebuilding otherwise"""
+        return self._build_if_stale("npm", NPM_ARTIFACTS, inputs=NPM_INPUTS)
     
     def _publish_publication(self, pub_id: str) -> bool:
         """
@@ -68,6 +74,8 @@ class NpmPublisher(BaseBuilder):
         """
         if pub_id == "all":
             return self._publish_workspace(None)
+        elif pub_id == "packages":
+            return self._publish_packages()
         else:
             self._print_unknown_publication(pub_id)
             return False
@@ -140,12 +148,17 @@ class NpmPublisher(BaseBuilder):
         # Ensure npm has the auth token
         self.npm.set_auth_token(self.github_token)
 
-        # Publish using npm tool
-        success, stdout, stderr = self.npm.publish_workspace(
-            workspace_dir,
-            package_filter=package_filter,
-            show_output=True
-        )
+        # Pack into the tarball cache (reused if this build was packed before), then publish
+        success = True
+        for package_name, version in packages:
+            tarball, error = self.npm.pack_package(workspace_dir / "packages" / "@zernikalos" / package_name)
+            if tarball is None:
+                self.print_error(f"Failed to pack @zernikalos/{package_name}: {error}")
+                success = False
+                continue
+            self.print_status(f"Publishing {tarball.relative_to(self.project_root)}")
+            published, _, _ = self.npm.publish_tarball(tarball, cwd=workspace_dir, show_output=True)
+            success = success and published
 
         if success:
             for package_name, version in packages:
@@ -153,4 +166,41 @@ class NpmPublisher(BaseBuilder):
                 self.print_status(f"    Available at: https://npm.pkg.github.com/@zernikalos/{package_name}")
         
         return success
+    
+    def _publish_packages(self) -> bool:
+        """Publish all non-test packages concurrently, dependencies first"""
+        workspace_dir = self.project_root / "build" / "js"
+
+        if not workspace_dir.exists():
+            self.print_error("Workspace directory 'build/js' not found")
+            return False
+
+        packages = self._list_packages()
+        if not packages:
+            return False
+
+        try:
+            levels = self.npm.dependency_levels(self.npm.get_package_dependencies(names=[name for name, _ in packages]))
+        except ValueError as e:
+            self.print_error(str(e))
+            return False
+
+        self.print_status(f"Publishing {len(packages)} package(s) with up to {self.max_workers} concurrent workers:")
+        for index, level in enumerate(levels, 1):
+            print(f"  {index}. {', '.join(f'@zernikalos/{name}' for name in level)}")
+
+        # Ensure npm has the auth token
+        self.npm.set_auth_token(self.github_token)
+
+        results = self.npm.publish_packages(workspace_dir, packages, max_workers=self.max_workers)
+
+        print()
+        self.print_status("Package results:")
+        for result in results.values():
+            if result.success:
+                print(f"  ✅ @zernikalos/{result.name} v{result.version} "
+                      f"({result.duration:.1f}s, {result.attempts} attempt(s))")
+            else:
+                print(f"  ❌ @zernikalos/{result.name} v{result.version}: {result.error}")
 
+        return all(result.success for result in results.values())
@@ -3,13 +3,18 @@ PublisherManager
 Business logic for publishing all Zernikalos artifacts
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 from .base_builder import GitHubCredentials
 from .npm_publisher import NpmPublisher
 from .maven_publisher import MavenPublisher
+from .concurrent_runner import run_concurrently
 from .types import PublishResult, StatusInfo, PublishInfo
 from tools import GradleTool, NpmTool
+from tools.tracing import traced
 
 
 class PublisherManager:
@@ -26,12 +31,27 @@ class PublisherManager:
         self.gradle = GradleTool(self.project_root)
         self.npm = NpmTool(self.project_root)
         
-    def publish_npm(self, credentials: GitHubCredentials) -> PublishResult:
+    @traced("publish.publish_npm")
+    def publish_npm(
+        self,
+        credentials: GitHubCredentials,
+        all_packages: bool = False,
+        max_workers: int = 4,
+        deadline: Optional[float] = None,
+        verify_build: bool = True
+    ) -> PublishResult:
         """
         Publish NPM packages
         
         Args:
             credentials: GitHub credentials for authentication
+            all_packages: Publish every non-test package in dependency order instead of
+                          only the main zernikalos package
+            max_workers: Maximum number of packages published at once (with all_packages)
+            deadline: Optional time.monotonic() deadline; npm and Gradle processes
+                      still running when it passes are killed
+            verify_build: Verify (and if stale, rebuild) the webpack bundles first;
+                          False when verify_npm_build() already did
             
         Returns:
             PublishResult with success status and details
@@ -48,9 +68,12 @@ class PublisherManager:
         try:
             publisher = NpmPublisher(
                 project_root=self.project_root,
-                enabled_publications=["all"],
-                credentials=credentials
+                enabled_publications=["packages" if all_packages else "all"],
+                credentials=credentials,
+                max_workers=max_workers
             )
+            publisher.npm.deadline = publisher.gradle.deadline = deadline
+            publisher.verify_build = verify_build
             
             exit_code = publisher.run()
             success = exit_code == 0
@@ -59,7 +82,11 @@ class PublisherManager:
                 success=success,
                 target='npm',
                 error_message=None if success else "NPM publish failed",
-                details={"exit_code": exit_code, "npm_version": npm_version}
+                details={
+                    "exit_code": exit_code,
+                    "npm_version": npm_version,
+                    "gradle_profile": publisher.gradle.profile.name
+                }
             )
                 
         except Exception as e:
@@ -69,12 +96,25 @@ class PublisherManager:
                 error_message=f"Failed to publish NPM packages: {e}"
             )
             
-    def publish_maven(self, credentials: GitHubCredentials) -> PublishResult:
+    @traced("publish.verify_npm_build")
+    def verify_npm_build(self) -> bool:
+        """
+        Verify the npm build artifacts, rebuilding them with Gradle when stale
+        
+        Returns:
+            True if the artifacts are up to date or were rebuilt successfully
+        """
+        return NpmPublisher(project_root=self.project_root).build_verify()
+    
+    @traced("publish.publish_maven")
+    def publish_maven(self, credentials: GitHubCredentials, deadline: Optional[float] = None) -> PublishResult:
         """
         Publish Maven artifacts
         
         Args:
             credentials: GitHub credentials for authentication
+            deadline: Optional time.monotonic() deadline; Gradle processes still
+                      running when it passes are killed
             
         Returns:
             PublishResult with success status and details
@@ -94,6 +134,7 @@ class PublisherManager:
                 enabled_publications=["all_publications"],
                 credentials=credentials
             )
+            publisher.gradle.deadline = deadline
             
             exit_code = publisher.run()
             success = exit_code == 0
@@ -102,7 +143,7 @@ class PublisherManager:
                 success=success,
                 target='maven',
                 error_message=None if success else "Maven publish failed",
-                details={"exit_code": exit_code}
+                details={"exit_code": exit_code, "gradle_profile": publisher.gradle.profile.name}
             )
                 
         except Exception as e:
@@ -112,41 +153,140 @@ class PublisherManager:
                 error_message=f"Failed to publish Maven artifacts: {e}"
             )
     
-    def publish_all(self, credentials: GitHubCredentials) -> PublishResult:
+    @traced("publish.publish_all")
+    def publish_all(
+        self,
+        credentials: GitHubCredentials,
+        concurrent: bool = False,
+        npm_timeout: Optional[float] = None,
+        maven_timeout: Optional[float] = None,
+        npm_all_packages: bool = False,
+        npm_max_workers: int = 4
+    ) -> PublishResult:
         """
         Publish all artifacts (NPM + Maven)
         
         Args:
             credentials: GitHub credentials for authentication
+            concurrent: Publish NPM and Maven at the same time instead of one after the other
+            npm_timeout: Optional timeout in seconds for the NPM target (concurrent mode only)
+            maven_timeout: Optional timeout in seconds for the Maven target (concurrent mode only)
+            npm_all_packages: Publish every non-test npm package, see publish_npm()
+            npm_max_workers: Maximum number of npm packages published at once
             
         Returns:
             PublishResult with success status and details for both targets
         """
-        npm_result = self.publish_npm(credentials)
+        publish_npm = partial(self.publish_npm, credentials, npm_all_packages, npm_max_workers)
+        if concurrent:
+            return self._publish_all_concurrent(credentials, publish_npm, npm_timeout, maven_timeout)
+        
+        npm_result = publish_npm()
         maven_result = self.publish_maven(credentials)
         
+        return self._combine_results(npm_result, maven_result)
+    
+    def _publish_all_concurrent(
+        self,
+        credentials: GitHubCredentials,
+        publish_npm: Callable[..., PublishResult],
+        npm_timeout: Optional[float],
+        maven_timeout: Optional[float]
+    ) -> PublishResult:
+        """
+        Publish NPM and Maven targets concurrently
+        
+        The npm webpack build runs Gradle on the same project as the Maven
+        publish, and Gradle builds of one project serialize on its build lock,
+        so the npm artifacts are verified (and rebuilt if stale) before the
+        concurrent section; only the Maven target runs Gradle concurrently with
+        npm publishing.
+        
+        Each target's console output is buffered and printed as a single block
+        once it finishes. A timeout is also the deadline of the target's npm and
+        Gradle processes, so a timed out target cannot keep publishing.
+        """
+        npm_built = self.verify_npm_build()
+        
+        start = time.monotonic()
+        deadlines = {target: start + timeout if timeout else None
+                     for target, timeout in (('npm', npm_timeout), ('maven', maven_timeout))}
+        
+        def npm_target() -> PublishResult:
+            if not npm_built:
+                return PublishResult(success=False, target='npm', error_message="NPM build failed")
+            return publish_npm(deadline=deadlines['npm'], verify_build=False)
+        
+        outcomes = run_concurrently(
+            {
+                'npm': npm_target,
+                'maven': lambda: self.publish_maven(credentials, deadline=deadlines['maven']),
+            },
+            timeouts={'npm': npm_timeout, 'maven': maven_timeout}
+        )
+        
+        results = {}
+        for target, outcome in outcomes.items():
+            if isinstance(outcome.result, PublishResult) and not outcome.timed_out:
+                result = outcome.result
+            else:
+                result = PublishResult(
+                    success=False,
+                    target=target,
+                    error_message=outcome.error or f"{target} publish did not return a result"
+                )
+            result.details = dict(result.details or {})
+            result.details["duration"] = round(outcome.duration, 3)
+            result.details["timed_out"] = outcome.timed_out
+            results[target] = result
+        
+        return self._combine_results(results['npm'], results['maven'], concurrent=True)
+    
+    def _combine_results(
+        self,
+        npm_result: PublishResult,
+        maven_result: PublishResult,
+        concurrent: bool = False
+    ) -> PublishResult:
+        """Combine per-target results into a single 'all' PublishResult"""
         overall_success = npm_result.success and maven_result.success
         
+        details = {
+            "npm": {
+                "success": npm_result.success,
+                "error": npm_result.error_message
+            },
+            "maven": {
+                "success": maven_result.success,
+                "error": maven_result.error_message
+            }
+        }
+        if concurrent:
+            details["concurrent"] = True
+            for target, result in (("npm", npm_result), ("maven", maven_result)):
+                details[target]["duration"] = result.details.get("duration")
+                details[target]["timed_out"] = result.details.get("timed_out", False)
+        
         return PublishResult(
             success=overall_success,
             target='all',
             error_message=None if overall_success else "Some artifacts failed to publish",
-            details={
-                "npm": {
-                    "success": npm_result.success,
-                    "error": npm_result.error_message
-                },
-                "maven": {
-                    "success": maven_result.success,
-                    "error": maven_result.error_message
-                }
-            }
+            details=details
         )
         
-    def get_status(self) -> StatusInfo:
+    @traced("publish.get_status")
+    def get_status(self, probe_timeout: Optional[float] = 60.0, refresh: bool = False) -> StatusInfo:
         """
         Get current project status
         
+        Tool probes (e.g. `./gradlew --version`, which may start a cold JVM) run
+        concurrently, so the status takes as long as the slowest probe rather
+        than the sum of all of them.
+        
+        Args:
+            probe_timeout: Timeout in seconds for each tool probe (None = no limit)
+            refresh: Ignore cached tool availability and probe again
+        
         Returns:
             StatusInfo with project status details
         """
@@ -165,12 +305,17 @@ class PublisherManager:
         android_build = self.project_root / "build"
         
         # Check tools status
-        gradle_available, gradle_version = self.gradle.check_available()
+        probes = self._probe_tools({
+            'gradle': lambda: self.gradle.check_available(timeout=probe_timeout, use_cache=not refresh),
+            'npm': lambda: self.npm.check_available(timeout=probe_timeout, use_cache=not refresh),
+        })
+        
+        (gradle_available, gradle_version), _ = probes['gradle']
         gradlew_path = None
         if gradle_available:
             gradlew_path = str(self.gradle.gradlew_path)
         
-        npm_available, npm_version = self.npm.check_available()
+        (npm_available, npm_version), _ = probes['npm']
         
         return StatusInfo(
             version=version,
@@ -183,9 +328,36 @@ class PublisherManager:
             npm_available=npm_available,
             npm_version=npm_version,
             github_user=None,  # Not available in manager, set by CLI
-            github_token_set=False  # Not available in manager, set by CLI
+            github_token_set=False,  # Not available in manager, set by CLI
+            probe_latencies={tool: round(latency, 3) for tool, (_, latency) in probes.items()}
         )
     
+    def _probe_tools(
+        self,
+        probes: Dict[str, Callable[[], Tuple[bool, Optional[str]]]]
+    ) -> Dict[str, Tuple[Tuple[bool, Optional[str]], float]]:
+        """
+        Run tool availability probes concurrently
+        
+        Args:
+            probes: Mapping of tool name to a check_available-style callable
+            
+        Returns:
+            Mapping of tool name to ((is_available, version_info), latency_seconds)
+        """
+        def timed(probe: Callable[[], Tuple[bool, Optional[str]]]) -> Tuple[Tuple[bool, Optional[str]], float]:
+            start = time.monotonic()
+            try:
+                result = probe()
+            except Exception as e:
+                result = (False, str(e))
+            return result, time.monotonic() - start
+        
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {tool: executor.submit(timed, probe) for tool, probe in probes.items()}
+            return {tool: future.result() for tool, future in futures.items()}
+    
+    @traced("publish.get_info")
     def get_info(self, credentials: Optional[GitHubCredentials] = None) -> PublishInfo:
         """
         Get detailed information about available packages and artifacts
@@ -200,18 +372,18 @@ class PublisherManager:
         maven_artifacts = []
         error_message = None
         
-        # Get NPM package info
+        # Get NPM package info from the package index (no build or credentials needed)
         try:
-            if credentials:
-                npm_publisher = NpmPublisher(
-                    project_root=self.project_root,
-                    enabled_publications=None,  # None = show info
-                    credentials=credentials
-                )
-                # The run() method with enabled_publications=None will show info
-                # We need to extract this info, but for now we'll just note it was attempted
-                npm_publisher.run()
-                # TODO: Extract actual package info from publisher if needed
+            for entry in self.npm.get_package_index().packages():
+                file_count, total_size = entry.file_stats()
+                npm_packages.append({
+                    "name": entry.package_name,
+                    "version": entry.version,
+                    "dependencies": sorted(entry.dependencies),
+                    "files": file_count,
+                    "size": total_size,
+                    "path": str(entry.path)
+                })
         except Exception as e:
             error_message = f"Could not get NPM info: {e}"
             
@@ -3,7 +3,7 @@ Publishing Types
 Data classes for structured results from publishing operations
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
@@ -31,12 +31,15 @@ class StatusInfo:
     npm_version: Optional[str] = None
     github_user: Optional[str] = None
     github_token_set: bool = False
+    # Seconds each tool probe took, keyed by tool name ('gradle', 'npm')
+    probe_latencies: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
 class PublishInfo:
     """Detailed information about packages and artifacts"""
-    npm_packages: List[Dict[str, str]] = None
+    # name, version, dependencies, files, size (bytes) and path of each non-test package
+    npm_packages: List[Dict[str, Any]] = None
     maven_artifacts: List[Dict[str, str]] = None
     error_message: Optional[str] = None
 
@@ -0,0 +1,8 @@
+"""
+Test configuration: make the script packages importable, as zmanager.py does
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,43 @@
+"""
+Tests for the Conventional Commits classifier
+"""
+
+import pytest
+
+from tools.conventional_commits import CommitClassifier, VersionBump
+
+
+# Messages and the bump they must produce under the historical per-rule checks
+CLASSIFICATION_CASES = [
+    ("feat: add mesh loader", VersionBump.MINOR),
+    ("FEAT(loader): add mesh loader", VersionBump.MINOR),
+    ("fix: handle empty buffers", VersionBump.PATCH),
+    ("fix(gl): handle empty buffers", VersionBump.PATCH),
+    ("feat!: drop WebGL 1", VersionBump.MAJOR),
+    ("feat(gl)!: drop WebGL 1", VersionBump.MAJOR),
+    ("fix!: change default wrap mode", None),
+    ("chore: bump deps\n\nfeat!: listed in body", VersionBump.MAJOR),
+    ("fix: rename field\n\nBREAKING CHANGE: refId is now id", VersionBump.MAJOR),
+    ("docs: note breaking change in the changelog", VersionBump.MAJOR),
+    # BREAKING CHANGE inside a header scope must not hide the marker
+    ("FIX(BREAKING CHANGE): rename field", VersionBump.MAJOR),
+    ("fix(x breaking change)!", VersionBump.MAJOR),
+    ("feat(BREAKING CHANGE)!: rename field", VersionBump.MAJOR),
+    # An unclosed scope must not swallow a header on a later line
+    ("chore(deps: bump x\n\nfeat(api)!: drop legacy loader", VersionBump.MAJOR),
+    ("chore: update README", None),
+    ("Merge branch 'main'", None),
+    ("", None),
+]
+
+
+@pytest.mark.parametrize("message,expected", CLASSIFICATION_CASES)
+def test_classify_bump(message, expected):
+    assert CommitClassifier().classify(message).bump == expected
+
+
+def test_classify_header_fields():
+    result = CommitClassifier().classify("Fix(gl): handle empty buffers")
+    assert result.type == "fix"
+    assert result.scope == "gl"
+    assert not result.breaking
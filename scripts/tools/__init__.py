@@ -3,10 +3,12 @@ Zernikalos Tools Package
 Reusable tools for Git, Gradle, NPM operations, and Conventional Commits
 """
 
-from .git import GitTool
-from .gradle import GradleTool
-from .npm import NpmTool
-from .conventional_commits import ConventionalCommitsTool, VersionBump
+from .git import GitTool, RefPushStatus, RemotePushResult
+from .gradle import GradleTool, GradleProfile, GRADLE_PROFILES
+from .npm import NpmTool, PackagePublishResult
+from .package_index import PackageIndex, PackageEntry
+from .conventional_commits import ConventionalCommitsTool, VersionBump, CommitClassifier, CommitClassification
 
-__all__ = ['GitTool', 'GradleTool', 'NpmTool', 'ConventionalCommitsTool', 'VersionBump']
+__all__ = ['GitTool', 'RefPushStatus', 'RemotePushResult', 'GradleTool', 'GradleProfile', 'GRADLE_PROFILES', 'NpmTool', 'PackagePublishResult', 'PackageIndex', 'PackageEntry',
+           'ConventionalCommitsTool', 'VersionBump', 'CommitClassifier', 'CommitClassification']
 
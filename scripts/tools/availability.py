@@ -0,0 +1,183 @@
+"""
+Tool Availability Cache
+Process-wide cache of tool availability probes (npm --version, gradlew --version)
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Seconds a probe result stays valid (0 disables caching)
+CACHE_TTL_ENV = "ZMANAGER_TOOL_CACHE_TTL"
+# Set to 1 to persist probe results across processes
+CACHE_PERSIST_ENV = "ZMANAGER_TOOL_CACHE_PERSIST"
+DEFAULT_TTL = 300.0
+
+ProbeResult = Tuple[bool, Optional[str]]
+
+
+def file_fingerprint(path: Optional[Path]) -> str:
+    """
+    Fingerprint a file for cache invalidation
+
+    Args:
+        path: File to fingerprint (None for a missing binary)
+
+    Returns:
+        String combining the resolved path, mtime and size, or a marker if missing
+    """
+    if path is None:
+        return "missing"
+    try:
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+        return f"{resolved}:{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        return f"{path}:missing"
+
+
+def default_cache_file() -> Path:
+    """Location of the persisted cache (shared by all projects; keys hold absolute paths)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "zmanager" / "tool-availability.json"
+
+
+class ToolAvailabilityCache:
+    """
+    Cache of tool availability results keyed by tool and binary fingerprint
+
+    Entries expire after a TTL and are invalidated as soon as the key changes,
+    e.g. when `gradlew` or the `npm` binary is replaced (different mtime).
+    Results are kept in memory and, optionally, in a JSON file so separate
+    zmanager invocations can share them.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, cache_file: Optional[Path] = None):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Seconds a result stays valid (0 disables caching)
+            cache_file: Optional JSON file for persistence across processes
+        """
+        self.ttl = ttl
+        self.cache_file = cache_file
+        self._entries: Dict[str, dict] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get(self, tool: str, key: List[str]) -> Optional[ProbeResult]:
+        """
+        Get a cached probe result
+
+        Args:
+            tool: Tool name (e.g., 'npm', 'gradle')
+            key: Invalidation key (fingerprints of binaries and relevant settings)
+
+        Returns:
+            Cached (is_available, info) or None on miss
+        """
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            self._load()
+            entry = self._entries.get(tool)
+            if not entry or entry.get('key') != list(key):
+                return None
+            if time.time() - entry.get('time', 0) > self.ttl:
+                return None
+            return entry['available'], entry.get('info')
+
+    def put(self, tool: str, key: List[str], result: ProbeResult) -> None:
+        """
+        Store a probe result
+
+        Args:
+            tool: Tool name
+            key: Invalidation key
+            result: (is_available, info) returned by the probe
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._load()
+            self._entries[tool] = {
+                'key': list(key),
+                'time': time.time(),
+                'available': result[0],
+                'info': result[1],
+            }
+            self._save()
+
+    def invalidate(self, tool: Optional[str] = None) -> None:
+        """
+        Drop cached results
+
+        Args:
+            tool: Tool to invalidate, or None for all tools
+        """
+        with self._lock:
+            self._load()
+            if tool is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tool, None)
+            self._save()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries.update({k: v for k, v in data.items() if isinstance(v, dict)})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def _save(self) -> None:
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.cache_file)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # Persistence is best effort; the in-memory cache still works
+            pass
+
+
+def _cache_from_environment() -> ToolAvailabilityCache:
+    try:
+        ttl = float(os.environ.get(CACHE_TTL_ENV, DEFAULT_TTL))
+    except ValueError:
+        ttl = DEFAULT_TTL
+    persist = os.environ.get(CACHE_PERSIST_ENV, "").lower() in ("1", "true", "yes")
+    return ToolAvailabilityCache(ttl=ttl, cache_file=default_cache_file() if persist else None)
+
+
+_cache = _cache_from_environment()
+
+
+def get_availability_cache() -> ToolAvailabilityCache:
+    """
+    Get the process-wide availability cache
+
+    Returns:
+        Shared ToolAvailabilityCache instance
+    """
+    return _cache
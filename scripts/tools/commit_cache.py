@@ -0,0 +1,122 @@
+"""
+Commit Classification Cache
+Persistent, incremental cache of Conventional Commits classifications
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# Bump this whenever the on-disk layout changes; classification rule changes are
+# covered by ConventionalCommitsTool.CLASSIFIER_VERSION, which is also stored in the file
+CACHE_FORMAT_VERSION = 1
+
+# Number of release ranges (one per base tag) kept in the cache file
+MAX_RANGES = 5
+
+# (sha, subject, bump value or None)
+CachedCommit = Tuple[str, str, Optional[str]]
+
+
+class CommitClassificationCache:
+    """
+    On-disk cache of commit classifications for release ranges
+
+    For each base tag the cache stores the sha the tag pointed at, the HEAD that
+    was last analyzed and the ordered list of (sha, subject, bump) entries for
+    `tag..head`. A later run only needs to classify commits newer than the
+    cached head.
+    """
+
+    def __init__(self, cache_file: Path, classifier_version: str = ""):
+        """
+        Initialize cache
+
+        Args:
+            cache_file: JSON file holding the cache
+            classifier_version: Identifier of the classification rules; entries
+                                written with different rules are ignored
+        """
+        self.cache_file = cache_file
+        self.classifier_version = classifier_version
+        self._data: Optional[dict] = None
+
+    def _load(self) -> dict:
+        if self._data is not None:
+            return self._data
+
+        data = None
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        if (not isinstance(data, dict)
+                or data.get('format') != CACHE_FORMAT_VERSION
+                or data.get('classifier') != self.classifier_version
+                or not isinstance(data.get('ranges'), dict)):
+            data = {'format': CACHE_FORMAT_VERSION, 'classifier': self.classifier_version, 'ranges': {}}
+
+        self._data = data
+        return data
+
+    def get_range(self, base_tag: str, base_sha: str) -> Optional[Tuple[str, List[CachedCommit]]]:
+        """
+        Get the cached range for a base tag
+
+        Args:
+            base_tag: Tag the range starts from (e.g., 'v0.6.0')
+            base_sha: Object the tag currently points at; a moved tag invalidates the entry
+
+        Returns:
+            Tuple of (cached_head_sha, commits) or None if nothing valid is cached
+        """
+        entry = self._load()['ranges'].get(base_tag)
+        if not entry or entry.get('base') != base_sha:
+            return None
+        try:
+            commits = [(sha, subject, bump) for sha, subject, bump in entry['commits']]
+            return entry['head'], commits
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def set_range(self, base_tag: str, base_sha: str, head_sha: str, commits: List[CachedCommit]) -> None:
+        """
+        Store the range for a base tag and write the cache to disk
+
+        Args:
+            base_tag: Tag the range starts from
+            base_sha: Object the tag points at
+            head_sha: HEAD commit the range was computed up to
+            commits: Ordered (sha, subject, bump) entries, newest first
+        """
+        ranges = self._load()['ranges']
+        ranges.pop(base_tag, None)
+        ranges[base_tag] = {
+            'base': base_sha,
+            'head': head_sha,
+            'commits': [list(commit) for commit in commits]
+        }
+        # Older release ranges are no longer useful once newer tags exist
+        while len(ranges) > MAX_RANGES:
+            ranges.pop(next(iter(ranges)))
+        self._save()
+
+    def _save(self) -> None:
+        """Write the cache atomically; failures only cost a cache miss next time"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self._data, f)
+                os.replace(tmp_path, self.cache_file)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
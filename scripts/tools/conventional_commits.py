@@ -8,11 +8,13 @@ the next version for both Maven (SNAPSHOT) and npm (next.COMMIT_HASH) formats.
 """
 
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from enum import Enum
 
 from .git import GitTool
+from .commit_cache import CommitClassificationCache, CachedCommit
 
 
 class VersionBump(Enum):
@@ -22,18 +24,150 @@ class VersionBump(Enum):
     PATCH = "patch"
 
 
+@dataclass(frozen=True)
+class CommitClassification:
+    """Result of classifying a single commit message"""
+    type: Optional[str]
+    scope: Optional[str]
+    breaking: bool
+    bump: Optional[VersionBump]
+
+
+class CommitClassifier:
+    """
+    Precompiled Conventional Commits classifier
+    
+    One precompiled pattern matches commit headers (`type(scope)!:`) at line
+    starts; `BREAKING CHANGE` markers are found by a separate search, as they
+    may also appear inside a header's scope. Scopes never span lines, so an
+    unclosed parenthesis cannot swallow a header on a later line.
+    Rules match the historical behaviour of the tool:
+    - MAJOR: `feat!`/`feat(scope)!` at the start of any line, or `BREAKING CHANGE` anywhere
+    - MINOR: message starts with `feat:` or `feat(scope):`
+    - PATCH: message starts with `fix:` or `fix(scope):`
+    All matches are case-insensitive.
+    """
+    
+    _PATTERN = re.compile(
+        r'^(?P<type>[a-z]+)(?:\((?P<scope>[^)\n]+)\))?(?:(?P<bang>!)|:)',
+        re.IGNORECASE | re.MULTILINE
+    )
+    
+    _FOOTER = re.compile(r'BREAKING CHANGE', re.IGNORECASE)
+    
+    # In a body only a real footer token counts, not prose mentioning a breaking change
+    _BODY_FOOTER = re.compile(r'^BREAKING[ -]CHANGE:', re.MULTILINE)
+    
+    _BUMPS = {
+        'feat': VersionBump.MINOR,
+        'fix': VersionBump.PATCH,
+    }
+    
+    _EMPTY = CommitClassification(type=None, scope=None, breaking=False, bump=None)
+    
+    def classify(self, message: str) -> CommitClassification:
+        """
+        Classify a commit message
+        
+        Args:
+            message: Full commit message (subject and optional body)
+            
+        Returns:
+            CommitClassification with type, scope, breaking flag and version bump
+        """
+        if not message:
+            return self._EMPTY
+        
+        commit_type = None
+        scope = None
+        header_bang = False
+        breaking = self._FOOTER.search(message) is not None
+        
+        for match in self._PATTERN.finditer(message):
+            bang = bool(match.group('bang'))
+            match_type = match.group('type').lower()
+            if bang and match_type == 'feat':
+                breaking = True
+            
+            # Only the start of the message is the conventional header
+            if match.start() == 0 and (not bang or message.startswith(':', match.end())):
+                commit_type = match_type
+                scope = match.group('scope')
+                header_bang = bang
+        
+        if breaking:
+            bump = VersionBump.MAJOR
+        elif header_bang:
+            # `type!:` only bumps for feat (handled above as breaking)
+            bump = None
+        else:
+            bump = self._BUMPS.get(commit_type)
+        
+        return CommitClassification(type=commit_type, scope=scope, breaking=breaking, bump=bump)
+    
+    def classify_commit(self, subject: str, body: str = "") -> CommitClassification:
+        """
+        Classify a commit from its subject and body
+        
+        The subject follows the rules of classify(); the body only makes the
+        commit breaking through a `BREAKING CHANGE:` (or `BREAKING-CHANGE:`)
+        footer at the start of a line, matched case-sensitively.
+        
+        Args:
+            subject: Commit subject line
+            body: Commit body (may be empty)
+            
+        Returns:
+            CommitClassification with type, scope, breaking flag and version bump
+        """
+        result = self.classify(subject)
+        if result.breaking or not body or not self._BODY_FOOTER.search(body):
+            return result
+        return CommitClassification(type=result.type, scope=result.scope, breaking=True, bump=VersionBump.MAJOR)
+    
+    def classify_many(self, messages: Iterable[str]) -> List[CommitClassification]:
+        """
+        Classify a batch of commit messages
+        
+        Args:
+            messages: Commit messages to classify
+            
+        Returns:
+            List of CommitClassification, in the same order as messages
+        """
+        classify = self.classify
+        return [classify(message) for message in messages]
+
+
 class ConventionalCommitsTool:
     """Tool for analyzing Conventional Commits and calculating version bumps"""
     
-    def __init__(self, project_root: Path = None):
+    # Identifies the classification rules stored in the on-disk cache
+    CLASSIFIER_VERSION = "5"
+    
+    def __init__(self, project_root: Path = None, git: Optional[GitTool] = None, use_cache: bool = True):
         """
         Initialize Conventional Commits tool
         
         Args:
             project_root: Root directory of the project (defaults to current directory)
+            git: Optional GitTool to share (e.g., one with a persistent git process)
+            use_cache: Keep commit classifications in an on-disk cache so later runs
+                       only classify commits newer than the last analyzed HEAD
         """
         self.project_root = project_root or Path.cwd()
-        self.git = GitTool(self.project_root)
+        self.git = git or GitTool(self.project_root)
+        self.classifier = CommitClassifier()
+        self.cache: Optional[CommitClassificationCache] = None
+        if use_cache:
+            self.cache = CommitClassificationCache(self._cache_file(), self.CLASSIFIER_VERSION)
+    
+    def _cache_file(self) -> Path:
+        """Cache lives inside the git directory so it survives `gradle clean`"""
+        common_dir = self.git.refs.common_dir
+        if common_dir is not None:
+            return common_dir / "zmanager" / "commit-classification.json"
+        return self.project_root / "build" / "zmanager" / "commit-classification.json"
     
     def analyze_commit_type(self, commit_message: str) -> Optional[VersionBump]:
         """
@@ -45,48 +179,31 @@ class ConventionalCommitsTool:
         Returns:
             VersionBump type (MAJOR, MINOR, PATCH) or None if not a conventional commit
         """
-        if not commit_message:
-            return None
-        
-        # Check for breaking changes (highest priority)
-        if self._is_breaking_change(commit_message):
-            return VersionBump.MAJOR
-        
-        # Check for feat (minor)
-        if self._is_feat(commit_message):
-            return VersionBump.MINOR
+        return self.classifier.classify(commit_message).bump
+    
+    def classify_commit(self, commit_message: str) -> CommitClassification:
+        """
+        Classify a commit message into type, scope, breaking flag and bump
         
-        # Check for fix (patch)
-        if self._is_fix(commit_message):
-            return VersionBump.PATCH
+        Args:
+            commit_message: Commit message to classify
+            
+        Returns:
+            CommitClassification for the message
+        """
+        return self.classifier.classify(commit_message)
+    
+    def classify_commits(self, commit_messages: Iterable[str]) -> List[CommitClassification]:
+        """
+        Classify a batch of commit messages in one pass each
         
-        return None
-    
-    def _is_breaking_change(self, commit_message: str) -> bool:
-        """Check if commit is a breaking change"""
-        # Pattern: feat! or feat(scope)! or BREAKING CHANGE in body
-        breaking_patterns = [
-            r'^feat!',
-            r'^feat\([^)]+\)!',
-            r'BREAKING CHANGE',
-        ]
-        
-        for pattern in breaking_patterns:
-            if re.search(pattern, commit_message, re.IGNORECASE | re.MULTILINE):
-                return True
-        return False
-    
-    def _is_feat(self, commit_message: str) -> bool:
-        """Check if commit is a feature"""
-        # Pattern: feat: or feat(scope):
-        feat_pattern = r'^feat(\([^)]+\))?:'
-        return bool(re.match(feat_pattern, commit_message, re.IGNORECASE))
-    
-    def _is_fix(self, commit_message: str) -> bool:
-        """Check if commit is a fix"""
-        # Pattern: fix: or fix(scope):
-        fix_pattern = r'^fix(\([^)]+\))?:'
-        return bool(re.match(fix_pattern, commit_message, re.IGNORECASE))
+        Args:
+            commit_messages: Commit messages to classify
+            
+        Returns:
+            List of CommitClassification, in the same order as the input
+        """
+        return self.classifier.classify_many(commit_messages)
     
     def calculate_version_bump(self, base_version: str, commits: List[str]) -> VersionBump:
         """
@@ -103,10 +220,13 @@ class ConventionalCommitsTool:
             # No commits, default to patch
             return VersionBump.PATCH
         
+        return self._highest_bump(c.bump for c in self.classifier.classify_many(commits))
+    
+    def _highest_bump(self, bump_types) -> VersionBump:
+        """Reduce per-commit bump types (None for non-conventional commits) to one bump"""
         highest_bump = VersionBump.PATCH
         
-        for commit in commits:
-            bump_type = self.analyze_commit_type(commit)
+        for bump_type in bump_types:
             if bump_type:
                 # Priority: MAJOR > MINOR > PATCH
                 if bump_type == VersionBump.MAJOR:
@@ -145,12 +265,47 @@ class ConventionalCommitsTool:
         
         return f"{major}.{minor}.{patch}"
     
-    def calculate_next_version(self, base_version: str) -> Tuple[str, str, str, List[str], VersionBump]:
+    def detect_version_bump(self, tag: str) -> Tuple[VersionBump, List[str]]:
+        """
+        Determine the version bump for tag..HEAD by streaming commits lazily
+        
+        Commits (including bodies) are read from a `git log` pipe and classified
+        one at a time; reading stops at the first MAJOR bump since nothing can
+        raise it further.
+        
+        Args:
+            tag: Base tag (e.g., 'v0.6.0')
+            
+        Returns:
+            Tuple of (bump_type, subjects of the commits read before stopping)
+        """
+        highest_bump = VersionBump.PATCH
+        subjects = []
+        
+        commits = self.git.iter_commits(f"{tag}..HEAD")
+        try:
+            for _, subject, body in commits:
+                subjects.append(subject)
+                bump_type = self.classifier.classify_commit(subject, body).bump
+                if bump_type == VersionBump.MAJOR:
+                    return VersionBump.MAJOR, subjects
+                if bump_type == VersionBump.MINOR:
+                    highest_bump = VersionBump.MINOR
+        finally:
+            commits.close()
+        
+        return highest_bump, subjects
+    
+    def calculate_next_version(self, base_version: str, collect_commits: bool = True) -> Tuple[str, str, str, List[str], VersionBump]:
         """
         Calculate next version based on Conventional Commits
         
         Args:
             base_version: Base version from VERSION.txt (e.g., '0.6.0')
+            collect_commits: Whether the full list of analyzed commits is needed.
+                             When False and nothing is cached yet, commits are
+                             streamed and analysis stops at the first MAJOR bump,
+                             so the returned commit list may be partial.
             
         Returns:
             Tuple of:
@@ -166,11 +321,15 @@ class ConventionalCommitsTool:
             # No tags found, use v0.0.0 as base
             last_tag = "v0.0.0"
         
-        # Get commits since last tag
-        commits = self.git.get_commits_since_tag(last_tag)
-        
-        # Calculate version bump
-        bump_type = self.calculate_version_bump(base_version, commits)
+        if collect_commits or self._has_cached_range(last_tag):
+            # Get commits since last tag together with their classification
+            classified = self._classify_commits_since(last_tag)
+            commits = [subject for _, subject, _ in classified]
+            
+            # Calculate version bump
+            bump_type = self._highest_bump(VersionBump(bump) if bump else None for _, _, bump in classified)
+        else:
+            bump_type, commits = self.detect_version_bump(last_tag)
         
         # Increment version
         next_version = self.increment_version(base_version, bump_type)
@@ -183,4 +342,53 @@ class ConventionalCommitsTool:
         npm_version = f"{next_version}-next.{commit_hash}"
         
         return next_version, maven_version, npm_version, commits, bump_type
-
+    
+    def _has_cached_range(self, tag: str) -> bool:
+        """Check whether the on-disk cache already holds a valid range for tag"""
+        if not self.cache:
+            return False
+        base_sha = self.git.resolve_ref(f"refs/tags/{tag}")
+        return bool(base_sha) and self.cache.get_range(tag, base_sha) is not None
+    
+    def _classify(self, log: Iterable[Tuple[str, str, str]]) -> List[CachedCommit]:
+        """Classify streamed (sha, subject, body) commits into cacheable (sha, subject, bump) entries"""
+        classify_commit = self.classifier.classify_commit
+        classified = []
+        for sha, subject, body in log:
+            bump_type = classify_commit(subject, body).bump
+            classified.append((sha, subject, bump_type.value if bump_type else None))
+        return classified
+    
+    def _classify_commits_since(self, tag: str) -> List[CachedCommit]:
+        """
+        Get classified commits in tag..HEAD, reusing the on-disk cache
+        
+        When the cached HEAD for this tag is an ancestor of the current HEAD, only
+        the commits in cached_head..HEAD are fetched and classified. A moved tag or
+        rewritten history falls back to a full scan.
+        
+        Args:
+            tag: Base tag (e.g., 'v0.6.0')
+            
+        Returns:
+            List of (sha, subject, bump) entries, newest first
+        """
+        base_sha = self.git.resolve_ref(f"refs/tags/{tag}") if self.cache else None
+        head_sha = self.git.resolve_ref("HEAD") if base_sha else None
+        if not base_sha or not head_sha:
+            return self._classify(self.git.iter_commits(f"{tag}..HEAD"))
+        
+        cached = self.cache.get_range(tag, base_sha)
+        if cached is not None:
+            cached_head, cached_commits = cached
+            if cached_head == head_sha:
+                return cached_commits
+            if self.git.is_ancestor(cached_head, head_sha):
+                new_commits = self._classify(self.git.iter_commits(f"{cached_head}..{head_sha}"))
+                classified = new_commits + cached_commits
+                self.cache.set_range(tag, base_sha, head_sha, classified)
+                return classified
+        
+        classified = self._classify(self.git.iter_commits(f"{tag}..{head_sha}"))
+        self.cache.set_range(tag, base_sha, head_sha, classified)
+        return classified
@@ -4,21 +4,215 @@ Provides Git operations for Zernikalos scripts
 """
 
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Tuple, Optional, List
+from typing import Dict, Iterator, Tuple, Optional, List
+
+from .git_refs import GitRefReader
+from . import tracing
+
+
+# `git push --porcelain` status flags
+_PUSH_FLAGS = {
+    ' ': 'fast-forward',
+    '+': 'forced',
+    '-': 'deleted',
+    '*': 'new',
+    '!': 'rejected',
+    '=': 'up-to-date',
+}
+
+# Seconds a streaming git process gets to exit after its output was read
+STREAM_EXIT_TIMEOUT = 10
+
+
+@dataclass
+class RefPushStatus:
+    """Status of one ref in a push, as reported by `git push --porcelain`"""
+    source: str
+    destination: str
+    flag: str  # fast-forward, forced, deleted, new, rejected or up-to-date
+    summary: str
+    reason: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        return self.flag != 'rejected'
+
+
+@dataclass
+class RemotePushResult:
+    """Result of pushing refs to one remote"""
+    remote: str
+    success: bool
+    refs: List[RefPushStatus] = field(default_factory=list)
+    atomic: bool = False
+    error: Optional[str] = None
+
+
+class _CatFileBatch:
+    """
+    Long-lived `git cat-file --batch-check` process
+    
+    Resolves revisions (refs, HEAD, object names) by writing one name per line
+    to the process and reading back `<sha> <type> <size>` or `<name> missing`.
+    The process is started lazily and reused until close() is called.
+    """
+    
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch-check'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                cwd=self.project_root
+            )
+        return self._process
+    
+    def resolve(self, rev: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve a revision to its object name and type
+        
+        Args:
+            rev: Revision to resolve (e.g., 'HEAD', 'refs/tags/v1.0.0')
+            
+        Returns:
+            Tuple of (sha, object_type), both None if the revision does not exist
+            
+        Raises:
+            OSError: If the batch process cannot be started or stops responding
+        """
+        with self._lock:
+            process = self._ensure_started()
+            try:
+                process.stdin.write(rev + '\n')
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except (BrokenPipeError, ValueError) as e:
+                self._terminate()
+                raise OSError(f"git cat-file batch process failed: {e}")
+            if not line:
+                self._terminate()
+                raise OSError("git cat-file batch process exited unexpectedly")
+        
+        parts = line.split()
+        if len(parts) == 3:
+            return parts[0], parts[1]
+        # '<rev> missing' or '<rev> ambiguous'
+        return None, None
+    
+    def _terminate(self) -> None:
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait()
+            except OSError:
+                pass
+            self._process = None
+    
+    def close(self) -> None:
+        """Stop the batch process"""
+        with self._lock:
+            if self._process is not None:
+                try:
+                    self._process.stdin.close()
+                    self._process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._terminate()
+                self._process = None
 
 
 class GitTool:
     """Tool for Git operations"""
     
-    def __init__(self, project_root: Path = None):
+    def __init__(self, project_root: Path = None, persistent: bool = False):
         """
         Initialize Git tool
         
         Args:
             project_root: Root directory of the project (defaults to current directory)
+            persistent: Keep a long-lived `git cat-file --batch-check` process for
+                        ref and object lookups instead of spawning git per call
         """
         self.project_root = project_root or Path.cwd()
+        self.persistent = persistent
+        self.refs = GitRefReader(self.project_root)
+        self._batch: Optional[_CatFileBatch] = _CatFileBatch(self.project_root) if persistent else None
+    
+    def __enter__(self) -> 'GitTool':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the persistent git process, if any"""
+        if self._batch is not None:
+            self._batch.close()
+    
+    def resolve_ref(self, rev: str) -> Optional[str]:
+        """
+        Resolve a revision to its full object name
+        
+        Served by the persistent batch process when enabled, otherwise (or if the
+        batch process fails) by a one-shot `git rev-parse`.
+        
+        Args:
+            rev: Revision to resolve (e.g., 'HEAD', 'refs/tags/v1.0.0')
+            
+        Returns:
+            Full object name or None if the revision does not exist
+        """
+        if self.refs.available():
+            sha = self._resolve_from_refs(rev)
+            if sha is not None:
+                return sha
+        
+        if self._batch is not None and rev.strip() == rev and '\n' not in rev:
+            try:
+                sha, _ = self._batch.resolve(rev)
+                return sha
+            except OSError:
+                pass
+        
+        try:
+            result = tracing.run(
+                ['git', 'rev-parse', '--verify', '--quiet', rev],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=self.project_root
+            )
+            return result.stdout.strip() or None
+        except subprocess.CalledProcessError:
+            return None
+        except FileNotFoundError:
+            return None
+    
+    def _resolve_from_refs(self, rev: str) -> Optional[str]:
+        """Resolve HEAD, tags and branches from the ref reader (None if it cannot tell)"""
+        if rev == 'HEAD':
+            head = self.refs.read_head()
+            if head and head.startswith('ref: refs/heads/'):
+                return self.refs.heads().get(head[len('ref: refs/heads/'):])
+            if head and not head.startswith('ref:'):
+                return head
+            return None
+        if rev.startswith('refs/tags/'):
+            return self.refs.tags().get(rev[len('refs/tags/'):])
+        if rev.startswith('refs/heads/'):
+            return self.refs.heads().get(rev[len('refs/heads/'):])
+        return None
     
     def check_status(self) -> Tuple[bool, str]:
         """
@@ -28,7 +222,7 @@ class GitTool:
             Tuple of (is_clean: bool, output: str)
         """
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 ['git', 'status', '--porcelain'],
                 capture_output=True,
                 text=True,
@@ -52,8 +246,14 @@ class GitTool:
         Returns:
             True if tag exists, False otherwise
         """
+        if self.refs.available():
+            return self.refs.has_tag(tag)
+        
+        if self._batch is not None:
+            return self.resolve_ref(f"refs/tags/{tag}") is not None
+        
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 ['git', 'tag', '-l', tag],
                 capture_output=True,
                 text=True,
@@ -73,8 +273,12 @@ class GitTool:
         Returns:
             List of tag names
         """
+        if self.refs.available():
+            # Same ordering as `git tag -l` (by refname)
+            return sorted(self.refs.tags())
+        
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 ['git', 'tag', '-l'],
                 capture_output=True,
                 text=True,
@@ -99,7 +303,7 @@ class GitTool:
             True if successful, False otherwise
         """
         try:
-            subprocess.run(
+            tracing.run(
                 ['git', 'push', remote, branch],
                 check=True,
                 cwd=self.project_root
@@ -124,7 +328,7 @@ class GitTool:
             True if successful, False otherwise
         """
         try:
-            subprocess.run(
+            tracing.run(
                 ['git', 'push', remote, tag],
                 check=True,
                 cwd=self.project_root
@@ -141,6 +345,9 @@ class GitTool:
         """
         Push branch and optionally a tag to remote repository
         
+        Both refs go in a single atomic push, so the remote never gets the
+        branch without its tag (or the other way around).
+        
         Args:
             branch: Branch name to push (default: main)
             tag: Optional tag name to push
@@ -149,17 +356,88 @@ class GitTool:
         Returns:
             True if successful, False otherwise
         """
-        success = True
+        refs = [branch] + ([tag] if tag else [])
+        result = self.push_refs(refs, [remote])[remote]
+        if not result.success:
+            for ref in result.refs:
+                if not ref.success:
+                    reason = f" ({ref.reason})" if ref.reason else ""
+                    print(f"Failed to push {ref.destination}: {ref.summary}{reason}")
+            if result.error:
+                print(f"Failed to push {', '.join(refs)} to {remote}: {result.error}")
+        return result.success
+    
+    def push_refs(self, refs: List[str], remotes: Optional[List[str]] = None,
+                  atomic: bool = True, max_workers: int = 4) -> Dict[str, RemotePushResult]:
+        """
+        Push several refs to one or more remotes
+        
+        Each remote gets one `git push --porcelain` invocation carrying every
+        ref, so refs share a single negotiation. With atomic, the remote accepts
+        all refs or none; servers without atomic push support get a regular
+        push instead. Remotes (e.g. mirrors) are pushed concurrently.
+        
+        Args:
+            refs: Refs to push (branch or tag names, or src:dst refspecs)
+            remotes: Remote names (default: origin)
+            atomic: Request an all-or-nothing update on each remote
+            max_workers: Maximum number of remotes pushed at once
+            
+        Returns:
+            Dictionary mapping remote name to RemotePushResult, in the order of remotes
+        """
+        remotes = remotes or ["origin"]
+        if len(remotes) == 1:
+            return {remotes[0]: self._push_remote(remotes[0], refs, atomic)}
         
-        # Push branch
-        if not self.push_branch(branch, remote):
-            success = False
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remotes)))) as pool:
+            futures = {remote: pool.submit(self._push_remote, remote, refs, atomic) for remote in remotes}
+            return {remote: future.result() for remote, future in futures.items()}
+    
+    def _push_remote(self, remote: str, refs: List[str], atomic: bool) -> RemotePushResult:
+        """Push refs to a single remote and parse the per-ref status"""
+        cmd = ['git', 'push', '--porcelain'] + (['--atomic'] if atomic else []) + [remote] + refs
+        try:
+            result = tracing.run(cmd, capture_output=True, text=True, cwd=self.project_root)
+        except FileNotFoundError:
+            return RemotePushResult(remote, False, atomic=atomic, error="git command not found")
         
-        # Push tag if provided
-        if tag and not self.push_tag(tag, remote):
-            success = False
+        if atomic and result.returncode != 0 and 'does not support --atomic' in result.stderr:
+            return self._push_remote(remote, refs, atomic=False)
         
-        return success
+        statuses = self.parse_push_porcelain(result.stdout)
+        success = result.returncode == 0 and all(status.success for status in statuses)
+        error = None
+        if not success and not any(not status.success for status in statuses):
+            error = result.stderr.strip() or f"git push exited with code {result.returncode}"
+        return RemotePushResult(remote, success, statuses, atomic=atomic, error=error)
+    
+    @staticmethod
+    def parse_push_porcelain(output: Optional[str]) -> List[RefPushStatus]:
+        """
+        Parse the ref status lines of `git push --porcelain`
+        
+        Lines have the form `<flag>\t<from>:<to>\t<summary> (<reason>)`; the
+        `To <url>` and `Done` lines are ignored.
+        
+        Args:
+            output: Standard output of git push --porcelain
+            
+        Returns:
+            List of RefPushStatus in output order
+        """
+        statuses = []
+        for line in (output or '').splitlines():
+            parts = line.split('\t')
+            if len(parts) != 3 or len(parts[0]) != 1 or parts[0] not in _PUSH_FLAGS:
+                continue
+            flag, refspec, summary = parts
+            source, _, destination = refspec.partition(':')
+            reason = None
+            if summary.endswith(')') and ' (' in summary:
+                summary, _, reason = summary[:-1].partition(' (')
+            statuses.append(RefPushStatus(source, destination, _PUSH_FLAGS[flag], summary, reason))
+        return statuses
     
     def get_current_branch(self) -> Optional[str]:
         """
@@ -168,8 +446,13 @@ class GitTool:
         Returns:
             Branch name or None if error
         """
+        if self.refs.available():
+            branch = self.refs.current_branch()
+            if branch is not None:
+                return branch
+        
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
                 capture_output=True,
                 text=True,
@@ -190,7 +473,7 @@ class GitTool:
             True if git repository, False otherwise
         """
         try:
-            subprocess.run(
+            tracing.run(
                 ['git', 'rev-parse', '--git-dir'],
                 capture_output=True,
                 check=True,
@@ -211,7 +494,7 @@ class GitTool:
             Last release tag name (e.g., 'v0.6.0') or None if no tags found
         """
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 ['git', 'describe', '--tags', '--abbrev=0', '--match', 'v*.*.*'],
                 capture_output=True,
                 text=True,
@@ -226,56 +509,112 @@ class GitTool:
         except FileNotFoundError:
             return None
     
-    def get_commits_since_tag(self, tag: str) -> List[str]:
+    def iter_commits(self, rev_range: str, chunk_size: int = 65536) -> Iterator[Tuple[str, str, str]]:
         """
-        Get list of commit messages since a specific tag
+        Stream commits for a revision range
         
-        Retrieves commit subject lines (first line of commit message) from the
-        specified tag to HEAD. Used for analyzing Conventional Commits.
+        Reads NUL-delimited `git log -z` records from a pipe, so memory use stays
+        flat regardless of range size. Closing the generator early (e.g. breaking
+        out of a loop) stops the git process.
         
         Args:
-            tag: Tag name to get commits from (e.g., 'v0.6.0')
+            rev_range: Revision range (e.g., 'v0.6.0..HEAD')
+            chunk_size: Number of bytes read from the pipe at a time
+            
+        Yields:
+            Tuples of (full_hash, subject, body), newest first
+        """
+        cmd = ['git', 'log', '-z', rev_range, '--pretty=format:%H%x1f%s%x1f%b']
+        # The span also covers time the consumer spends between commits
+        with tracing.span("git log (stream)", "subprocess", cmd=cmd) as span:
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=self.project_root
+                )
+            except FileNotFoundError:
+                return
+            
+            count = 0
+            exhausted = False
+            try:
+                pending = b''
+                while True:
+                    chunk = process.stdout.read(chunk_size)
+                    if not chunk:
+                        break
+                    pending += chunk
+                    *records, pending = pending.split(b'\0')
+                    for record in records:
+                        commit = self._parse_log_record(record)
+                        if commit:
+                            count += 1
+                            yield commit
+                commit = self._parse_log_record(pending)
+                if commit:
+                    count += 1
+                    yield commit
+                exhausted = True
+            finally:
+                if exhausted:
+                    # git is exiting on its own after EOF; only kill it if it hangs
+                    try:
+                        process.wait(timeout=STREAM_EXIT_TIMEOUT)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                else:
+                    # Closed early: git may be blocked writing to the pipe
+                    process.kill()
+                process.stdout.close()
+                span.set(exit_code=process.wait(), commits=count)
+    
+    @staticmethod
+    def _parse_log_record(record: bytes) -> Optional[Tuple[str, str, str]]:
+        """Parse a unit-separator delimited 'hash, subject, body' log record"""
+        fields = record.decode('utf-8', 'replace').split('\x1f', 2)
+        if len(fields) != 3 or not fields[0].strip():
+            return None
+        sha, subject, body = fields
+        return sha.strip(), subject.strip(), body.strip()
+    
+    def is_ancestor(self, ancestor: str, descendant: str = "HEAD") -> bool:
+        """
+        Check whether one commit is an ancestor of another
+        
+        Args:
+            ancestor: Candidate ancestor commit
+            descendant: Descendant commit (default: HEAD)
             
         Returns:
-            List of commit messages (subject lines only)
+            True if ancestor is reachable from descendant, False otherwise
         """
         try:
-            result = subprocess.run(
-                ['git', 'log', f'{tag}..HEAD', '--pretty=format:%s'],
+            result = tracing.run(
+                ['git', 'merge-base', '--is-ancestor', ancestor, descendant],
                 capture_output=True,
-                text=True,
-                check=True,
                 cwd=self.project_root
             )
-            commits = [line.strip() for line in result.stdout.split('\n') if line.strip()]
-            return commits
-        except subprocess.CalledProcessError:
-            return []
+            return result.returncode == 0
         except FileNotFoundError:
-            return []
+            return False
     
     def get_current_commit_hash(self, short: bool = True) -> Optional[str]:
         """
         Get the current commit hash
         
+        The short form is always the first 7 characters, whether HEAD is resolved
+        by the ref reader, the persistent batch process or a one-shot git call.
+        
         Args:
             short: If True, return short hash (7 chars), otherwise full hash
             
         Returns:
             Commit hash or None if error
         """
-        try:
-            format_str = '%h' if short else '%H'
-            result = subprocess.run(
-                ['git', 'rev-parse', format_str, 'HEAD'],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.project_root
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return None
-        except FileNotFoundError:
+        sha = self.resolve_ref('HEAD')
+        if sha is None:
             return None
+        return sha[:7] if short else sha
 
@@ -0,0 +1,258 @@
+"""
+Git Ref Reader
+Reads HEAD, branches and tags straight from the .git directory without spawning git
+"""
+
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+# Ref index shared by every reader in the process, keyed by the common git directory
+_INDEX_CACHE: Dict[Path, '_RefIndex'] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+class _RefIndex:
+    """In-memory index of tags and branches for one repository"""
+
+    def __init__(self, signature: Tuple, tags: Dict[str, str], heads: Dict[str, str]):
+        self.signature = signature
+        self.tags = tags
+        self.heads = heads
+
+
+def find_git_dirs(start: Path) -> Tuple[Optional[Path], Optional[Path]]:
+    """
+    Locate the git directory and common directory for a working tree
+
+    Handles regular repositories (`.git/` directory) as well as worktrees and
+    submodules (`.git` file with a `gitdir:` pointer and optional `commondir`).
+
+    Args:
+        start: Directory inside the working tree
+
+    Returns:
+        Tuple of (git_dir, common_dir), both None if no repository was found
+    """
+    for directory in [start] + list(start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            try:
+                content = dot_git.read_text().strip()
+            except OSError:
+                return None, None
+            if not content.startswith("gitdir:"):
+                return None, None
+            git_dir = Path(content[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = (directory / git_dir).resolve()
+        else:
+            continue
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            try:
+                common = Path(commondir_file.read_text().strip())
+            except OSError:
+                return None, None
+            common_dir = common if common.is_absolute() else (git_dir / common).resolve()
+        return git_dir, common_dir
+    return None, None
+
+
+class GitRefReader:
+    """
+    Pure-Python reader for git refs
+
+    Parses `HEAD`, loose refs under `refs/tags` and `refs/heads`, and
+    `packed-refs` (via mmap). The resulting index is built once per process and
+    shared between readers; it is rebuilt only when `packed-refs` or one of the
+    loose ref directories changes on disk.
+    """
+
+    def __init__(self, project_root: Path = None):
+        """
+        Initialize ref reader
+
+        Args:
+            project_root: Root directory of the project (defaults to current directory)
+        """
+        self.project_root = project_root or Path.cwd()
+        self.git_dir, self.common_dir = find_git_dirs(self.project_root)
+
+    def available(self) -> bool:
+        """
+        Check whether refs can be read directly
+
+        Returns False when no repository was found, when GIT_DIR overrides
+        discovery, or when the repository uses the reftable backend.
+
+        Returns:
+            True if the reader can serve lookups, False if callers should use git
+        """
+        if self.git_dir is None or self.common_dir is None:
+            return False
+        if os.environ.get("GIT_DIR"):
+            return False
+        if (self.common_dir / "reftable").is_dir():
+            return False
+        return (self.git_dir / "HEAD").is_file()
+
+    def read_head(self) -> Optional[str]:
+        """
+        Read the raw content of HEAD
+
+        Returns:
+            'ref: refs/heads/<branch>' for a branch, a commit sha when detached,
+            or None if HEAD cannot be read
+        """
+        try:
+            return (self.git_dir / "HEAD").read_text().strip()
+        except (OSError, TypeError):
+            return None
+
+    def current_branch(self) -> Optional[str]:
+        """
+        Get the current branch name
+
+        Returns:
+            Branch name, 'HEAD' when detached (matching `git rev-parse --abbrev-ref HEAD`),
+            or None if HEAD cannot be read
+        """
+        head = self.read_head()
+        if head is None:
+            return None
+        if head.startswith("ref:"):
+            ref = head[len("ref:"):].strip()
+            if ref.startswith("refs/heads/"):
+                return ref[len("refs/heads/"):]
+            return ref
+        return "HEAD"
+
+    def tags(self) -> Dict[str, str]:
+        """
+        Get all tags
+
+        Returns:
+            Dictionary mapping tag name to the object name it points at
+        """
+        return self._index().tags
+
+    def heads(self) -> Dict[str, str]:
+        """
+        Get all local branches
+
+        Returns:
+            Dictionary mapping branch name to commit sha
+        """
+        return self._index().heads
+
+    def has_tag(self, tag: str) -> bool:
+        """
+        Check if a tag exists
+
+        Args:
+            tag: Tag name (e.g., 'v1.0.0')
+
+        Returns:
+            True if the tag exists, False otherwise
+        """
+        return tag in self._index().tags
+
+    def refresh(self) -> None:
+        """Drop the cached index so the next lookup re-reads the repository"""
+        with _INDEX_LOCK:
+            _INDEX_CACHE.pop(self.common_dir, None)
+
+    def _index(self) -> _RefIndex:
+        signature = self._signature()
+        with _INDEX_LOCK:
+            index = _INDEX_CACHE.get(self.common_dir)
+            if index is None or index.signature != signature:
+                tags = self._read_packed_refs("refs/tags/")
+                heads = self._read_packed_refs("refs/heads/")
+                tags.update(self._read_loose_refs("refs/tags"))
+                heads.update(self._read_loose_refs("refs/heads"))
+                index = _RefIndex(signature, tags, heads)
+                _INDEX_CACHE[self.common_dir] = index
+            return index
+
+    def _signature(self) -> Tuple:
+        """Cheap change detector: stat of packed-refs plus mtimes of loose ref directories"""
+        parts = []
+        try:
+            st = os.stat(self.common_dir / "packed-refs")
+            parts.append(("packed-refs", st.st_mtime_ns, st.st_size))
+        except OSError:
+            parts.append(("packed-refs", None, None))
+
+        for root in ("refs/tags", "refs/heads"):
+            stack = [self.common_dir / root]
+            while stack:
+                directory = stack.pop()
+                try:
+                    parts.append((str(directory), os.stat(directory).st_mtime_ns))
+                    # git updates refs via lockfile + rename, so any ref
+                    # change touches the mtime of its directory
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(Path(entry.path))
+                except OSError:
+                    continue
+        return tuple(parts)
+
+    def _read_packed_refs(self, prefix: str) -> Dict[str, str]:
+        refs: Dict[str, str] = {}
+        packed = self.common_dir / "packed-refs"
+        try:
+            with open(packed, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return refs
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    prefix_bytes = prefix.encode()
+                    for line in iter(data.readline, b""):
+                        # Skip the header and peeled ('^<sha>') lines
+                        if line.startswith((b"#", b"^")):
+                            continue
+                        sha, _, name = line.rstrip(b"\n").partition(b" ")
+                        if name.startswith(prefix_bytes):
+                            refs[name[len(prefix_bytes):].decode("utf-8", "replace")] = sha.decode("ascii")
+        except OSError:
+            pass
+        return refs
+
+    def _read_loose_refs(self, root: str) -> Dict[str, str]:
+        refs: Dict[str, str] = {}
+        base = self.common_dir / root
+        stack = [base]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                            continue
+                        # <ref>.lock files are git's in-progress updates, not refs
+                        if entry.name.endswith(".lock"):
+                            continue
+                        try:
+                            with open(entry.path, "r") as f:
+                                value = f.read().strip()
+                        except OSError:
+                            continue
+                        # Symbolic loose refs are rare outside HEAD; let git resolve those
+                        if not value or value.startswith("ref:"):
+                            continue
+                        name = Path(entry.path).relative_to(base).as_posix()
+                        refs[name] = value
+            except OSError:
+                continue
+        return refs
@@ -3,45 +3,210 @@ Gradle Tool
 Provides Gradle operations for Zernikalos scripts
 """
 
+import os
+import re
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
+
+from . import tracing
+from .availability import file_fingerprint, get_availability_cache
+
+
+# '> Task :name' lines printed by Gradle with --console=plain
+_TASK_LINE = re.compile(r'^> Task :(?P<task>\S+)', re.MULTILINE)
+# 'Execution failed for task ':name'.' in Gradle's failure report
+_FAILED_TASK = re.compile(r"Execution failed for task ':(?P<task>[^']+)'")
+
+
+@dataclass(frozen=True)
+class GradleProfile:
+    """
+    Gradle execution profile
+    
+    Each option maps to a pair of Gradle flags; None leaves Gradle's own
+    default (or gradle.properties) in charge.
+    """
+    name: str
+    description: str = ""
+    daemon: Optional[bool] = None
+    build_cache: Optional[bool] = None
+    configuration_cache: Optional[bool] = None
+    parallel: Optional[bool] = None
+    max_workers: Optional[int] = None
+    
+    def to_args(self) -> List[str]:
+        """
+        Build command line flags for this profile
+        
+        Returns:
+            List of Gradle flags (e.g., ['--no-daemon', '--build-cache'])
+        """
+        args = []
+        for enabled, flag in (
+            (self.daemon, 'daemon'),
+            (self.build_cache, 'build-cache'),
+            (self.configuration_cache, 'configuration-cache'),
+            (self.parallel, 'parallel'),
+        ):
+            if enabled is not None:
+                args.append(f'--{flag}' if enabled else f'--no-{flag}')
+        if self.max_workers:
+            args.append(f'--max-workers={self.max_workers}')
+        return args
+
+
+GRADLE_PROFILES: Dict[str, GradleProfile] = {
+    'default': GradleProfile(
+        name='default',
+        description="No extra flags; Gradle and gradle.properties defaults apply"
+    ),
+    'ci-cold': GradleProfile(
+        name='ci-cold',
+        description="Reproducible cold run: no daemon, no build or configuration cache",
+        daemon=False,
+        build_cache=False,
+        configuration_cache=False,
+        parallel=False
+    ),
+    'local-warm': GradleProfile(
+        name='local-warm',
+        description="Fast repeated runs: daemon, build cache, configuration cache, parallel",
+        daemon=True,
+        build_cache=True,
+        configuration_cache=True,
+        parallel=True
+    ),
+    'release': GradleProfile(
+        name='release',
+        # The versioning tasks read project state at execution time, which the
+        # configuration cache does not support
+        description="Release builds: daemon reuse, no caches, sequential execution",
+        daemon=True,
+        build_cache=False,
+        configuration_cache=False,
+        parallel=False
+    ),
+}
+
+# Environment variable selecting the default profile for every GradleTool
+GRADLE_PROFILE_ENV = "ZMANAGER_GRADLE_PROFILE"
 
 
 class GradleTool:
     """Tool for Gradle operations"""
     
-    def __init__(self, project_root: Path = None, gradlew_path: str = "./gradlew"):
+    # Profile used by instances created without an explicit profile
+    _default_profile: Optional[str] = None
+    
+    def __init__(self, project_root: Path = None, gradlew_path: str = "./gradlew", profile: Optional[str] = None):
         """
         Initialize Gradle tool
         
         Args:
             project_root: Root directory of the project (defaults to current directory)
             gradlew_path: Path to gradle wrapper (default: ./gradlew)
+            profile: Execution profile name (see GRADLE_PROFILES). Defaults to the
+                     process-wide default, then $ZMANAGER_GRADLE_PROFILE, then 'default'
         """
         self.project_root = project_root or Path.cwd()
         self.gradlew_path = gradlew_path
+        self.profile = self.get_profile(
+            profile or GradleTool._default_profile or os.environ.get(GRADLE_PROFILE_ENV) or 'default'
+        )
+        # Optional time.monotonic() deadline; commands still running when it passes are killed
+        self.deadline: Optional[float] = None
+    
+    @staticmethod
+    def get_profile(name: str) -> GradleProfile:
+        """
+        Look up an execution profile by name
+        
+        Args:
+            name: Profile name
+            
+        Returns:
+            GradleProfile
+            
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        if name not in GRADLE_PROFILES:
+            raise ValueError(f"Unknown Gradle profile: {name}. Available: {', '.join(GRADLE_PROFILES)}")
+        return GRADLE_PROFILES[name]
+    
+    @classmethod
+    def set_default_profile(cls, name: Optional[str]) -> None:
+        """
+        Set the profile used by every GradleTool created afterwards
+        
+        Args:
+            name: Profile name, or None to go back to the environment/default
+        """
+        if name is not None:
+            cls.get_profile(name)
+        cls._default_profile = name
     
-    def check_available(self) -> Tuple[bool, Optional[str]]:
+    def set_profile(self, name: str) -> None:
+        """
+        Switch this tool to another execution profile
+        
+        Args:
+            name: Profile name
+        """
+        self.profile = self.get_profile(name)
+    
+    def check_available(self, timeout: Optional[float] = None, use_cache: bool = True) -> Tuple[bool, Optional[str]]:
         """
         Check if Gradle wrapper is available
         
+        Results are shared through the process-wide availability cache and are
+        invalidated when gradlew, the wrapper properties or JAVA_HOME change.
+        
+        Args:
+            timeout: Optional timeout in seconds; the wrapper is killed when exceeded
+            use_cache: Whether to reuse a cached result (default: True)
+        
         Returns:
             Tuple of (is_available: bool, version_info: Optional[str])
         """
+        cache = get_availability_cache()
+        key = self._availability_key()
+        if use_cache:
+            cached = cache.get('gradle', key)
+            if cached is not None:
+                return cached
+        
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 [self.gradlew_path, '--version'],
                 capture_output=True,
                 text=True,
                 check=True,
-                cwd=self.project_root
+                cwd=self.project_root,
+                timeout=timeout
             )
-            return True, result.stdout
+            availability = (True, result.stdout)
         except subprocess.CalledProcessError as e:
-            return False, f"Gradle wrapper error: {e.stderr if e.stderr else str(e)}"
+            availability = (False, f"Gradle wrapper error: {e.stderr if e.stderr else str(e)}")
+        except subprocess.TimeoutExpired:
+            # A slow cold start says nothing about availability; do not cache it
+            return False, f"Gradle wrapper did not respond within {timeout}s"
         except FileNotFoundError:
-            return False, "Gradle wrapper not found or not executable"
+            availability = (False, "Gradle wrapper not found or not executable")
+        
+        cache.put('gradle', key, availability)
+        return availability
+    
+    def _availability_key(self) -> List[str]:
+        """Inputs that decide whether a cached availability result is still valid"""
+        root = Path(self.project_root)
+        return [
+            file_fingerprint(root / self.gradlew_path),
+            file_fingerprint(root / "gradle" / "wrapper" / "gradle-wrapper.properties"),
+            os.environ.get("JAVA_HOME", ""),
+        ]
     
     def run_command(self, command: str, *args, capture_output: bool = True, show_output: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -57,11 +222,12 @@ class GradleTool:
             Tuple of (success: bool, stdout: Optional[str], stderr: Optional[str])
         """
         try:
-            cmd = [self.gradlew_path, command] + list(args)
+            cmd = [self.gradlew_path, command] + list(args) + self.profile.to_args()
             
             if capture_output:
-                result = subprocess.run(
+                result = tracing.run(
                     cmd,
+                    deadline=self.deadline,
                     check=True,
                     capture_output=True,
                     text=True,
@@ -74,8 +240,9 @@ class GradleTool:
                         print(result.stderr)
                 return True, result.stdout, result.stderr
             else:
-                result = subprocess.run(
+                result = tracing.run(
                     cmd,
+                    deadline=self.deadline,
                     check=True,
                     cwd=self.project_root
                 )
@@ -89,12 +256,54 @@ class GradleTool:
                 print(f"Gradle stderr: {error_msg}")
                 print(f"Command failed with exit code {e.returncode}")
             return False, stdout_msg, error_msg
+        except subprocess.TimeoutExpired as e:
+            # subprocess.run has killed the wrapper; the daemon cancels the build once its client is gone
+            error_msg = f"Gradle command '{command}' did not finish before the deadline"
+            if show_output:
+                print(f"Error: {error_msg}")
+            return False, e.stdout if isinstance(e.stdout, str) else None, error_msg
         except FileNotFoundError:
             error_msg = "Gradle wrapper not found or not executable"
             if show_output:
                 print(f"Error: {error_msg}")
             return False, None, error_msg
     
+    def run_tasks(self, tasks: List[str], *args, show_output: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run several Gradle tasks in a single wrapper invocation
+        
+        Tasks run in the given order (subject to their dependencies) and share one
+        JVM startup and configuration phase. Output uses the plain console so
+        task execution lines can be parsed with parse_task_execution().
+        
+        Args:
+            tasks: Ordered list of task names
+            *args: Additional arguments (e.g., -P properties) for the whole invocation
+            show_output: Whether to print output to console (default: False)
+            
+        Returns:
+            Tuple of (success: bool, stdout: Optional[str], stderr: Optional[str])
+        """
+        if not tasks:
+            return True, None, None
+        return self.run_command(tasks[0], *tasks[1:], '--console=plain', *args, show_output=show_output)
+    
+    @staticmethod
+    def parse_task_execution(stdout: Optional[str], stderr: Optional[str]) -> Tuple[List[str], Optional[str]]:
+        """
+        Parse task execution from plain console output
+        
+        Args:
+            stdout: Gradle standard output
+            stderr: Gradle error output
+            
+        Returns:
+            Tuple of (tasks in execution order, failed task or None)
+        """
+        executed = [match.group('task') for match in _TASK_LINE.finditer(stdout or '')]
+        failed = _FAILED_TASK.search(f"{stderr or ''}\n{stdout or ''}")
+        return executed, failed.group('task') if failed else None
+    
     def build(self, *args) -> bool:
         """
         Build the project
@@ -155,13 +364,15 @@ class GradleTool:
                 print(f"Gradle output: {stdout}")
         return success
     
-    def release_commit(self, version: str = None) -> bool:
+    def release_commit(self, version: str = None, skip_update_version: bool = False) -> bool:
         """
         Create release commit and tag
         
         Args:
             version: Optional version string to pass as project property.
                     If not provided, will use version from VERSION.txt
+            skip_update_version: Exclude the updateVersion dependency (and its finalizers),
+                                 for when the version files were already generated
         
         Returns:
             True if successful, False otherwise
@@ -169,6 +380,8 @@ class GradleTool:
         args = []
         if version:
             args.append(f'-Pversion={version}')
+        if skip_update_version:
+            args.extend(['-x', 'updateVersion'])
         
         success, stdout, stderr = self.run_command('releaseCommit', *args, show_output=True)
         if not success:
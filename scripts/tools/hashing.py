@@ -0,0 +1,242 @@
+"""
+Hashing Engine
+Parallel BLAKE2 hashing of files and directory trees with a persistent stat cache
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .tracing import span
+
+
+DIGEST_SIZE = 32
+# Default stat cache location, relative to the project root
+DEFAULT_CACHE_PATH = Path("build") / "zmanager" / "hash-cache.json"
+# Files at least this large are mapped instead of read in chunks
+MMAP_THRESHOLD = 1 << 20
+READ_CHUNK = 1 << 20
+# Below these totals a process pool costs more than it saves
+POOL_MIN_FILES = 16
+POOL_MIN_BYTES = 8 << 20
+# Files modified this recently are hashed but not cached: a write within the same
+# mtime tick would otherwise go unnoticed (git's "racy clean" problem)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Bump whenever the digest algorithm changes so stale cache entries are discarded
+CACHE_FORMAT_VERSION = 1
+
+# (inode, size, mtime_ns)
+StatKey = Tuple[int, int, int]
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the BLAKE2b digest of a file
+
+    Large files are hashed through mmap to avoid copying them into Python
+    buffers; smaller ones are read in 1 MiB chunks.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest.update(data)
+        else:
+            for chunk in iter(lambda: f.read(READ_CHUNK), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def walk_files(root: Path) -> List[Tuple[str, os.stat_result]]:
+    """
+    List regular files below a directory, in a stable order
+
+    Args:
+        root: Directory (or single file) to walk
+
+    Returns:
+        Sorted list of (path, stat_result); symlinks to directories are not followed
+    """
+    root = Path(root)
+    if root.is_file():
+        return [(str(root), root.stat())]
+
+    files = []
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            files.append((entry.path, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    files.sort(key=lambda item: item[0])
+    return files
+
+
+class HashingEngine:
+    """
+    Hashes files and trees, reusing digests of files that did not change
+
+    Digests are cached by path and validated against (inode, size, mtime_ns),
+    so re-hashing an unchanged tree only costs a directory walk. Cache misses
+    are hashed in a process pool when there are enough of them to pay for the
+    pool start-up, otherwise in the current process.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, max_workers: Optional[int] = None):
+        """
+        Initialize hashing engine
+
+        Args:
+            cache_file: Optional JSON file persisting the stat cache between runs
+            max_workers: Process pool size (default: number of CPUs)
+        """
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self._cache: Dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def hash_files(self, files: Iterable[Tuple[str, os.stat_result]]) -> Dict[str, str]:
+        """
+        Hash files, using the stat cache where possible
+
+        Args:
+            files: (path, stat_result) pairs, as returned by walk_files()
+
+        Returns:
+            Dictionary mapping path to hex digest
+        """
+        digests: Dict[str, str] = {}
+        misses: List[Tuple[str, StatKey]] = []
+
+        with self._lock:
+            self._load()
+            for path, st in files:
+                key = (st.st_ino, st.st_size, st.st_mtime_ns)
+                entry = self._cache.get(path)
+                if entry is not None and tuple(entry[:3]) == key:
+                    digests[path] = entry[3]
+                else:
+                    misses.append((path, key))
+
+        if misses:
+            with span("hash.files", "hashing", files=len(misses)) as s:
+                total_bytes = sum(key[1] for _, key in misses)
+                paths = [path for path, _ in misses]
+                use_pool = len(misses) >= POOL_MIN_FILES and total_bytes >= POOL_MIN_BYTES
+                if use_pool:
+                    with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                        results = list(pool.map(hash_file, paths, chunksize=8))
+                else:
+                    results = [hash_file(path) for path in paths]
+                s.set(bytes=total_bytes, pool=use_pool)
+
+            racy_limit = time.time_ns() - RACY_WINDOW_NS
+            with self._lock:
+                for (path, key), digest in zip(misses, results):
+                    digests[path] = digest
+                    if key[2] < racy_limit:
+                        self._cache[path] = [key[0], key[1], key[2], digest]
+                        self._dirty = True
+
+        return digests
+
+    def hash_tree(self, paths: List[str], base: Path) -> str:
+        """
+        Compute one digest over files and directory trees
+
+        Every file contributes its path relative to base and its content digest,
+        in sorted order, so renames and content changes both change the result.
+        Missing paths contribute a marker so that deleting an input is detected.
+
+        Args:
+            paths: Files or directories relative to base
+            base: Directory the paths are relative to
+
+        Returns:
+            Hex digest
+        """
+        listing: List[Tuple[str, os.stat_result]] = []
+        markers: List[str] = []
+        for rel_path in sorted(paths):
+            path = base / rel_path
+            if path.exists():
+                listing.extend(walk_files(path))
+            else:
+                markers.append(rel_path)
+
+        digests = self.hash_files(listing)
+
+        combined = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        for rel_path in markers:
+            combined.update(f"missing:{rel_path}\0".encode())
+        for path, _ in listing:
+            combined.update(Path(path).relative_to(base).as_posix().encode() + b'\0')
+            combined.update(digests[path].encode() + b'\0')
+        return combined.hexdigest()
+
+    def save(self) -> None:
+        """Persist the stat cache; failures only cost cache misses next time"""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        if self.cache_file is None or not self._dirty:
+            return
+        # Forget files that no longer exist so the cache does not grow forever
+        self._cache = {path: entry for path, entry in self._cache.items() if os.path.exists(path)}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'format': CACHE_FORMAT_VERSION, 'files': self._cache}, f)
+                os.replace(tmp_path, self.cache_file)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+            self._dirty = False
+        except OSError:
+            pass
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get('format') == CACHE_FORMAT_VERSION:
+            files = data.get('files')
+            if isinstance(files, dict):
+                self._cache = {path: entry for path, entry in files.items()
+                               if isinstance(entry, list) and len(entry) == 4}
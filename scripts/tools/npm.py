@@ -4,10 +4,47 @@ Provides NPM operations for Zernikalos scripts
 """
 
 import os
+import random
+import re
+import shutil
 import subprocess
 import json
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
+
+from . import tracing
+from .availability import file_fingerprint, get_availability_cache
+from .hashing import DEFAULT_CACHE_PATH, HashingEngine
+from .package_index import PackageIndex
+
+
+NPM_SCOPE = "@zernikalos"
+# Packed tarballs kept per package in the tarball cache
+TARBALLS_PER_PACKAGE = 3
+
+# Registry errors worth retrying: rate limiting, server errors and network hiccups
+_TRANSIENT_ERROR = re.compile(
+    r"\bE429\b|\bE5\d\d\b|\b5\d\d (?:Internal Server Error|Bad Gateway|Service Unavailable|Gateway Time-?out)"
+    r"|\bETIMEDOUT\b|\bESOCKETTIMEDOUT\b|\bECONNRESET\b|\bEAI_AGAIN\b|socket hang up",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class PackagePublishResult:
+    """Result of publishing a single package"""
+    name: str
+    version: str
+    success: bool
+    attempts: int = 0
+    duration: float = 0.0
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+    error: Optional[str] = None
 
 
 class NpmTool:
@@ -22,27 +59,52 @@ class NpmTool:
         """
         self.project_root = project_root or Path.cwd()
         self.github_token: Optional[str] = None
+        self.tarball_cache_dir = self.project_root / "build" / "npm-cache"
+        self._hasher: Optional[HashingEngine] = None
+        # Optional time.monotonic() deadline; commands still running when it passes are killed
+        self.deadline: Optional[float] = None
     
-    def check_available(self) -> Tuple[bool, Optional[str]]:
+    def check_available(self, timeout: Optional[float] = None, use_cache: bool = True) -> Tuple[bool, Optional[str]]:
         """
         Check if npm is available
         
+        Results are shared through the process-wide availability cache and are
+        invalidated when the npm binary found on PATH changes.
+        
+        Args:
+            timeout: Optional timeout in seconds; npm is killed when exceeded
+            use_cache: Whether to reuse a cached result (default: True)
+        
         Returns:
             Tuple of (is_available: bool, version: Optional[str])
         """
+        cache = get_availability_cache()
+        npm_path = shutil.which('npm')
+        key = [file_fingerprint(Path(npm_path) if npm_path else None)]
+        if use_cache:
+            cached = cache.get('npm', key)
+            if cached is not None:
+                return cached
+        
         try:
-            result = subprocess.run(
+            result = tracing.run(
                 ['npm', '--version'],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                timeout=timeout
             )
-            version = result.stdout.strip()
-            return True, version
+            availability = (True, result.stdout.strip())
         except subprocess.CalledProcessError:
+            availability = (False, None)
+        except subprocess.TimeoutExpired:
+            # Do not cache transient slowness
             return False, None
         except FileNotFoundError:
-            return False, None
+            availability = (False, None)
+        
+        cache.put('npm', key, availability)
+        return availability
     
     def set_auth_token(self, token: str) -> None:
         """
@@ -66,6 +128,20 @@ class NpmTool:
             env['NODE_AUTH_TOKEN'] = self.github_token
         return env
     
+    def get_package_index(self, packages_dir: Path = None) -> PackageIndex:
+        """
+        Get the cached package index
+        
+        Args:
+            packages_dir: Directory containing packages (default: build/js/packages/@zernikalos)
+            
+        Returns:
+            PackageIndex for the directory (entries are shared process-wide)
+        """
+        if packages_dir is None:
+            packages_dir = self.project_root / "build" / "js" / "packages" / "@zernikalos"
+        return PackageIndex(packages_dir)
+    
     def list_packages(self, packages_dir: Path = None, exclude_test: bool = True) -> List[Tuple[str, str]]:
         """
         List available packages in the packages directory
@@ -77,34 +153,262 @@ class NpmTool:
         Returns:
             List of tuples (package_name, version)
         """
-        if packages_dir is None:
-            packages_dir = self.project_root / "build" / "js" / "packages" / "@zernikalos"
+        index = self.get_package_index(packages_dir)
+        return [(entry.name, entry.version) for entry in index.packages(exclude_test=exclude_test)]
+    
+    def get_package_dependencies(self, packages_dir: Path = None,
+                                 names: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Read dependencies between packages of the scope
+        
+        Only dependencies on other packages in `names` are kept; external
+        dependencies do not affect the publish order.
+        
+        Args:
+            packages_dir: Directory containing packages (default: build/js/packages/@zernikalos)
+            names: Package names to consider (default: all non-test packages)
+            
+        Returns:
+            Dictionary mapping package name to the names it depends on
+        """
+        index = self.get_package_index(packages_dir)
+        if names is None:
+            names = [entry.name for entry in index.packages()]
         
-        packages = []
+        entries = index.refresh()
+        known = set(names)
+        dependencies = {}
+        for name in names:
+            entry = entries.get(name)
+            deps = set()
+            for dep in (entry.dependencies if entry else {}):
+                if dep.startswith(f"{NPM_SCOPE}/"):
+                    dep_name = dep[len(NPM_SCOPE) + 1:]
+                    if dep_name in known and dep_name != name:
+                        deps.add(dep_name)
+            dependencies[name] = sorted(deps)
+        return dependencies
+    
+    @staticmethod
+    def dependency_levels(dependencies: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Group packages into levels that can be published in parallel
         
-        if not packages_dir.exists():
-            return packages
+        Every package comes after all of its dependencies.
         
-        for package_dir in packages_dir.iterdir():
-            if package_dir.is_dir():
-                package_name = package_dir.name
+        Args:
+            dependencies: Dictionary mapping package name to the names it depends on
+            
+        Returns:
+            List of levels, each a sorted list of package names
+            
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        remaining = {name: set(deps) for name, deps in dependencies.items()}
+        levels = []
+        while remaining:
+            ready = sorted(name for name, deps in remaining.items() if not deps)
+            if not ready:
+                raise ValueError(f"Dependency cycle between packages: {', '.join(sorted(remaining))}")
+            levels.append(ready)
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return levels
+    
+    def publish_packages(self, workspace_dir: Path, packages: Optional[List[Tuple[str, str]]] = None,
+                         max_workers: int = 4, retries: int = 3, backoff: float = 2.0,
+                         show_output: bool = True) -> Dict[str, PackagePublishResult]:
+        """
+        Publish several workspace packages concurrently, in dependency order
+        
+        A package starts as soon as all of its dependencies are published, with
+        at most `max_workers` publishes running at once. Transient registry
+        errors (rate limiting, 5xx, timeouts, connection resets, DNS failures)
+        are retried with exponential backoff. Packages whose dependencies failed
+        are not published.
+        
+        Args:
+            workspace_dir: Directory containing the workspace (build/js)
+            packages: (name, version) pairs to publish (default: all non-test packages)
+            max_workers: Maximum number of concurrent npm processes
+            retries: Retries per package for transient errors
+            backoff: Base delay in seconds before the first retry; doubles on each retry
+            show_output: Whether to print each package's npm output when it finishes
+            
+        Returns:
+            Dictionary mapping package name to PackagePublishResult, in completion order
+        """
+        if packages is None:
+            packages = self.list_packages()
+        versions = dict(packages)
+        packages_dir = workspace_dir / "packages" / NPM_SCOPE
+        dependencies = self.get_package_dependencies(packages_dir, list(versions))
+        # Fail early on cycles instead of leaving packages waiting forever
+        self.dependency_levels(dependencies)
+        
+        results: Dict[str, PackagePublishResult] = {}
+        pending = {name: set(deps) for name, deps in dependencies.items()}
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            running = {}
+            while pending or running:
+                for name in sorted(pending):
+                    failed = [dep for dep in pending[name] if dep in results and not results[dep].success]
+                    if failed:
+                        results[name] = PackagePublishResult(
+                            name=name,
+                            version=versions[name],
+                            success=False,
+                            error=f"Not published: dependency {', '.join(failed)} failed"
+                        )
+                        del pending[name]
+                        if show_output:
+                            self._print_package_result(results[name])
+                    elif all(dep in results for dep in pending[name]):
+                        future = pool.submit(self._publish_package, workspace_dir, name,
+                                             versions[name], retries, backoff)
+                        running[future] = name
+                        del pending[name]
                 
-                # Exclude test packages
-                if exclude_test and ('test' in package_name.lower() or package_name.endswith('-test')):
+                if not running:
                     continue
                 
-                package_json = package_dir / "package.json"
-                
-                if package_json.exists():
-                    try:
-                        with open(package_json, 'r') as f:
-                            data = json.load(f)
-                            version = data.get('version', 'unknown')
-                            packages.append((package_name, version))
-                    except (json.JSONDecodeError, IOError):
-                        pass
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[running.pop(future)] = result
+                    if show_output:
+                        self._print_package_result(result)
+        
+        return results
+    
+    def _publish_package(self, workspace_dir: Path, name: str, version: str,
+                         retries: int, backoff: float) -> PackagePublishResult:
+        """Publish one workspace package, retrying transient registry errors"""
+        result = PackagePublishResult(name=name, version=version, success=False)
+        start = time.monotonic()
+        # Pack once; retries publish the same tarball
+        tarball, pack_error = self.pack_package(workspace_dir / "packages" / NPM_SCOPE / name)
+        if tarball is None:
+            result.error = pack_error
+            result.duration = time.monotonic() - start
+            return result
+        for attempt in range(retries + 1):
+            result.attempts = attempt + 1
+            success, stdout, stderr = self.publish_tarball(tarball, cwd=workspace_dir)
+            result.success, result.stdout, result.stderr = success, stdout, stderr
+            if success:
+                result.error = None
+                break
+            result.error = (stderr or "npm publish failed").strip().splitlines()[-1]
+            if attempt == retries or not _TRANSIENT_ERROR.search(f"{stdout or ''}\n{stderr or ''}"):
+                break
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                break
+            # Exponential backoff with jitter so parallel workers do not retry in lockstep
+            time.sleep(backoff * (2 ** attempt) * random.uniform(0.75, 1.25))
+        result.duration = time.monotonic() - start
+        return result
+    
+    @staticmethod
+    def _print_package_result(result: PackagePublishResult) -> None:
+        """Print the npm output of a finished package as one block"""
+        label = f"[{NPM_SCOPE}/{result.name}]"
+        for stream in (result.stdout, result.stderr):
+            for line in (stream or "").rstrip().splitlines():
+                print(f"{label} {line}")
+        status = "published" if result.success else f"failed: {result.error}"
+        if result.attempts:
+            status += f" ({result.attempts} attempt(s), {result.duration:.1f}s)"
+        print(f"{label} {status}")
+    
+    def pack_package(self, package_dir: Path) -> Tuple[Optional[Path], Optional[str]]:
+        """
+        Pack a package into the content-addressed tarball cache
+        
+        Tarballs live in build/npm-cache and are named after the package, its
+        version and a digest of the package directory, so an unchanged package
+        is packed only once and later publishes (retries, other registries)
+        reuse the existing tarball. Only the newest few tarballs per package
+        are kept.
+        
+        Args:
+            package_dir: Package directory containing package.json
+            
+        Returns:
+            Tuple of (tarball path or None, error message or None)
+        """
+        try:
+            with open(package_dir / "package.json", 'r') as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            return None, f"Cannot read {package_dir / 'package.json'}: {e}"
+        
+        # '@zernikalos/zernikalos' -> 'zernikalos-zernikalos', matching npm pack naming
+        base_name = manifest.get('name', package_dir.name).lstrip('@').replace('/', '-')
+        version = manifest.get('version', '0.0.0')
+        digest = self._get_hasher().hash_tree([package_dir.name], package_dir.parent)
+        self._get_hasher().save()
+        tarball = self.tarball_cache_dir / f"{base_name}-{version}-{digest[:16]}.tgz"
+        if tarball.exists():
+            return tarball, None
+        
+        self.tarball_cache_dir.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(dir=self.tarball_cache_dir, prefix=".pack-"))
+        try:
+            success, stdout, stderr = self.run_command(
+                'pack', '--json', '--pack-destination', str(staging_dir), cwd=package_dir
+            )
+            packed = list(staging_dir.glob("*.tgz"))
+            if not success or len(packed) != 1:
+                return None, (stderr or stdout or "npm pack failed").strip()
+            # Atomic: concurrent packs of the same content race harmlessly
+            os.replace(packed[0], tarball)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        
+        self._prune_tarballs(base_name, keep=tarball)
+        return tarball, None
+    
+    def publish_tarball(self, tarball: Path, cwd: Optional[Path] = None,
+                        show_output: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Publish a packed tarball
+        
+        The registry comes from the package's publishConfig and the .npmrc
+        found from `cwd`, exactly as for a workspace publish.
         
-        return packages
+        Args:
+            tarball: Tarball created by pack_package()
+            cwd: Working directory for npm (default: project_root)
+            show_output: Whether to print output to console (default: False)
+            
+        Returns:
+            Tuple of (success: bool, stdout: Optional[str], stderr: Optional[str])
+        """
+        if not tarball.exists():
+            return False, None, f"Tarball not found: {tarball}"
+        return self.run_command('publish', str(tarball), cwd=cwd, show_output=show_output)
+    
+    def _get_hasher(self) -> HashingEngine:
+        if self._hasher is None:
+            self._hasher = HashingEngine(cache_file=self.project_root / DEFAULT_CACHE_PATH)
+        return self._hasher
+    
+    def _prune_tarballs(self, base_name: str, keep: Path) -> None:
+        """Delete all but the newest TARBALLS_PER_PACKAGE tarballs of a package"""
+        pattern = re.compile(rf"^{re.escape(base_name)}-\d[^/]*-[0-9a-f]{{16}}\.tgz$")
+        tarballs = [path for path in self.tarball_cache_dir.glob("*.tgz") if pattern.match(path.name)]
+        tarballs.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in tarballs[TARBALLS_PER_PACKAGE:]:
+            if path != keep:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
     
     def publish_workspace(self, workspace_dir: Path, package_filter: Optional[str] = None, 
                          show_output: bool = True) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -133,8 +437,9 @@ class NpmTool:
                 # Default to main zernikalos package
                 cmd.extend(['--workspace', '@zernikalos/zernikalos'])
             
-            result = subprocess.run(
+            result = tracing.run(
                 cmd,
+                deadline=self.deadline,
                 capture_output=True,
                 text=True,
                 env=env,
@@ -180,8 +485,9 @@ class NpmTool:
             env = self.get_auth_env()
             
             if capture_output:
-                result = subprocess.run(
+                result = tracing.run(
                     cmd,
+                    deadline=self.deadline,
                     capture_output=True,
                     text=True,
                     env=env,
@@ -194,8 +500,9 @@ class NpmTool:
                         print(result.stderr)
                 return result.returncode == 0, result.stdout, result.stderr
             else:
-                result = subprocess.run(
+                result = tracing.run(
                     cmd,
+                    deadline=self.deadline,
                     env=env,
                     cwd=cwd
                 )
@@ -206,6 +513,11 @@ class NpmTool:
             if show_output:
                 print(f"Error: {error_msg}")
             return False, None, error_msg
+        except subprocess.TimeoutExpired as e:
+            error_msg = f"npm {command} did not finish before the deadline"
+            if show_output:
+                print(f"Error: {error_msg}")
+            return False, e.stdout if isinstance(e.stdout, str) else None, error_msg
         except FileNotFoundError:
             error_msg = "npm command not found"
             if show_output:
@@ -0,0 +1,161 @@
+"""
+Package Index
+Cached index of the npm packages produced by the Kotlin/JS build
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .hashing import walk_files
+
+
+_DEPENDENCY_FIELDS = ('dependencies', 'peerDependencies', 'optionalDependencies')
+
+# Entries shared by every index in the process, keyed by packages directory
+_ENTRY_CACHE: Dict[Path, Dict[str, 'PackageEntry']] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+@dataclass
+class PackageEntry:
+    """A package directory and the parts of its package.json that zmanager uses"""
+    name: str  # Directory name, e.g. 'zernikalos'
+    package_name: str  # Name from package.json, e.g. '@zernikalos/zernikalos'
+    version: str
+    path: Path
+    dependencies: Dict[str, str] = field(default_factory=dict)
+    # (directory mtime_ns, package.json mtime_ns, package.json size)
+    signature: Tuple[int, int, int] = (0, 0, 0)
+
+    @property
+    def is_test(self) -> bool:
+        """Whether this is a test package (never published)"""
+        return 'test' in self.name.lower()
+
+    def file_stats(self) -> Tuple[int, int]:
+        """
+        Count the package's files and their total size
+
+        Not cached: the signature only covers the top-level directory and
+        package.json, so nested files may have changed since the entry was read.
+
+        Returns:
+            (file count, total size in bytes)
+        """
+        files = walk_files(self.path)
+        return len(files), sum(st.st_size for _, st in files)
+
+
+class PackageIndex:
+    """
+    Index of packages in a packages directory (e.g. build/js/packages/@zernikalos)
+
+    refresh() scans the directory with os.scandir and only re-reads the
+    package.json of packages whose directory or manifest changed (by mtime or
+    size). File counts and sizes are not part of the index (see
+    PackageEntry.file_stats), as the signature cannot see nested files change.
+    Entries are shared by all indexes of the same directory in the process, so
+    repeated listings during one publish cost a single scandir each.
+    """
+
+    def __init__(self, packages_dir: Path):
+        """
+        Initialize package index
+
+        Args:
+            packages_dir: Directory containing one sub-directory per package
+        """
+        self.packages_dir = packages_dir
+
+    def packages(self, exclude_test: bool = True) -> List[PackageEntry]:
+        """
+        Get indexed packages, refreshing changed entries first
+
+        Args:
+            exclude_test: Whether to exclude test packages (default: True)
+
+        Returns:
+            Packages sorted by directory name
+        """
+        entries = self.refresh()
+        return [entry for name, entry in sorted(entries.items())
+                if not (exclude_test and entry.is_test)]
+
+    def get(self, name: str) -> Optional[PackageEntry]:
+        """
+        Get a single package
+
+        Args:
+            name: Package directory name (e.g., 'zernikalos')
+
+        Returns:
+            PackageEntry or None if the package does not exist
+        """
+        return self.refresh().get(name)
+
+    def refresh(self, force: bool = False) -> Dict[str, PackageEntry]:
+        """
+        Bring the index up to date with the packages directory
+
+        Args:
+            force: Re-read every package even if its signature did not change
+
+        Returns:
+            Dictionary mapping directory name to PackageEntry
+        """
+        with _CACHE_LOCK:
+            cached = {} if force else _ENTRY_CACHE.get(self.packages_dir, {})
+            entries: Dict[str, PackageEntry] = {}
+            try:
+                with os.scandir(self.packages_dir) as it:
+                    dirs = [entry for entry in it if entry.is_dir()]
+            except OSError:
+                dirs = []
+
+            for dir_entry in dirs:
+                try:
+                    manifest_stat = os.stat(os.path.join(dir_entry.path, "package.json"))
+                    signature = (dir_entry.stat().st_mtime_ns, manifest_stat.st_mtime_ns, manifest_stat.st_size)
+                except OSError:
+                    continue
+
+                previous = cached.get(dir_entry.name)
+                if previous is not None and previous.signature == signature:
+                    entries[dir_entry.name] = previous
+                    continue
+
+                entry = self._read_package(Path(dir_entry.path), signature)
+                if entry is not None:
+                    entries[dir_entry.name] = entry
+
+            _ENTRY_CACHE[self.packages_dir] = entries
+            return entries
+
+    @staticmethod
+    def _read_package(path: Path, signature: Tuple[int, int, int]) -> Optional[PackageEntry]:
+        try:
+            with open(path / "package.json", 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        dependencies: Dict[str, str] = {}
+        for dep_field in _DEPENDENCY_FIELDS:
+            deps = data.get(dep_field)
+            if isinstance(deps, dict):
+                dependencies.update(deps)
+
+        return PackageEntry(
+            name=path.name,
+            package_name=data.get('name', path.name),
+            version=data.get('version', 'unknown'),
+            path=path,
+            dependencies=dependencies,
+            signature=signature
+        )
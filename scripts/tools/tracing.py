@@ -0,0 +1,247 @@
+"""
+Tracing
+Span-based timing instrumentation with Chrome trace-event output
+"""
+
+import functools
+import json
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+# Command line arguments containing any of these are redacted in traces
+_SECRET_MARKERS = ('token', 'password', 'secret')
+
+
+class Span:
+    """A single timed operation; extra details go into args"""
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def set(self, **args) -> None:
+        """Attach extra details (e.g. exit_code) to the span"""
+        self.args.update(args)
+
+
+class Tracer:
+    """
+    Collects spans and writes them as a Chrome trace-event JSON file
+
+    Each span records wall time plus the CPU time consumed by child processes
+    that finished during the span (from `resource.getrusage(RUSAGE_CHILDREN)`).
+    Child CPU time is process-wide, so spans running concurrently in different
+    threads may attribute each other's children. Tracing is disabled by
+    default and costs next to nothing until enable() is called.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._thread_ids: Dict[int, int] = {}
+
+    def enable(self) -> None:
+        """Start collecting spans"""
+        with self._lock:
+            self.enabled = True
+            self._events = []
+            self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "step", **args) -> Iterator[Span]:
+        """
+        Time a block of code
+
+        Args:
+            name: Span name shown in the trace viewer
+            category: Span category (e.g., 'step', 'subprocess')
+            **args: Extra details recorded with the span
+
+        Yields:
+            Span that can be annotated with set()
+        """
+        span = Span(name, category, args)
+        if not self.enabled:
+            yield span
+            return
+
+        cpu_before = _children_cpu()
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            end = time.perf_counter()
+            cpu_after = _children_cpu()
+            if cpu_before is not None and cpu_after is not None:
+                span.set(
+                    child_cpu_user_s=round(cpu_after[0] - cpu_before[0], 6),
+                    child_cpu_sys_s=round(cpu_after[1] - cpu_before[1], 6)
+                )
+            self._record(span, start, end)
+
+    def _record(self, span: Span, start: float, end: float) -> None:
+        with self._lock:
+            ident = threading.get_ident()
+            tid = self._thread_ids.setdefault(ident, len(self._thread_ids) + 1)
+            self._events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((start - self._origin) * 1e6, 1),
+                'dur': round((end - start) * 1e6, 1),
+                'pid': os.getpid(),
+                'tid': tid,
+                'args': span.args,
+            })
+
+    def events(self) -> List[Dict[str, Any]]:
+        """
+        Get recorded events
+
+        Returns:
+            Copy of the recorded trace events
+        """
+        with self._lock:
+            return list(self._events)
+
+    def write(self, path: Path) -> None:
+        """
+        Write recorded spans as a Chrome trace-event file
+
+        The file can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+        Args:
+            path: Output file
+        """
+        trace = {
+            'traceEvents': sorted(self.events(), key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(trace, f, indent=1, default=str)
+
+
+def _children_cpu() -> Optional[tuple]:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime, usage.ru_stime
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer
+
+    Returns:
+        Shared Tracer instance
+    """
+    return _tracer
+
+
+def span(name: str, category: str = "step", **args):
+    """Shortcut for get_tracer().span(...)"""
+    return _tracer.span(name, category, **args)
+
+
+def traced(name: str, category: str = "step"):
+    """
+    Decorator that records every call of a function as a span
+
+    Args:
+        name: Span name
+        category: Span category
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _tracer.span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def redact_command(cmd: List[str]) -> List[str]:
+    """
+    Hide secrets (tokens, passwords) in a command line
+
+    Args:
+        cmd: Command and arguments
+
+    Returns:
+        Command with secret values replaced by '***'
+    """
+    redacted = []
+    for arg in cmd:
+        arg = str(arg)
+        if any(marker in arg.lower() for marker in _SECRET_MARKERS) and '=' in arg:
+            arg = arg.split('=', 1)[0] + '=***'
+        redacted.append(arg)
+    return redacted
+
+
+def run(cmd: List[str], deadline: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Drop-in replacement for subprocess.run that records a span
+
+    The span is named after the program and its first argument and records
+    the (redacted) command line and exit code. Exceptions propagate unchanged.
+
+    Args:
+        cmd: Command and arguments
+        deadline: Optional time.monotonic() value by which the command must finish;
+                  it becomes (or shortens) the timeout, so the process is killed when it passes
+        **kwargs: Passed to subprocess.run
+
+    Returns:
+        CompletedProcess from subprocess.run
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline has already passed or passes while running
+    """
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(cmd, 0)
+        timeout = kwargs.get('timeout')
+        kwargs['timeout'] = remaining if timeout is None else min(timeout, remaining)
+
+    if not _tracer.enabled:
+        return subprocess.run(cmd, **kwargs)
+
+    program = Path(str(cmd[0])).name
+    label = f"{program} {cmd[1]}" if len(cmd) > 1 else program
+    with _tracer.span(label, "subprocess", cmd=redact_command(cmd)) as s:
+        try:
+            result = subprocess.run(cmd, **kwargs)
+        except subprocess.CalledProcessError as e:
+            s.set(exit_code=e.returncode)
+            raise
+        except subprocess.TimeoutExpired:
+            s.set(exit_code=None, timed_out=True)
+            raise
+        s.set(exit_code=result.returncode)
+        return result
@@ -0,0 +1,629 @@
+"""
+ZKO Reader
+Lazy reader for .zko asset files (protobuf-encoded ZkoFormat)
+"""
+
+import mmap
+import os
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Protobuf wire types
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LEN = 2
+WIRE_FIXED32 = 5
+
+# ZkoFormat fields (@ProtoNumber in src/commonMain/kotlin/zernikalos/loader/ZkoFormat.kt)
+ZKO_FIELDS: Dict[int, str] = {
+    1: "header",
+    2: "components",
+    3: "objects",
+    4: "hierarchy",
+    5: "actions",
+}
+ZKO_HEADER = 1
+ZKO_COMPONENTS = 2
+ZKO_OBJECTS = 3
+ZKO_HIERARCHY = 4
+ZKO_ACTIONS = 5
+
+# ZkoComponentCollection fields
+COMPONENT_MESHES = 1
+COMPONENT_TEXTURES = 2
+
+# ZkoObjectProtoDef: type (ZObjectType ordinal), refId, isReference, then one field per object type
+OBJECT_TYPES = ["SCENE", "GROUP", "MODEL", "CAMERA", "SKELETON", "LIGHT"]
+OBJECT_TYPE_FIELDS: Dict[str, int] = {
+    "SCENE": 100,
+    "GROUP": 101,
+    "MODEL": 102,
+    "CAMERA": 103,
+    "SKELETON": 104,
+    "LIGHT": 106,
+}
+
+# ZObject fields are refId=1, name=2, transform=3; ZModel adds these
+MODEL_MESH = 4
+MODEL_MATERIAL = 6
+MODEL_SKELETON = 7
+MATERIAL_TEXTURE = 100  # ZMaterialData.texture
+SKELETON_REF_ID = 2  # ZSkeletonProtoRef.refId
+HIERARCHY_CHILDREN = 100  # ZkoHierarchyNode.children
+
+ZKO_VERSION_SOURCE = Path("src") / "commonMain" / "kotlin" / "zernikalos" / "loader" / "ZkoVersion.kt"
+_ZKO_VERSION_CONST = re.compile(r'const\s+val\s+ZKO_VERSION\s*=\s*"([^"]*)"')
+
+
+class ZkoFormatError(Exception):
+    """Raised when a .zko file is not valid protobuf or does not match ZkoFormat"""
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(f"{message} (at byte {offset})")
+        self.message = message
+        self.offset = offset
+
+
+@dataclass
+class ZkoField:
+    """A protobuf field located in the file; offsets are absolute"""
+    number: int
+    wire_type: int
+    offset: int  # Offset of the field tag
+    start: int  # Offset of the value (the payload, for length-delimited fields)
+    end: int  # Offset just past the value
+    value: int = 0  # Decoded value of varint and fixed-size fields
+
+    @property
+    def size(self) -> int:
+        """Bytes taken by the field, including its tag and length prefix"""
+        return self.end - self.offset
+
+
+@dataclass
+class ZkoIssue:
+    """A structural problem that would make the engine reject the file"""
+    message: str
+    offset: Optional[int] = None
+
+
+@dataclass
+class ZkoSection:
+    """All occurrences of one top-level ZkoFormat field"""
+    name: str
+    number: int
+    count: int
+    offset: int  # Offset of the first occurrence
+    size: int  # Total bytes of all occurrences
+
+
+@dataclass
+class ZkoObjectSummary:
+    """An entry of ZkoFormat.objects"""
+    index: int
+    offset: int
+    size: int
+    type: str
+    ref_id: str
+    is_reference: bool
+    name: Optional[str] = None
+    payload_field: Optional[int] = None  # Field holding the object (e.g. 102 for a model)
+    mesh_ref: Optional[str] = None
+    texture_ref: Optional[str] = None
+    skeleton_ref: Optional[str] = None
+
+
+@dataclass
+class ZkoComponentSummary:
+    """A mesh or texture of ZkoFormat.components"""
+    kind: str  # 'mesh' or 'texture'
+    index: int
+    offset: int
+    size: int
+    ref_id: str
+
+
+@dataclass
+class ZkoHierarchySummary:
+    """Shape of ZkoFormat.hierarchy"""
+    offset: int
+    size: int
+    root_ref: str
+    node_count: int
+    max_depth: int
+    refs: List[str] = field(default_factory=list)  # Depth-first order
+
+
+@dataclass
+class ZkoActionSummary:
+    """An entry of ZkoFormat.actions (ZSkeletalAction)"""
+    index: int
+    offset: int
+    size: int
+    name: str
+    duration: float
+    tracks: int
+
+
+@dataclass
+class ZkoReport:
+    """Result of inspecting a .zko file"""
+    path: str
+    file_size: int
+    version: Optional[str] = None
+    expected_version: Optional[str] = None
+    compatible: Optional[bool] = None  # None when no expected version was given
+    sections: List[ZkoSection] = field(default_factory=list)
+    objects: List[ZkoObjectSummary] = field(default_factory=list)
+    components: List[ZkoComponentSummary] = field(default_factory=list)
+    hierarchy: Optional[ZkoHierarchySummary] = None
+    actions: List[ZkoActionSummary] = field(default_factory=list)
+    issues: List[ZkoIssue] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the engine would load the file (structure and version)"""
+        return not self.issues and self.compatible is not False
+
+
+def read_varint(buf, pos: int, end: int) -> Tuple[int, int]:
+    """
+    Decode a base-128 varint
+
+    Args:
+        buf: Buffer (bytes, memoryview or mmap)
+        pos: Offset of the first byte
+        end: Offset the varint must not reach past
+
+    Returns:
+        Tuple of (value, offset after the varint)
+
+    Raises:
+        ZkoFormatError: If the varint is truncated or longer than 10 bytes
+    """
+    start = pos
+    result = 0
+    shift = 0
+    while pos < end:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 70:
+            raise ZkoFormatError("varint longer than 10 bytes", start)
+    raise ZkoFormatError("truncated varint", start)
+
+
+def iter_fields(buf, start: int, end: int) -> Iterator[ZkoField]:
+    """
+    Iterate over the fields of a protobuf message without decoding payloads
+
+    Length-delimited fields (strings, bytes, nested messages) are only located,
+    so skipping a multi-megabyte buffer costs the same as skipping a short one.
+
+    Args:
+        buf: Buffer holding the message
+        start: Offset of the first field
+        end: Offset just past the message
+
+    Yields:
+        ZkoField for each field, in file order
+
+    Raises:
+        ZkoFormatError: On malformed tags, truncated values or unsupported wire types
+    """
+    pos = start
+    while pos < end:
+        offset = pos
+        key, pos = read_varint(buf, pos, end)
+        number, wire_type = key >> 3, key & 0x7
+        if number == 0:
+            raise ZkoFormatError("invalid field number 0", offset)
+
+        if wire_type == WIRE_VARINT:
+            value, value_end = read_varint(buf, pos, end)
+            yield ZkoField(number, wire_type, offset, pos, value_end, value)
+            pos = value_end
+        elif wire_type == WIRE_LEN:
+            length, value_start = read_varint(buf, pos, end)
+            value_end = value_start + length
+            if value_end > end:
+                raise ZkoFormatError(
+                    f"field {number} declares {length} bytes but only {end - value_start} remain", offset
+                )
+            yield ZkoField(number, wire_type, offset, value_start, value_end)
+            pos = value_end
+        elif wire_type in (WIRE_FIXED32, WIRE_FIXED64):
+            width = 4 if wire_type == WIRE_FIXED32 else 8
+            if pos + width > end:
+                raise ZkoFormatError(f"truncated fixed{width * 8} field {number}", offset)
+            value = int.from_bytes(buf[pos:pos + width], "little")
+            yield ZkoField(number, wire_type, offset, pos, pos + width, value)
+            pos += width
+        else:
+            raise ZkoFormatError(f"unsupported wire type {wire_type} for field {number}", offset)
+
+
+def to_signed(value: int) -> int:
+    """Interpret a varint as a signed 64-bit integer (kotlinx encodes negative Ints this way)"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def to_float(value: int) -> float:
+    """Interpret a fixed32 field as a float"""
+    return struct.unpack("<f", value.to_bytes(4, "little"))[0]
+
+
+def parse_semver(version: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a version the way ZSemVer.parse does
+
+    Args:
+        version: Version string (X.Y.Z)
+
+    Returns:
+        Tuple of (major, minor, patch), or None if the engine would reject it
+    """
+    parts = version.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+
+
+def is_compatible(expected: str, actual: str) -> bool:
+    """
+    Check a file version against the engine version (ZSemVer.isCompatibleWith)
+
+    Args:
+        expected: Engine ZKO version
+        actual: Version from the file header
+
+    Returns:
+        True if major and minor versions match
+    """
+    expected_parts = parse_semver(expected)
+    actual_parts = parse_semver(actual)
+    if expected_parts is None or actual_parts is None:
+        return False
+    return expected_parts[:2] == actual_parts[:2]
+
+
+def get_engine_zko_version(project_root: Path) -> Optional[str]:
+    """
+    Read ZKO_VERSION from the engine sources
+
+    Args:
+        project_root: Root directory of the project
+
+    Returns:
+        Version string or None if the source file is missing
+    """
+    try:
+        match = _ZKO_VERSION_CONST.search((project_root / ZKO_VERSION_SOURCE).read_text(encoding="utf-8"))
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
+class ZkoReader:
+    """
+    Memory-mapped, lazy view of a .zko file
+
+    Only the fields that are asked for are decoded; everything else is
+    skipped by its length prefix, so inspecting a large asset touches a
+    handful of pages rather than the mesh and texture data. Use as a context
+    manager (or call close()) to unmap the file.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and map a .zko file
+
+        Args:
+            path: Path to the .zko file
+
+        Raises:
+            OSError: If the file cannot be opened or mapped
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            # mmap cannot map empty files
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        except OSError:
+            self._file.close()
+            raise
+        self.buf = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        self._fields: Optional[List[ZkoField]] = None
+
+    def __enter__(self) -> 'ZkoReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the file"""
+        self.buf.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Arrays still view the mapping; it is unmapped once they are freed
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def fields(self) -> List[ZkoField]:
+        """
+        Get the top-level ZkoFormat fields (cached)
+
+        Raises:
+            ZkoFormatError: If the top-level structure is malformed
+        """
+        if self._fields is None:
+            self._fields = list(iter_fields(self.buf, 0, self.size))
+        return self._fields
+
+    def children(self, parent: ZkoField) -> Iterator[ZkoField]:
+        """
+        Iterate over the fields of a nested message
+
+        Raises:
+            ZkoFormatError: If the field is not length-delimited or the message is malformed
+        """
+        if parent.wire_type != WIRE_LEN:
+            raise ZkoFormatError(f"field {parent.number} is not a message", parent.offset)
+        return iter_fields(self.buf, parent.start, parent.end)
+
+    def string(self, value: ZkoField) -> str:
+        """Decode a length-delimited field as UTF-8 text"""
+        return bytes(self.buf[value.start:value.end]).decode("utf-8", errors="replace")
+
+    def find(self, parent: Optional[ZkoField], number: int) -> Optional[ZkoField]:
+        """
+        Get the last occurrence of a field (protobuf semantics for singular fields)
+
+        Args:
+            parent: Message to search, or None for the top level
+            number: Field number
+
+        Returns:
+            The field, or None if absent
+        """
+        found = None
+        for child in (self.fields() if parent is None else self.children(parent)):
+            if child.number == number:
+                found = child
+        return found
+
+    def _ref_id(self, message: ZkoField, number: int = 1) -> Optional[str]:
+        """Read the string id of a component message, stopping at the first match"""
+        for child in self.children(message):
+            if child.number == number and child.wire_type == WIRE_LEN:
+                return self.string(child)
+        return None
+
+    def version(self) -> Optional[str]:
+        """
+        Get ZkoHeader.version
+
+        Returns:
+            Version string, or None if the file has no header
+        """
+        header = self.find(None, ZKO_HEADER)
+        if header is None:
+            return None
+        version = self.find(header, 1)
+        return self.string(version) if version is not None and version.wire_type == WIRE_LEN else ""
+
+    def sections(self) -> List[ZkoSection]:
+        """
+        Group top-level fields by ZkoFormat field
+
+        Returns:
+            Sections in order of first appearance
+        """
+        sections: Dict[int, ZkoSection] = {}
+        for top in self.fields():
+            section = sections.get(top.number)
+            if section is None:
+                name = ZKO_FIELDS.get(top.number, f"field {top.number}")
+                sections[top.number] = ZkoSection(name, top.number, 1, top.offset, top.size)
+            else:
+                section.count += 1
+                section.size += top.size
+        return list(sections.values())
+
+    def objects(self) -> List[ZkoObjectSummary]:
+        """
+        Summarize ZkoFormat.objects without decoding transforms or meshes
+
+        Returns:
+            One summary per object, in file order
+        """
+        return [self._object_summary(index, entry)
+                for index, entry in enumerate(top for top in self.fields() if top.number == ZKO_OBJECTS)]
+
+    def _object_summary(self, index: int, entry: ZkoField) -> ZkoObjectSummary:
+        type_index, ref_id, is_reference, payload = None, "", False, None
+        payload_fields = set(OBJECT_TYPE_FIELDS.values())
+        for child in self.children(entry):
+            if child.number == 1 and child.wire_type == WIRE_VARINT:
+                type_index = child.value
+            elif child.number == 2 and child.wire_type == WIRE_LEN:
+                ref_id = self.string(child)
+            elif child.number == 3 and child.wire_type == WIRE_VARINT:
+                is_reference = bool(child.value)
+            elif child.number in payload_fields and child.wire_type == WIRE_LEN:
+                payload = child
+
+        object_type = OBJECT_TYPES[type_index] if type_index is not None and type_index < len(OBJECT_TYPES) \
+            else f"UNKNOWN({type_index})"
+        summary = ZkoObjectSummary(index, entry.offset, entry.size, object_type, ref_id, is_reference)
+        if payload is None:
+            return summary
+
+        summary.payload_field = payload.number
+        for child in self.children(payload):
+            if child.wire_type != WIRE_LEN:
+                continue
+            if child.number == 2:
+                summary.name = self.string(child)
+            elif payload.number == OBJECT_TYPE_FIELDS["MODEL"]:
+                if child.number == MODEL_MESH:
+                    summary.mesh_ref = self._ref_id(child)
+                elif child.number == MODEL_MATERIAL:
+                    texture = self.find(child, MATERIAL_TEXTURE)
+                    if texture is not None and texture.wire_type == WIRE_LEN:
+                        summary.texture_ref = self._ref_id(texture)
+                elif child.number == MODEL_SKELETON:
+                    summary.skeleton_ref = self._ref_id(child, SKELETON_REF_ID)
+        return summary
+
+    def components(self) -> List[ZkoComponentSummary]:
+        """
+        List the meshes and textures of ZkoFormat.components by ref id and size
+
+        Returns:
+            Meshes then textures, each in file order
+        """
+        meshes, textures = [], []
+        for top in self.fields():
+            if top.number != ZKO_COMPONENTS:
+                continue
+            for child in self.children(top):
+                if child.wire_type != WIRE_LEN:
+                    continue
+                if child.number == COMPONENT_MESHES:
+                    meshes.append(ZkoComponentSummary("mesh", len(meshes), child.offset, child.size,
+                                                      self._ref_id(child) or ""))
+                elif child.number == COMPONENT_TEXTURES:
+                    textures.append(ZkoComponentSummary("texture", len(textures), child.offset, child.size,
+                                                        self._ref_id(child) or ""))
+        return meshes + textures
+
+    def hierarchy(self) -> Optional[ZkoHierarchySummary]:
+        """
+        Walk ZkoFormat.hierarchy (iteratively, so deep trees are fine)
+
+        Returns:
+            Hierarchy summary, or None if the file has no hierarchy
+        """
+        root = self.find(None, ZKO_HIERARCHY)
+        if root is None:
+            return None
+
+        refs, count, max_depth = [], 0, 0
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            count += 1
+            max_depth = max(max_depth, depth)
+            ref_id, children = "", []
+            for child in self.children(node):
+                if child.number == 1 and child.wire_type == WIRE_LEN:
+                    ref_id = self.string(child)
+                elif child.number == HIERARCHY_CHILDREN and child.wire_type == WIRE_LEN:
+                    children.append(child)
+            refs.append(ref_id)
+            stack.extend((child, depth + 1) for child in reversed(children))
+
+        return ZkoHierarchySummary(root.offset, root.size, refs[0], count, max_depth, refs)
+
+    def actions(self) -> List[ZkoActionSummary]:
+        """
+        Summarize ZkoFormat.actions without decoding keyframes
+
+        Returns:
+            One summary per skeletal action, in file order
+        """
+        actions = []
+        for top in self.fields():
+            if top.number != ZKO_ACTIONS:
+                continue
+            name, duration, tracks = "", 0.0, 0
+            for child in self.children(top):
+                if child.number == 1 and child.wire_type == WIRE_LEN:
+                    name = self.string(child)
+                elif child.number == 2 and child.wire_type == WIRE_FIXED32:
+                    duration = to_float(child.value)
+                elif child.number == 10:
+                    tracks += 1
+            actions.append(ZkoActionSummary(len(actions), top.offset, top.size, name, duration, tracks))
+        return actions
+
+    def inspect(self, expected_version: Optional[str] = None) -> ZkoReport:
+        """
+        Check the header and summarize the file
+
+        Structural problems the Kotlin loader would fail on (missing required
+        fields, objects without their payload, hierarchy nodes referring to
+        unknown objects, malformed protobuf) are reported as issues with the
+        byte offset where they were found.
+
+        Args:
+            expected_version: Engine ZKO version to check the header against (optional)
+
+        Returns:
+            ZkoReport
+        """
+        report = ZkoReport(str(self.path), self.size, expected_version=expected_version)
+        try:
+            report.sections = self.sections()
+        except ZkoFormatError as e:
+            report.issues.append(ZkoIssue(e.message, e.offset))
+            return report
+
+        try:
+            report.version = self.version()
+        except ZkoFormatError as e:
+            report.issues.append(ZkoIssue(e.message, e.offset))
+        present = {section.number for section in report.sections}
+        for number in (ZKO_HEADER, ZKO_COMPONENTS, ZKO_HIERARCHY):
+            if number not in present:
+                report.issues.append(ZkoIssue(f"missing required field '{ZKO_FIELDS[number]}' ({number})"))
+
+        if report.version is not None:
+            if parse_semver(report.version) is None:
+                header = self.find(None, ZKO_HEADER)
+                report.issues.append(ZkoIssue(f"invalid header version '{report.version}'", header.offset))
+            if expected_version:
+                report.compatible = is_compatible(expected_version, report.version)
+
+        for part, reader in (("objects", self.objects), ("components", self.components),
+                             ("hierarchy", self.hierarchy), ("actions", self.actions)):
+            try:
+                setattr(report, part, reader())
+            except ZkoFormatError as e:
+                report.issues.append(ZkoIssue(f"{part}: {e.message}", e.offset))
+
+        for obj in report.objects:
+            expected_field = OBJECT_TYPE_FIELDS.get(obj.type)
+            if expected_field is None:
+                report.issues.append(ZkoIssue(f"object '{obj.ref_id}' has unknown type {obj.type}", obj.offset))
+            elif obj.payload_field != expected_field:
+                report.issues.append(ZkoIssue(
+                    f"object '{obj.ref_id}' of type {obj.type} has no payload in field {expected_field}", obj.offset
+                ))
+
+        if report.hierarchy is not None:
+            known = {obj.ref_id for obj in report.objects}
+            missing = [ref for ref in report.hierarchy.refs if ref not in known]
+            if missing:
+                report.issues.append(ZkoIssue(
+                    f"hierarchy refers to {len(missing)} unknown object(s): {', '.join(missing[:5])}"
+                    + (", ..." if len(missing) > 5 else ""),
+                    report.hierarchy.offset
+                ))
+        return report
@@ -0,0 +1,278 @@
+"""
+ZKO Compaction
+Rewrites .zko files without unreferenced components and with identical components merged
+"""
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from .tracing import span
+from .zko import (COMPONENT_MESHES, COMPONENT_TEXTURES, MATERIAL_TEXTURE, MODEL_MATERIAL, MODEL_MESH,
+                  OBJECT_TYPE_FIELDS, WIRE_LEN, ZKO_COMPONENTS, ZKO_OBJECTS, ZkoField, ZkoReader)
+
+
+# Bytes copied from the input per write, bounding memory use for large buffers
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# A piece of the output: literal bytes or a (start, end) range of the input file
+Piece = Union[bytes, Tuple[int, int]]
+
+
+@dataclass
+class ZkoComponentChange:
+    """A mesh or texture removed from the component collection"""
+    kind: str  # 'mesh' or 'texture'
+    ref_id: str
+    size: int
+    reason: str  # 'unreferenced', 'duplicate' or 'shadowed' (same ref id as an earlier component)
+    merged_into: Optional[str] = None  # Ref id of the identical component kept instead
+
+
+@dataclass
+class ZkoCompactionResult:
+    """Outcome of compacting a .zko file"""
+    input_path: str
+    output_path: Optional[str]  # None for dry runs
+    input_size: int
+    output_size: int
+    removed: List[ZkoComponentChange] = field(default_factory=list)
+    rewritten_objects: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Bytes saved"""
+        return self.input_size - self.output_size
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a base-128 varint"""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _piece_size(piece: Piece) -> int:
+    return len(piece) if isinstance(piece, bytes) else piece[1] - piece[0]
+
+
+def _length_delimited(number: int, pieces: List[Piece]) -> List[Piece]:
+    """Wrap pieces in a length-delimited field, re-encoding its length"""
+    length = sum(_piece_size(piece) for piece in pieces)
+    return [encode_varint(number << 3 | WIRE_LEN) + encode_varint(length)] + pieces
+
+
+class ZkoCompactor(ZkoReader):
+    """
+    Compacts a .zko file into a new file
+
+    Meshes and textures of ZkoComponentCollection that no model references
+    (ZModel.mesh.refId, ZModel.material.texture.id) are dropped. Components
+    whose encoded payload, everything but the ref id, is byte-identical are
+    merged by SHA-256: the first one is kept and models referring to the
+    others are rewritten to refer to it, as the engine's ZLoaderContext
+    resolves components by ref id.
+
+    The output is planned as ranges of the memory-mapped input plus the few
+    re-encoded tags and ref ids, then streamed in COPY_CHUNK_SIZE pieces, so
+    memory use does not grow with mesh or texture sizes.
+    """
+
+    def compact(self, output: Optional[Path], prune: bool = True, deduplicate: bool = True) -> ZkoCompactionResult:
+        """
+        Write the compacted file
+
+        Args:
+            output: Output path (may be the input path), or None for a dry run
+            prune: Drop components no object references
+            deduplicate: Merge components with identical payloads
+
+        Returns:
+            ZkoCompactionResult
+
+        Raises:
+            ZkoFormatError: If the input is malformed
+            OSError: If the output cannot be written
+        """
+        with span("zko.compact", "assets", file=str(self.path)) as s:
+            objects = self.objects()
+            referenced = {
+                "mesh": {obj.mesh_ref for obj in objects if obj.mesh_ref is not None},
+                "texture": {obj.texture_ref for obj in objects if obj.texture_ref is not None},
+            }
+            result = ZkoCompactionResult(str(self.path), None, self.size, 0)
+            mapping: Dict[str, Dict[str, str]] = {"mesh": {}, "texture": {}}
+            # Plan the components first: objects may precede them and need the final ref id mapping
+            collections = self._components([top for top in self.fields()
+                                            if top.number == ZKO_COMPONENTS and top.wire_type == WIRE_LEN],
+                                           referenced, mapping, result, prune, deduplicate)
+            rules = self._object_rules(mapping) if mapping["mesh"] or mapping["texture"] else None
+
+            pieces: List[Piece] = []
+            for top in self.fields():
+                if top.offset in collections:
+                    pieces.extend(_length_delimited(top.number, collections[top.offset]))
+                elif top.number == ZKO_OBJECTS and top.wire_type == WIRE_LEN and rules:
+                    rewritten = self._rewrite(top, rules)
+                    if rewritten is None:
+                        pieces.append((top.offset, top.end))
+                    else:
+                        pieces.extend(_length_delimited(top.number, rewritten))
+                        result.rewritten_objects += 1
+                else:
+                    pieces.append((top.offset, top.end))
+
+            result.output_size = sum(_piece_size(piece) for piece in pieces)
+            if output is not None:
+                self._write(Path(output), pieces)
+                result.output_path = str(output)
+            s.set(saved=result.saved, removed=len(result.removed))
+        return result
+
+    def _components(self, collections: List[ZkoField], referenced: Dict[str, set],
+                    mapping: Dict[str, Dict[str, str]], result: ZkoCompactionResult, prune: bool,
+                    deduplicate: bool) -> Dict[int, List[Piece]]:
+        """
+        Plan the kept fields of each ZkoComponentCollection, filling the ref id mapping of merged components
+
+        Returns:
+            Offset of each collection field to the pieces of its new payload
+        """
+        kinds = {COMPONENT_MESHES: "mesh", COMPONENT_TEXTURES: "texture"}
+        seen: Dict[str, set] = {"mesh": set(), "texture": set()}
+        hashes: Dict[Tuple[str, bytes], str] = {}
+        plans: Dict[int, List[Piece]] = {}
+        # Repeated message fields are merged by protobuf, so all collections share one namespace
+        for collection in collections:
+            pieces = plans[collection.offset] = []
+            for child in self.children(collection):
+                kind = kinds.get(child.number) if child.wire_type == WIRE_LEN else None
+                if kind is None:
+                    pieces.append((child.offset, child.end))
+                    continue
+
+                ref_id = self._ref_id(child) or ""
+                if ref_id in seen[kind]:
+                    # The loader only ever uses the first component with a given ref id
+                    result.removed.append(ZkoComponentChange(kind, ref_id, child.size, "shadowed"))
+                    continue
+                seen[kind].add(ref_id)
+                if prune and ref_id not in referenced[kind]:
+                    result.removed.append(ZkoComponentChange(kind, ref_id, child.size, "unreferenced"))
+                    continue
+                if deduplicate:
+                    original = hashes.setdefault((kind, self._payload_digest(child)), ref_id)
+                    if original != ref_id:
+                        mapping[kind][ref_id] = original
+                        result.removed.append(ZkoComponentChange(kind, ref_id, child.size, "duplicate", original))
+                        continue
+                pieces.append((child.offset, child.end))
+        return plans
+
+    def _payload_digest(self, component: ZkoField) -> bytes:
+        """SHA-256 of a component's fields other than its ref id (field 1)"""
+        digest = hashlib.sha256()
+        for child in self.children(component):
+            if child.number != 1:
+                for start in range(child.offset, child.end, COPY_CHUNK_SIZE):
+                    digest.update(self.buf[start:min(start + COPY_CHUNK_SIZE, child.end)])
+        return digest.digest()
+
+    @staticmethod
+    def _object_rules(mapping: Dict[str, Dict[str, str]]) -> dict:
+        """Field paths of ZkoObjectProtoDef holding component ref ids, with the mapping for each"""
+        return {
+            OBJECT_TYPE_FIELDS["MODEL"]: {
+                MODEL_MESH: {1: mapping["mesh"]},
+                MODEL_MATERIAL: {MATERIAL_TEXTURE: {1: mapping["texture"]}},
+            }
+        }
+
+    def _rewrite(self, message: ZkoField, rules: dict) -> Optional[List[Piece]]:
+        """
+        Re-plan a message with ref ids replaced along the rule paths
+
+        Args:
+            message: Length-delimited field to rewrite
+            rules: Field number to nested rules, or to a {old ref id: new ref id} mapping for string fields
+
+        Returns:
+            Pieces of the message payload, or None if nothing changed
+        """
+        pieces: List[Piece] = []
+        changed = False
+        for child in self.children(message):
+            rule = rules.get(child.number) if child.wire_type == WIRE_LEN else None
+            replacement = None
+            # A mapping of ref ids (str -> str) marks the string field to replace; dicts of dicts go deeper
+            if rule and all(isinstance(value, str) for value in rule.values()):
+                new_ref = rule.get(self.string(child))
+                if new_ref is not None:
+                    replacement = _length_delimited(child.number, [new_ref.encode("utf-8")])
+            elif rule:
+                inner = self._rewrite(child, rule)
+                if inner is not None:
+                    replacement = _length_delimited(child.number, inner)
+
+            if replacement is None:
+                pieces.append((child.offset, child.end))
+            else:
+                pieces.extend(replacement)
+                changed = True
+        return pieces if changed else None
+
+    def _write(self, output: Path, pieces: List[Piece]) -> None:
+        """Stream the planned pieces to a temporary file and move it over the output"""
+        output.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                self._write_pieces(out, pieces)
+            os.replace(tmp_path, output)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _write_pieces(self, out: BinaryIO, pieces: List[Piece]) -> None:
+        run_start, run_end = None, None
+        for piece in pieces + [b""]:
+            if isinstance(piece, tuple) and piece[0] == run_end:
+                run_end = piece[1]
+                continue
+            # Flush the current run of contiguous input ranges
+            if run_start is not None:
+                for start in range(run_start, run_end, COPY_CHUNK_SIZE):
+                    out.write(self.buf[start:min(start + COPY_CHUNK_SIZE, run_end)])
+            if isinstance(piece, tuple):
+                run_start, run_end = piece
+            else:
+                run_start, run_end = None, None
+                out.write(piece)
+
+
+def compact_zko(input_path: Path, output_path: Optional[Path], prune: bool = True,
+                deduplicate: bool = True) -> ZkoCompactionResult:
+    """
+    Compact a .zko file
+
+    Args:
+        input_path: .zko file to compact
+        output_path: Where to write the result (may equal input_path), or None for a dry run
+        prune: Drop components no object references
+        deduplicate: Merge components with identical payloads
+
+    Returns:
+        ZkoCompactionResult
+
+    Raises:
+        ZkoFormatError: If the input is malformed
+        OSError: If a file cannot be read or written
+    """
+    with ZkoCompactor(input_path) as compactor:
+        return compactor.compact(output_path, prune, deduplicate)
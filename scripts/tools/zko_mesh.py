@@ -0,0 +1,277 @@
+"""
+ZKO Mesh Buffers
+Zero-copy NumPy views of the mesh attribute buffers stored in .zko files
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .zko import (COMPONENT_MESHES, WIRE_LEN, WIRE_VARINT, ZKO_COMPONENTS, ZkoField,
+                  ZkoFormatError, ZkoReader, to_signed)
+
+try:
+    import numpy
+except ImportError:  # Optional: attribute metadata is still available without it
+    numpy = None
+
+
+# ZBaseType (@ProtoNumber values) -> (name, little-endian NumPy dtype or None, byte size)
+BASE_TYPES: Dict[int, Tuple[str, Optional[str], int]] = {
+    0: ("NONE", None, 0),
+    1: ("BYTE", "<i1", 1),
+    2: ("UNSIGNED_BYTE", "<u1", 1),
+    3: ("SHORT", "<i2", 2),
+    4: ("UNSIGNED_SHORT", "<u2", 2),
+    5: ("INT", "<i4", 4),
+    6: ("UNSIGNED_INT", "<u4", 4),
+    7: ("FLOAT", "<f4", 4),
+    8: ("DOUBLE", "<f8", 8),
+    9: ("TEXTURE", None, 0),
+}
+
+# ZFormatType (@ProtoNumber values) -> (name, components per element), as in ZDataType.size
+FORMAT_TYPES: Dict[int, Tuple[str, int]] = {
+    0: ("NONE", 0),
+    1: ("SCALAR", 1),
+    2: ("VEC2", 2),
+    3: ("VEC3", 3),
+    4: ("VEC4", 4),
+    5: ("MAT2", 4),
+    6: ("MAT3", 9),
+    7: ("MAT4", 16),
+    8: ("TEXTURE", 0),
+    9: ("QUATERNION", 4),
+    10: ("EULER", 3),
+    11: ("RGBA", 4),
+}
+
+# ZDrawMode ordinals
+DRAW_MODES = ["POINTS", "LINES", "TRIANGLES", "LINE_STRIP", "TRIANGLE_STRIP"]
+
+# ZRawMeshData fields
+MESH_REF_ID = 1
+MESH_DRAW_MODE = 11
+MESH_BUFFER_KEYS = 101
+MESH_BUFFER_CONTENTS = 102
+
+
+@dataclass
+class MeshAttribute:
+    """One attribute buffer of a mesh (a ZBufferKey resolved against its ZBufferContent)"""
+    name: str
+    base_type: str  # ZBaseType name, e.g. 'FLOAT'
+    format: str  # ZFormatType name, e.g. 'VEC3'
+    components: int
+    count: int
+    normalized: bool
+    is_index: bool
+    buffer_id: int
+    offset: int  # Absolute file offset of the first element
+    stride: int  # Bytes from one element to the next
+    element_size: int  # Bytes per element
+    data: Any = None  # NumPy view (count, components), or (count,) for scalars; None without NumPy
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of attribute data (excluding interleaved gaps)"""
+        return self.count * self.element_size
+
+
+@dataclass
+class MeshBuffers:
+    """The attribute buffers of one mesh in ZkoComponentCollection.meshes"""
+    ref_id: str
+    draw_mode: str
+    offset: int
+    size: int
+    attributes: Dict[str, MeshAttribute] = field(default_factory=dict)
+
+    @property
+    def index(self) -> Optional[MeshAttribute]:
+        """The index buffer, if any"""
+        return next((attribute for attribute in self.attributes.values() if attribute.is_index), None)
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices (elements of the first non-index attribute)"""
+        return next((attribute.count for attribute in self.attributes.values() if not attribute.is_index), 0)
+
+    def bounds(self, attribute: str = "position") -> Optional[Tuple[List[float], List[float]]]:
+        """
+        Axis-aligned bounding box of an attribute, computed in NumPy
+
+        Args:
+            attribute: Attribute name (default: 'position')
+
+        Returns:
+            Tuple of (min, max) per component, or None if unavailable
+        """
+        buffer = self.attributes.get(attribute)
+        if buffer is None or buffer.data is None or buffer.count == 0:
+            return None
+        data = buffer.data.reshape(buffer.count, -1)
+        return data.min(axis=0).tolist(), data.max(axis=0).tolist()
+
+
+class ZkoMeshReader(ZkoReader):
+    """
+    Exposes mesh attribute buffers of a .zko file as NumPy arrays without copying
+
+    Each array is a read-only view into the memory-mapped file at the offset
+    of its ZBufferContent data (plus the key's offset), with the dtype of the
+    ZDataType base type. Tightly packed buffers use numpy.frombuffer;
+    interleaved ones (stride larger than the element) are strided views of the
+    same memory. Arrays stay valid after close(): the mapping is released when
+    the last view is freed.
+    """
+
+    def meshes(self) -> Iterator[MeshBuffers]:
+        """
+        Iterate over ZkoComponentCollection.meshes
+
+        Yields:
+            MeshBuffers per mesh, in file order
+
+        Raises:
+            ZkoFormatError: If a mesh is malformed or a buffer lies outside its content
+        """
+        for top in self.fields():
+            if top.number != ZKO_COMPONENTS:
+                continue
+            for child in self.children(top):
+                if child.number == COMPONENT_MESHES and child.wire_type == WIRE_LEN:
+                    yield self._mesh(child)
+
+    def _mesh(self, entry: ZkoField) -> MeshBuffers:
+        ref_id, draw_mode, keys, contents = "", DRAW_MODES[2], [], {}
+        for child in self.children(entry):
+            if child.number == MESH_REF_ID and child.wire_type == WIRE_LEN:
+                ref_id = self.string(child)
+            elif child.number == MESH_DRAW_MODE and child.wire_type == WIRE_VARINT:
+                draw_mode = DRAW_MODES[child.value] if child.value < len(DRAW_MODES) else f"UNKNOWN({child.value})"
+            elif child.number == MESH_BUFFER_KEYS and child.wire_type == WIRE_LEN:
+                keys.append(child)
+            elif child.number == MESH_BUFFER_CONTENTS and child.wire_type == WIRE_LEN:
+                content_id, data = self._content(child)
+                # ZRawMeshData resolves keys with the first content of a given id
+                contents.setdefault(content_id, data)
+
+        mesh = MeshBuffers(ref_id, draw_mode, entry.offset, entry.size)
+        for key in keys:
+            attribute = self._attribute(key, contents)
+            if attribute is not None:
+                mesh.attributes[attribute.name] = attribute
+        return mesh
+
+    def _content(self, entry: ZkoField) -> Tuple[int, Optional[ZkoField]]:
+        """Read a ZBufferContent: (id, dataArray field)"""
+        content_id, data = -1, None
+        for child in self.children(entry):
+            if child.number == 1 and child.wire_type == WIRE_VARINT:
+                content_id = to_signed(child.value)
+            elif child.number == 2 and child.wire_type == WIRE_LEN:
+                data = child
+        return content_id, data
+
+    def _attribute(self, key: ZkoField, contents: Dict[int, Optional[ZkoField]]) -> Optional[MeshAttribute]:
+        """Resolve a ZBufferKey; keys without content are dropped, as the engine does"""
+        # count=5, normalized=6, offset=7, stride=8, isIndexBuffer=9, bufferId=10 (ZBufferKeyData)
+        values = {5: -1, 6: 0, 7: -1, 8: -1, 9: 0, 10: -1}
+        name, base, fmt = "", 0, 0
+        for child in self.children(key):
+            if child.wire_type == WIRE_VARINT and child.number in values:
+                values[child.number] = to_signed(child.value)
+            elif child.number == 3 and child.wire_type == WIRE_LEN:
+                name = self.string(child)
+            elif child.number == 2 and child.wire_type == WIRE_LEN:
+                for part in self.children(child):
+                    if part.number == 1 and part.wire_type == WIRE_VARINT:
+                        base = part.value
+                    elif part.number == 2 and part.wire_type == WIRE_VARINT:
+                        fmt = part.value
+
+        content = contents.get(values[10])
+        if content is None:
+            return None
+
+        base_name, dtype, byte_size = BASE_TYPES.get(base, (f"UNKNOWN({base})", None, 0))
+        format_name, components = FORMAT_TYPES.get(fmt, (f"UNKNOWN({fmt})", 0))
+        element_size = byte_size * components
+        # Offsets and strides are in bytes; a stride of 0 means tightly packed
+        offset = max(values[7], 0)
+        stride = values[8] if values[8] > 0 else element_size
+        count = values[5]
+        if count < 0:
+            available = content.end - content.start - offset
+            count = (available - element_size) // stride + 1 if stride and available >= element_size else 0
+
+        attribute = MeshAttribute(
+            name=name,
+            base_type=base_name,
+            format=format_name,
+            components=components,
+            count=count,
+            normalized=bool(values[6]),
+            is_index=bool(values[9]),
+            buffer_id=values[10],
+            offset=content.start + offset,
+            stride=stride,
+            element_size=element_size
+        )
+        if count and attribute.offset + (count - 1) * stride + element_size > content.end:
+            raise ZkoFormatError(
+                f"buffer '{name}' of mesh needs {(count - 1) * stride + element_size} bytes from offset {offset}, "
+                f"content has {content.end - content.start}", key.offset
+            )
+        if numpy is not None and dtype is not None and element_size:
+            attribute.data = self._view(attribute, dtype)
+        return attribute
+
+    def _view(self, attribute: MeshAttribute, dtype: str):
+        """Create a NumPy view of an attribute over the mapped file"""
+        if attribute.count == 0:
+            return numpy.empty((0,) if attribute.components == 1 else (0, attribute.components), dtype=dtype)
+        if attribute.stride == attribute.element_size:
+            array = numpy.frombuffer(self._mmap, dtype=dtype, count=attribute.count * attribute.components,
+                                     offset=attribute.offset)
+            return array if attribute.components == 1 else array.reshape(attribute.count, attribute.components)
+        itemsize = numpy.dtype(dtype).itemsize
+        shape = (attribute.count,) if attribute.components == 1 else (attribute.count, attribute.components)
+        strides = (attribute.stride,) if attribute.components == 1 else (attribute.stride, itemsize)
+        return numpy.ndarray(shape, dtype=dtype, buffer=self._mmap, offset=attribute.offset, strides=strides)
+
+
+def mesh_statistics(path: Path) -> List[Dict[str, Any]]:
+    """
+    Compute per-mesh statistics of a .zko file
+
+    Args:
+        path: .zko file
+
+    Returns:
+        One dictionary per mesh with ref id, draw mode, vertex and index counts,
+        attribute memory and (with NumPy) the position bounding box
+    """
+    stats = []
+    with ZkoMeshReader(path) as reader:
+        for mesh in reader.meshes():
+            index = mesh.index
+            bounds = mesh.bounds()
+            stats.append({
+                "ref_id": mesh.ref_id,
+                "draw_mode": mesh.draw_mode,
+                "vertices": mesh.vertex_count,
+                "indices": index.count if index else 0,
+                "attributes": {
+                    name: {
+                        "type": f"{attribute.base_type}/{attribute.format}",
+                        "count": attribute.count,
+                        "bytes": attribute.nbytes,
+                    }
+                    for name, attribute in mesh.attributes.items()
+                },
+                "bytes": sum(attribute.nbytes for attribute in mesh.attributes.values()),
+                "bounds": {"min": bounds[0], "max": bounds[1]} if bounds else None,
+            })
+    return stats
@@ -0,0 +1,273 @@
+"""
+ZKO Size Attribution
+Attributes every byte of a .zko file to its ZkoFormat field and entity, and checks size budgets
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+from .zko import (COMPONENT_MESHES, COMPONENT_TEXTURES, OBJECT_TYPE_FIELDS, OBJECT_TYPES, WIRE_LEN, WIRE_VARINT,
+                  ZKO_ACTIONS, ZKO_COMPONENTS, ZKO_FIELDS, ZKO_HEADER, ZKO_HIERARCHY, ZKO_OBJECTS, ZkoField,
+                  ZkoReader)
+
+
+# Size categories; their sizes add up to the file size
+SIZE_CATEGORIES = ["header", "meshes", "textures", "components", "objects", "hierarchy", "actions", "other"]
+# Budget keys limiting every single entity of a category
+ENTITY_BUDGETS: Dict[str, str] = {
+    "mesh": "meshes",
+    "texture": "textures",
+    "object": "objects",
+    "action": "actions",
+}
+TOTAL_BUDGET = "total"
+
+# Field names per message (@ProtoNumber values), used for the per-entity breakdown
+HEADER_FIELD_NAMES = {1: "version"}
+MESH_FIELD_NAMES = {1: "refId", 11: "drawMode", 101: "bufferKeys", 102: "bufferContents"}
+TEXTURE_FIELD_NAMES = {1: "id", 100: "dataArray"}
+TEXTURE_FIELD_NAMES.update({number: "settings" for number in range(2, 14)})  # Size, filters, wrap modes...
+OBJECT_FIELD_NAMES = {1: "type", 2: "refId", 3: "isReference"}
+OBJECT_PAYLOAD_FIELD_NAMES = {1: "refId", 2: "name", 3: "transform", 4: "mesh", 6: "material", 7: "skeleton",
+                              8: "skinning"}
+HIERARCHY_FIELD_NAMES = {1: "refId", 100: "children"}
+ACTION_FIELD_NAMES = {1: "name", 2: "duration", 10: "tracks"}
+# Tags and length prefixes of the entity itself (and of its object payload)
+FRAMING = "framing"
+
+_SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$')
+_SIZE_UNITS: Dict[str, int] = {
+    "": 1, "b": 1,
+    "k": 1024, "kib": 1024, "kb": 1000,
+    "m": 1024 ** 2, "mib": 1024 ** 2, "mb": 1000 ** 2,
+    "g": 1024 ** 3, "gib": 1024 ** 3, "gb": 1000 ** 3,
+}
+
+
+@dataclass
+class ZkoSizeEntry:
+    """Bytes taken by one entity (mesh, texture, object, action...) of a .zko file"""
+    category: str
+    name: str  # Ref id, action name or field name
+    index: int
+    offset: int
+    size: int  # Including the entity's own tag and length prefix
+    fields: Dict[str, int] = field(default_factory=dict)  # Bytes per field of the entity
+
+
+@dataclass
+class ZkoBudgetViolation:
+    """A size budget that a file exceeds"""
+    budget: str  # Budget key, e.g. 'textures' or 'texture'
+    limit: int
+    size: int
+    entry: Optional[str] = None  # Entity name for per-entity budgets
+
+
+@dataclass
+class ZkoSizeReport:
+    """Size attribution of a .zko file"""
+    path: str
+    file_size: int
+    categories: Dict[str, int] = field(default_factory=dict)  # Bytes per category, summing to file_size
+    entries: List[ZkoSizeEntry] = field(default_factory=list)  # In file order
+    violations: List[ZkoBudgetViolation] = field(default_factory=list)
+
+    def largest(self, limit: int = 0) -> List[ZkoSizeEntry]:
+        """
+        Get entries sorted by size, largest first
+
+        Args:
+            limit: Maximum number of entries (0 = all)
+        """
+        entries = sorted(self.entries, key=lambda entry: entry.size, reverse=True)
+        return entries[:limit] if limit > 0 else entries
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a byte size such as '512', '300K', '1.5MiB' or '2MB'
+
+    K, M and G (and KiB, MiB, GiB) are powers of 1024; kB, MB and GB are powers of 1000.
+
+    Args:
+        text: Size text
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    match = _SIZE_PATTERN.match(text)
+    unit = match.group(2).lower() if match else None
+    if unit not in _SIZE_UNITS:
+        raise ValueError(f"invalid size '{text}' (examples: 512, 300K, 1.5MiB, 2MB)")
+    return int(float(match.group(1)) * _SIZE_UNITS[unit])
+
+
+def parse_budgets(specs: Mapping[str, object]) -> Dict[str, int]:
+    """
+    Validate size budgets
+
+    Keys are a category (total bytes of all its entities, e.g. 'textures'),
+    an entity kind (bytes of each single entity, e.g. 'texture') or 'total'
+    (the whole file). Values are byte counts or size strings.
+
+    Args:
+        specs: Budget key to size
+
+    Returns:
+        Budget key to size in bytes
+
+    Raises:
+        ValueError: On unknown keys or invalid sizes
+    """
+    budgets = {}
+    for key, value in specs.items():
+        if key != TOTAL_BUDGET and key not in SIZE_CATEGORIES and key not in ENTITY_BUDGETS:
+            known = ", ".join([TOTAL_BUDGET] + SIZE_CATEGORIES + list(ENTITY_BUDGETS))
+            raise ValueError(f"unknown budget '{key}' (use: {known})")
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError(f"invalid size for budget '{key}': {value!r}")
+        budgets[key] = value if isinstance(value, int) else parse_size(value)
+    return budgets
+
+
+def check_budgets(report: ZkoSizeReport, budgets: Mapping[str, int]) -> List[ZkoBudgetViolation]:
+    """
+    Compare a size report against budgets
+
+    Args:
+        report: Size report of a file
+        budgets: Budget key to limit in bytes (see parse_budgets)
+
+    Returns:
+        Violations, in budget order
+    """
+    violations = []
+    for key, limit in budgets.items():
+        if key == TOTAL_BUDGET:
+            if report.file_size > limit:
+                violations.append(ZkoBudgetViolation(key, limit, report.file_size))
+        elif key in ENTITY_BUDGETS:
+            violations.extend(ZkoBudgetViolation(key, limit, entry.size, entry.name)
+                              for entry in report.largest()
+                              if entry.category == ENTITY_BUDGETS[key] and entry.size > limit)
+        elif report.categories.get(key, 0) > limit:
+            violations.append(ZkoBudgetViolation(key, limit, report.categories[key]))
+    return violations
+
+
+class ZkoSizeReader(ZkoReader):
+    """
+    Attributes the bytes of a .zko file to ZkoFormat fields and their entities
+
+    Every top-level field is assigned to a category: the header, each mesh and
+    texture of the component collection (with the collection's own tags in
+    'components'), each object, the hierarchy and each skeletal action.
+    Unknown fields land in 'other', so the categories always add up to the
+    file size. Only tags and length prefixes are read; payloads are skipped.
+    """
+
+    def size_report(self) -> ZkoSizeReport:
+        """
+        Attribute every byte of the file
+
+        Returns:
+            ZkoSizeReport
+
+        Raises:
+            ZkoFormatError: If the file is not valid protobuf
+        """
+        report = ZkoSizeReport(str(self.path), self.size, {category: 0 for category in SIZE_CATEGORIES})
+        counts: Dict[str, int] = {}
+        component_kinds = {COMPONENT_MESHES: ("meshes", MESH_FIELD_NAMES),
+                           COMPONENT_TEXTURES: ("textures", TEXTURE_FIELD_NAMES)}
+
+        def add(category: str, name: str, entry: ZkoField, fields: Dict[str, int]) -> None:
+            index = counts.get(category, 0)
+            counts[category] = index + 1
+            report.categories[category] += entry.size
+            report.entries.append(ZkoSizeEntry(category, name, index, entry.offset, entry.size, fields))
+
+        for top in self.fields():
+            if top.wire_type != WIRE_LEN:
+                report.categories["other"] += top.size
+            elif top.number == ZKO_HEADER:
+                add("header", "header", top, self._field_sizes(top, HEADER_FIELD_NAMES))
+            elif top.number == ZKO_COMPONENTS:
+                collection = top.size
+                for child in self.children(top):
+                    if child.number in component_kinds and child.wire_type == WIRE_LEN:
+                        category, names = component_kinds[child.number]
+                        add(category, self._ref_id(child) or "", child, self._field_sizes(child, names))
+                        collection -= child.size
+                report.categories["components"] += collection
+            elif top.number == ZKO_OBJECTS:
+                add("objects", self._object_name(top), top, self._object_field_sizes(top))
+            elif top.number == ZKO_HIERARCHY:
+                add("hierarchy", self._ref_id(top) or "", top, self._field_sizes(top, HIERARCHY_FIELD_NAMES))
+            elif top.number == ZKO_ACTIONS:
+                add("actions", self._ref_id(top) or "", top, self._field_sizes(top, ACTION_FIELD_NAMES))
+            else:
+                add("other", ZKO_FIELDS.get(top.number, f"field {top.number}"), top, {})
+        return report
+
+    def _field_sizes(self, message: ZkoField, names: Dict[int, str],
+                     sizes: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """Sum the bytes of a message's fields by name; its own tag and length go to 'framing'"""
+        sizes = {} if sizes is None else sizes
+        sizes[FRAMING] = sizes.get(FRAMING, 0) + message.start - message.offset
+        for child in self.children(message):
+            name = names.get(child.number, f"field {child.number}")
+            sizes[name] = sizes.get(name, 0) + child.size
+        return sizes
+
+    def _object_field_sizes(self, entry: ZkoField) -> Dict[str, int]:
+        """Field sizes of an object, looking into its type-specific payload (ZModel, ZCamera...)"""
+        payload_fields = set(OBJECT_TYPE_FIELDS.values())
+        sizes = {FRAMING: entry.start - entry.offset}
+        for child in self.children(entry):
+            if child.number in payload_fields and child.wire_type == WIRE_LEN:
+                self._field_sizes(child, OBJECT_PAYLOAD_FIELD_NAMES, sizes)
+            else:
+                name = OBJECT_FIELD_NAMES.get(child.number, f"field {child.number}")
+                sizes[name] = sizes.get(name, 0) + child.size
+        return sizes
+
+    def _object_name(self, entry: ZkoField) -> str:
+        """'<TYPE> <refId>' of an object"""
+        type_index, ref_id = None, ""
+        for child in self.children(entry):
+            if child.number == 1 and child.wire_type == WIRE_VARINT:
+                type_index = child.value
+            elif child.number == 2 and child.wire_type == WIRE_LEN:
+                ref_id = self.string(child)
+        object_type = OBJECT_TYPES[type_index] if type_index is not None and type_index < len(OBJECT_TYPES) \
+            else f"UNKNOWN({type_index})"
+        return f"{object_type} {ref_id}"
+
+
+def zko_size_report(path: Path, budgets: Optional[Mapping[str, int]] = None) -> ZkoSizeReport:
+    """
+    Build the size report of a .zko file and check it against budgets
+
+    Args:
+        path: .zko file
+        budgets: Optional budget key to limit in bytes (see parse_budgets)
+
+    Returns:
+        ZkoSizeReport with violations filled in
+
+    Raises:
+        OSError: If the file cannot be read
+        ZkoFormatError: If the file is not valid protobuf
+    """
+    with ZkoSizeReader(path) as reader:
+        report = reader.size_report()
+    if budgets:
+        report.violations = check_budgets(report, budgets)
+    return report
@@ -0,0 +1,204 @@
+"""
+ZKO Validation
+Parallel header and structure checks over directory trees of .zko files
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .hashing import RACY_WINDOW_NS, walk_files
+from .tracing import span
+from .zko import ZkoIssue, ZkoReader, is_compatible
+
+
+ZKO_SUFFIX = ".zko"
+# Default result cache location, relative to the project root
+DEFAULT_CACHE_PATH = Path("build") / "zmanager" / "zko-validation.json"
+# Below this many files a process pool costs more than it saves
+POOL_MIN_FILES = 16
+
+# Bump whenever the checks change so stale cache entries are discarded
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class ZkoFileCheck:
+    """Validation result of one .zko file"""
+    path: str
+    size: int
+    version: Optional[str] = None
+    compatible: Optional[bool] = None  # None when no expected version was given
+    issues: List[ZkoIssue] = field(default_factory=list)
+    cached: bool = False  # Reused from a previous run (incremental mode)
+
+    @property
+    def status(self) -> str:
+        """'corrupt', 'incompatible' or 'ok'"""
+        if self.issues:
+            return "corrupt"
+        if self.compatible is False:
+            return "incompatible"
+        return "ok"
+
+
+def check_zko_file(path: str) -> Tuple[Optional[str], List[Tuple[str, Optional[int]]]]:
+    """
+    Read the header version and structural issues of a file (process pool worker)
+
+    The result does not depend on the engine version, so it can be cached
+    across ZKO_VERSION changes.
+
+    Args:
+        path: .zko file
+
+    Returns:
+        Tuple of (header version or None, list of (message, byte offset))
+    """
+    try:
+        with ZkoReader(Path(path)) as reader:
+            report = reader.inspect()
+    except OSError as e:
+        return None, [(f"cannot read file: {e.strerror or e}", None)]
+    return report.version, [(issue.message, issue.offset) for issue in report.issues]
+
+
+class ZkoCorpusValidator:
+    """
+    Validates every .zko file below a directory
+
+    Files are checked in a process pool when there are enough of them. Results
+    are cached by path and (size, mtime_ns); in incremental mode unchanged
+    files are not opened again. The cache stores the header version rather
+    than the compatibility verdict, so a new ZKO_VERSION re-evaluates every
+    file without reading it.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, max_workers: Optional[int] = None):
+        """
+        Initialize validator
+
+        Args:
+            cache_file: Optional JSON file persisting results between runs
+            max_workers: Process pool size (default: number of CPUs)
+        """
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self._cache: Dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def find_files(root: Path) -> List[Tuple[str, os.stat_result]]:
+        """
+        List .zko files below a directory (or a single file)
+
+        Returns:
+            Sorted list of (path, stat_result)
+        """
+        return [(path, st) for path, st in walk_files(root) if path.lower().endswith(ZKO_SUFFIX)]
+
+    def validate(self, root: Path, expected_version: Optional[str] = None,
+                 incremental: bool = False) -> List[ZkoFileCheck]:
+        """
+        Validate the .zko files below a directory
+
+        Args:
+            root: Directory (or single file) to scan
+            expected_version: Engine ZKO version to check headers against (optional)
+            incremental: Reuse results of files whose size and mtime did not change
+
+        Returns:
+            One ZkoFileCheck per file, sorted by path
+        """
+        files = self.find_files(root)
+        checks: Dict[str, ZkoFileCheck] = {}
+        misses: List[Tuple[str, os.stat_result]] = []
+
+        with self._lock:
+            self._load()
+            for path, st in files:
+                key = os.path.abspath(path)
+                entry = self._cache.get(key) if incremental else None
+                if entry is not None and entry[:2] == [st.st_size, st.st_mtime_ns]:
+                    checks[path] = self._make_check(path, st.st_size, entry[2], entry[3], expected_version, True)
+                else:
+                    misses.append((path, st))
+
+        if misses:
+            with span("zko.validate", "assets", files=len(misses)) as s:
+                paths = [path for path, _ in misses]
+                use_pool = len(paths) >= POOL_MIN_FILES
+                if use_pool:
+                    workers = self.max_workers or os.cpu_count() or 1
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        results = list(pool.map(check_zko_file, paths,
+                                                chunksize=max(1, len(paths) // (workers * 4))))
+                else:
+                    results = [check_zko_file(path) for path in paths]
+                s.set(pool=use_pool)
+
+            racy_limit = time.time_ns() - RACY_WINDOW_NS
+            with self._lock:
+                for (path, st), (version, issues) in zip(misses, results):
+                    checks[path] = self._make_check(path, st.st_size, version, issues, expected_version)
+                    if st.st_mtime_ns < racy_limit:
+                        self._cache[os.path.abspath(path)] = [st.st_size, st.st_mtime_ns, version,
+                                                              [list(issue) for issue in issues]]
+                        self._dirty = True
+
+        return [checks[path] for path, _ in files]
+
+    @staticmethod
+    def _make_check(path: str, size: int, version: Optional[str], issues: list,
+                    expected_version: Optional[str], cached: bool = False) -> ZkoFileCheck:
+        compatible = None
+        if expected_version and version is not None:
+            compatible = is_compatible(expected_version, version)
+        return ZkoFileCheck(path, size, version, compatible,
+                            [ZkoIssue(message, offset) for message, offset in issues], cached)
+
+    def save(self) -> None:
+        """Persist the result cache; failures only cost cache misses next time"""
+        with self._lock:
+            if self.cache_file is None or not self._dirty:
+                return
+            # Forget files that no longer exist so the cache does not grow forever
+            self._cache = {path: entry for path, entry in self._cache.items() if os.path.exists(path)}
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump({'format': CACHE_FORMAT_VERSION, 'files': self._cache}, f)
+                    os.replace(tmp_path, self.cache_file)
+                except OSError:
+                    os.unlink(tmp_path)
+                    raise
+                self._dirty = False
+            except OSError:
+                pass
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get('format') == CACHE_FORMAT_VERSION:
+            files = data.get('files')
+            if isinstance(files, dict):
+                self._cache = {path: entry for path, entry in files.items()
+                               if isinstance(entry, list) and len(entry) == 4 and isinstance(entry[3], list)}
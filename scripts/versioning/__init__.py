@@ -5,6 +5,8 @@ Version management functionality for Zernikalos
 
 from .version_manager import VersionManager
 from .types import ValidationResult, ReleaseResult, PushResult, VersionInfo
+from .version_files import VersionFileGenerator, VersionFileError
 
-__all__ = ['VersionManager', 'ValidationResult', 'ReleaseResult', 'PushResult', 'VersionInfo']
+__all__ = ['VersionManager', 'ValidationResult', 'ReleaseResult', 'PushResult', 'VersionInfo',
+           'VersionFileGenerator', 'VersionFileError']
 
@@ -0,0 +1,149 @@
+"""
+Release State
+Checkpoint journal that lets an interrupted release resume where it stopped
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from tools.hashing import DEFAULT_CACHE_PATH, HashingEngine
+
+
+STATE_PATH = Path("build") / "release-state.json"
+
+# Files each release step reads and writes (relative to the project root).
+# A checkpoint stays valid while both still hash to the recorded digests.
+STEP_FILES: Dict[str, Tuple[List[str], List[str]]] = {
+    "set_version": ([], ["VERSION.txt"]),
+    "upgrade_kotlin_package_lock": (
+        ["build.gradle.kts", "settings.gradle.kts", "gradle.properties", "gradle/libs.versions.toml"],
+        ["kotlin-js-store"]
+    ),
+    "update_version": (
+        ["VERSION.txt", ".zversion.kt.template", "build.gradle.kts"],
+        ["src/commonMain/kotlin/zernikalos/ZVersion.kt", "zernikalos.podspec"]
+    ),
+    # The commit and tag are checked through git instead (see VersionManager)
+    "release_commit": ([], []),
+}
+
+
+class ReleaseJournal:
+    """
+    On-disk record of the release steps completed for one version
+
+    Each completed step is stored with a digest of its inputs (the release
+    version plus the files it reads) and of its outputs. On resume a step is
+    skipped only if both digests still match, so a step whose inputs or
+    outputs were edited in the meantime runs again. The journal is written
+    atomically after every step and removed once the release is finished.
+    """
+
+    def __init__(self, project_root: Path, state_file: Optional[Path] = None):
+        """
+        Initialize release journal
+
+        Args:
+            project_root: Root directory of the project
+            state_file: Journal location (default: build/release-state.json)
+        """
+        self.project_root = project_root
+        self.state_file = state_file or project_root / STATE_PATH
+        self.hasher = HashingEngine(cache_file=project_root / DEFAULT_CACHE_PATH)
+
+    def load(self) -> Optional[dict]:
+        """
+        Read the journal
+
+        Returns:
+            Journal dictionary or None if there is no readable journal
+        """
+        try:
+            with open(self.state_file, "r") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(state, dict) or not isinstance(state.get("steps"), dict):
+            return None
+        return state
+
+    def start(self, version: str, base_commit: Optional[str]) -> None:
+        """
+        Begin a new journal, discarding any previous one
+
+        Args:
+            version: Version being released
+            base_commit: HEAD commit the release started from
+        """
+        self._save({
+            "version": version,
+            "base_commit": base_commit,
+            "started_at": time.time(),
+            "steps": {},
+        })
+
+    def record_step(self, version: str, step: str) -> None:
+        """
+        Record a completed step with its current input and output digests
+
+        Args:
+            version: Version being released
+            step: Release step id
+        """
+        state = self.load()
+        if state is None or state.get("version") != version:
+            return
+        inputs, outputs = self._digests(version, step)
+        state["steps"][step] = {"inputs": inputs, "outputs": outputs, "completed_at": time.time()}
+        self._save(state)
+
+    def is_step_valid(self, version: str, step: str) -> bool:
+        """
+        Check whether a recorded step can be skipped
+
+        Args:
+            version: Version being released
+            step: Release step id
+
+        Returns:
+            True if the step was completed for this version and its inputs and
+            outputs are unchanged since
+        """
+        state = self.load()
+        if state is None or state.get("version") != version:
+            return False
+        entry = state["steps"].get(step)
+        if not entry:
+            return False
+        inputs, outputs = self._digests(version, step)
+        return entry.get("inputs") == inputs and entry.get("outputs") == outputs
+
+    def clear(self) -> None:
+        """Remove the journal once the release is complete"""
+        try:
+            self.state_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _digests(self, version: str, step: str) -> Tuple[str, str]:
+        inputs, outputs = STEP_FILES.get(step, ([], []))
+        try:
+            input_digest = f"{version}:{self.hasher.hash_tree(inputs, self.project_root)}"
+            output_digest = self.hasher.hash_tree(outputs, self.project_root)
+        finally:
+            self.hasher.save()
+        return input_digest, output_digest
+
+    def _save(self, state: dict) -> None:
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
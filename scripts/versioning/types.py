@@ -3,7 +3,7 @@ Versioning Types
 Data classes for structured results from version management operations
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 from tools import VersionBump
 
@@ -22,6 +22,9 @@ class ReleaseResult:
     version: str
     steps_completed: List[str]
     error_message: Optional[str] = None
+    gradle_profile: Optional[str] = None
+    # Steps reused from a checkpoint instead of being run (resume mode)
+    steps_skipped: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -0,0 +1,159 @@
+"""
+Version Files
+Native generation of the files Gradle's updateVersion task derives from the version
+"""
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+
+TEMPLATE_PATH = Path(".zversion.kt.template")
+ZVERSION_PATH = Path("src") / "commonMain" / "kotlin" / "zernikalos" / "ZVersion.kt"
+PODSPEC_PATH = Path("zernikalos.podspec")
+
+# Placeholder replaced by the generateVersionFile task
+VERSION_PLACEHOLDER = "${project.version}"
+# `spec.version = '0.7.0'` as written by the CocoaPods plugin's podspec task
+_PODSPEC_VERSION = re.compile(rb"^(\s*spec\.version\s*=\s*)'[^'\n]*'", re.MULTILINE)
+
+
+class VersionFileError(Exception):
+    """Raised when a version file cannot be generated natively"""
+
+
+class VersionFileGenerator:
+    """
+    Generates ZVersion.kt and the podspec version without starting Gradle
+
+    The output is byte-identical to Gradle's: ZVersion.kt is the template with
+    the version placeholder replaced (generateVersionFile), and the podspec
+    only differs from the plugin's output in the `spec.version` line, which is
+    rewritten in place. Files are written atomically and left untouched when
+    their content does not change.
+
+    The JS bundle (jsBrowserDistribution, also run by updateVersion) is a
+    build artifact rather than a templated file; it is rebuilt by the
+    publishers when its fingerprint no longer matches.
+    """
+
+    def __init__(self, project_root: Path):
+        """
+        Initialize generator
+
+        Args:
+            project_root: Root directory of the project
+        """
+        self.project_root = project_root
+
+    def render(self, version: str) -> Dict[Path, bytes]:
+        """
+        Compute the content of every version file
+
+        Args:
+            version: Version string (e.g., '0.7.1')
+
+        Returns:
+            Dictionary mapping absolute path to file content
+
+        Raises:
+            VersionFileError: If the template or podspec cannot be read or has no version to replace
+        """
+        template_file = self.project_root / TEMPLATE_PATH
+        try:
+            template = template_file.read_bytes()
+        except OSError as e:
+            raise VersionFileError(f"Cannot read {TEMPLATE_PATH}: {e}")
+        if VERSION_PLACEHOLDER.encode() not in template:
+            raise VersionFileError(f"{TEMPLATE_PATH} has no {VERSION_PLACEHOLDER} placeholder")
+
+        podspec_file = self.project_root / PODSPEC_PATH
+        try:
+            podspec = podspec_file.read_bytes()
+        except OSError as e:
+            raise VersionFileError(f"Cannot read {PODSPEC_PATH}: {e}")
+        podspec, replaced = _PODSPEC_VERSION.subn(
+            lambda match: match.group(1) + b"'" + version.encode() + b"'", podspec, count=1
+        )
+        if not replaced:
+            raise VersionFileError(f"{PODSPEC_PATH} has no spec.version line")
+
+        return {
+            self.project_root / ZVERSION_PATH: template.replace(VERSION_PLACEHOLDER.encode(), version.encode()),
+            podspec_file: podspec,
+        }
+
+    def generate(self, version: str) -> List[Path]:
+        """
+        Write the version files
+
+        Args:
+            version: Version string (e.g., '0.7.1')
+
+        Returns:
+            Paths that were changed
+
+        Raises:
+            VersionFileError: If a file cannot be rendered or written
+        """
+        changed = []
+        for path, content in self.render(version).items():
+            try:
+                if path.read_bytes() == content:
+                    continue
+            except OSError:
+                pass
+            try:
+                write_atomic(path, content)
+            except OSError as e:
+                raise VersionFileError(f"Cannot write {path}: {e}")
+            changed.append(path)
+        return changed
+
+    def outdated(self, version: str) -> List[Path]:
+        """
+        List version files whose content does not match the version
+
+        Args:
+            version: Version string
+
+        Returns:
+            Paths that generate() would change
+        """
+        stale = []
+        for path, content in self.render(version).items():
+            try:
+                if path.read_bytes() == content:
+                    continue
+            except OSError:
+                pass
+            stale.append(path)
+        return stale
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """
+    Replace a file's content atomically, keeping its permissions
+
+    Args:
+        path: File to write (parent directories are created)
+        content: New content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
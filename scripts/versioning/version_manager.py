@@ -4,26 +4,56 @@ Pure business logic for version management - no I/O
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 from common import BaseScript, validate_version
-from tools import ConventionalCommitsTool
+from tools import ConventionalCommitsTool, GitTool
+from tools.tracing import span, traced
 from .types import ValidationResult, ReleaseResult, PushResult, VersionInfo
+from .release_state import ReleaseJournal
+from .version_files import VersionFileError, VersionFileGenerator
+
+
+# Release steps in order: (step id, Gradle task, error message)
+RELEASE_STEPS: List[Tuple[str, str, str]] = [
+    ("set_version", "setVersion", "Failed to set version"),
+    ("upgrade_kotlin_package_lock", "kotlinUpgradePackageLock", "Failed to upgrade Kotlin package lock"),
+    ("update_version", "updateVersion", "Failed to generate version files"),
+    ("release_commit", "releaseCommit", "Failed to create release commit and tag"),
+]
 
 
 class VersionManager(BaseScript):
     """Version management functionality - pure business logic"""
     
-    def __init__(self, project_root: Path = None):
+    def __init__(self, project_root: Path = None, native_version_files: bool = True):
         """
         Initialize version manager
         
         Args:
             project_root: Root directory of the project
+            native_version_files: Generate version files in Python instead of
+                                  running Gradle's updateVersion task
         """
         super().__init__("Zernikalos Version Manager")
         if project_root:
             self.project_root = project_root
-        self.conventional_commits = ConventionalCommitsTool(self.project_root)
+        # A release makes many small git lookups (tags, HEAD); serve them from a
+        # single long-lived git process shared with the commit analyzer
+        self.git = GitTool(self.project_root, persistent=True)
+        self.conventional_commits = ConventionalCommitsTool(self.project_root, git=self.git)
+        self.journal = ReleaseJournal(self.project_root)
+        self.native_version_files = native_version_files
+        self.version_files = VersionFileGenerator(self.project_root)
+    
+    def __enter__(self) -> 'VersionManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release resources held by the manager (persistent git process)"""
+        self.git.close()
         
     def get_current_version(self) -> Optional[str]:
         """
@@ -34,66 +64,279 @@ class VersionManager(BaseScript):
         """
         return self.get_project_version()
     
-    def execute_release(self, version: str) -> ReleaseResult:
+    def _run_step(self, step: str, func, *args) -> bool:
+        """Run a single release step inside a tracing span"""
+        with span(f"release.{step}") as s:
+            success = func(*args)
+            s.set(success=success)
+            return success
+    
+    @traced("release.execute_release")
+    def execute_release(self, version: str, batched: bool = False, resume: bool = False) -> ReleaseResult:
         """
         Execute the release steps
         
+        Every completed step is checkpointed in build/release-state.json. With
+        resume, steps that were already completed for this version (and whose
+        inputs and outputs are unchanged) are skipped.
+        
         Args:
             version: Version string to release
+            batched: Run all Gradle steps in a single wrapper invocation
+            resume: Continue an interrupted release of the same version
             
         Returns:
             ReleaseResult with success status and details
         """
-        steps_completed = []
+        skipped = self.start_release(version, resume)
+        start_index = len(skipped)
         
-        # Step 1: Set version
-        if not self.gradle.set_version(version):
-            return ReleaseResult(
-                success=False,
-                version=version,
-                steps_completed=steps_completed,
-                error_message="Failed to set version"
-            )
-        steps_completed.append("set_version")
+        if batched:
+            return self._execute_release_batched(version, start_index)
         
-        # Step 2: Upgrade Kotlin package lock
-        if not self.gradle.upgrade_kotlin_package_lock():
-            return ReleaseResult(
-                success=False,
-                version=version,
-                steps_completed=steps_completed,
-                error_message="Failed to upgrade Kotlin package lock"
-            )
-        steps_completed.append("upgrade_kotlin_package_lock")
+        steps_completed = list(skipped)
+        for step, _, error_message in RELEASE_STEPS[start_index:]:
+            if not self.run_release_step(version, step):
+                return ReleaseResult(
+                    success=False,
+                    version=version,
+                    steps_completed=steps_completed,
+                    error_message=error_message,
+                    gradle_profile=self.gradle.profile.name,
+                    steps_skipped=skipped
+                )
+            steps_completed.append(step)
         
-        # Step 3: Generate version files
-        # Pass version as project property to ensure cocoapods plugin reads it correctly
-        if not self.gradle.update_version(version):
-            return ReleaseResult(
-                success=False,
-                version=version,
-                steps_completed=steps_completed,
-                error_message="Failed to generate version files"
-            )
-        steps_completed.append("update_version")
+        return ReleaseResult(
+            success=True,
+            version=version,
+            steps_completed=steps_completed,
+            gradle_profile=self.gradle.profile.name,
+            steps_skipped=skipped
+        )
+
+    def run_release_step(self, version: str, step: str) -> bool:
+        """
+        Run a single release step and checkpoint it on success
+        
+        Steps must run in RELEASE_STEPS order; execute_release() does that, and
+        workflows express the same order as step dependencies.
+        
+        Args:
+            version: Version string to release
+            step: Step id from RELEASE_STEPS
+            
+        Returns:
+            True if the step succeeded, False otherwise
+        """
+        step_calls = {
+            "set_version": (self.gradle.set_version, (version,)),
+            "upgrade_kotlin_package_lock": (self.gradle.upgrade_kotlin_package_lock, ()),
+            # Pass version as project property to ensure cocoapods plugin reads it correctly
+            "update_version": (self.update_version_files, (version,)),
+            # Pass version as project property to ensure updateVersion (which releaseCommit depends on) reads it correctly;
+            # with native version files, updateVersion already ran as a previous step and is excluded
+            "release_commit": (self.gradle.release_commit, (version, self.native_version_files)),
+        }
+        func, args = step_calls[step]
+        if not self._run_step(step, func, *args):
+            return False
+        self.journal.record_step(version, step)
+        return True
+    
+    def update_version_files(self, version: str) -> bool:
+        """
+        Generate the version-dependent files (ZVersion.kt, podspec)
+        
+        Uses the native generator, which writes the same bytes as Gradle's
+        updateVersion task without starting the JVM. Gradle runs instead when
+        native generation is disabled or not possible in this tree.
+        
+        Args:
+            version: Version string
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.native_version_files and self._generate_version_files(version):
+            return True
+        return self.gradle.update_version(version)
+    
+    def _generate_version_files(self, version: str) -> bool:
+        """Generate the version files natively; False if Gradle has to do it"""
+        with span("release.update_version.native") as s:
+            try:
+                s.set(changed=len(self.version_files.generate(version)))
+                return True
+            except VersionFileError as e:
+                s.set(fallback=str(e))
+                return False
+    
+    def start_release(self, version: str, resume: bool = False) -> List[str]:
+        """
+        Prepare the checkpoint journal for a release
+        
+        Args:
+            version: Version string to release
+            resume: Keep valid checkpoints of an interrupted release of this version
+            
+        Returns:
+            Steps that are already done and can be skipped
+        """
+        done = self.completed_release_steps(version) if resume else []
+        if not done:
+            self.journal.start(version, self.git.resolve_ref("HEAD"))
+        return done
+    
+    def completed_release_steps(self, version: str) -> List[str]:
+        """
+        Get the steps of an interrupted release that are still valid (read-only)
         
-        # Step 4: Create release commit and tag
-        # Pass version as project property to ensure updateVersion (which releaseCommit depends on) reads it correctly
-        if not self.gradle.release_commit(version):
+        Args:
+            version: Version string
+            
+        Returns:
+            Leading steps of RELEASE_STEPS whose checkpoints still match
+        """
+        return [step for step, _, _ in RELEASE_STEPS[:self._resume_index(version)]]
+    
+    def _execute_release_batched(self, version: str, start_index: int = 0) -> ReleaseResult:
+        """
+        Execute the remaining release steps in one Gradle invocation
+        
+        Avoids paying JVM startup and the configuration phase once per step. The
+        step that failed is recovered from Gradle's task execution output, so
+        steps_completed matches what the sequential mode would report. With
+        native version files, they are generated before Gradle starts (they
+        only depend on the version) and updateVersion is left out of the build.
+        
+        Args:
+            version: Version string to release
+            start_index: Index in RELEASE_STEPS of the first step to run
+            
+        Returns:
+            ReleaseResult with success status and details
+        """
+        skipped = [step for step, _, _ in RELEASE_STEPS[:start_index]]
+        remaining = RELEASE_STEPS[start_index:]
+        if not remaining:
             return ReleaseResult(
-                success=False,
+                success=True,
                 version=version,
-                steps_completed=steps_completed,
-                error_message="Failed to create release commit and tag"
+                steps_completed=skipped,
+                gradle_profile=self.gradle.profile.name,
+                steps_skipped=skipped
             )
-        steps_completed.append("release_commit")
+        
+        step_ids = [step for step, _, _ in RELEASE_STEPS]
+        gradle_steps = remaining
+        # -Pversion makes every task in the build (updateVersion, podspec,
+        # releaseCommit) see the new version during configuration
+        args = [f'-PnewVersion={version}', f'-Pversion={version}']
+        if self.native_version_files and any(step == "update_version" for step, _, _ in remaining):
+            if self._generate_version_files(version):
+                gradle_steps = [entry for entry in remaining if entry[0] != "update_version"]
+                args.extend(['-x', 'updateVersion'])
+        
+        tasks = [task for _, task, _ in gradle_steps]
+        with span("release.batched_gradle", tasks=tasks):
+            success, stdout, stderr = self.gradle.run_tasks(tasks, *args, show_output=True)
+        
+        if success:
+            failed_index = len(RELEASE_STEPS)
+        else:
+            failed = self._find_failed_step(*self.gradle.parse_task_execution(stdout, stderr), steps=gradle_steps)
+            failed_index = step_ids.index(gradle_steps[failed][0])
+        completed = step_ids[start_index:failed_index]
+        for step in completed:
+            self.journal.record_step(version, step)
         
         return ReleaseResult(
-            success=True,
+            success=success,
             version=version,
-            steps_completed=steps_completed
+            steps_completed=skipped + completed,
+            error_message=None if success else RELEASE_STEPS[failed_index][2],
+            gradle_profile=self.gradle.profile.name,
+            steps_skipped=skipped
         )
-
+    
+    def _resume_index(self, version: str) -> int:
+        """
+        Find the first release step that has to run again
+        
+        Steps depend on the outputs of earlier steps, so everything after the
+        first invalid checkpoint runs again.
+        """
+        for index, (step, _, _) in enumerate(RELEASE_STEPS):
+            if not self._is_step_done(version, step):
+                return index
+        return len(RELEASE_STEPS)
+    
+    def _is_step_done(self, version: str, step: str) -> bool:
+        """Check a checkpoint against the current state of the working tree and git"""
+        if step == "release_commit":
+            # The release commit is done if the release tag points at HEAD
+            tag_commit = self.git.resolve_ref(f"v{version}^{{commit}}")
+            return tag_commit is not None and tag_commit == self.git.resolve_ref("HEAD")
+        return self.journal.is_step_valid(version, step)
+    
+    def has_resumable_release(self, version: str) -> bool:
+        """
+        Check whether an interrupted release of a version can be resumed
+        
+        Args:
+            version: Version string
+            
+        Returns:
+            True if a checkpoint journal exists for this version
+        """
+        state = self.journal.load()
+        return state is not None and state.get("version") == version
+    
+    def resumable_version(self) -> Optional[str]:
+        """
+        Get the version of the interrupted release recorded in the checkpoint journal
+        
+        Returns:
+            Version string, or None if there is no interrupted release
+        """
+        state = self.journal.load()
+        version = state.get("version") if state is not None else None
+        return version if isinstance(version, str) else None
+    
+    def finish_release(self) -> None:
+        """Discard the checkpoint journal once the release (including push) is complete"""
+        self.journal.clear()
+    
+    @staticmethod
+    def _find_failed_step(executed: List[str], failed_task: Optional[str],
+                          steps: Optional[List[Tuple[str, str, str]]] = None) -> int:
+        """
+        Map Gradle task execution to the index of the release step that failed
+        
+        A failing step task maps to its own step. Any other failing task (a
+        dependency or finalizer such as podspec) belongs to the most recent step
+        task that started. A failure before any step task started (e.g. during
+        configuration) is attributed to the first step.
+        
+        Args:
+            executed: Tasks in the order Gradle ran them
+            failed_task: Task that failed, if Gradle reported one
+            steps: Steps that were run (default: all RELEASE_STEPS); the index is relative to it
+        """
+        step_tasks = [task for _, task, _ in (steps or RELEASE_STEPS)]
+        if failed_task in step_tasks:
+            return step_tasks.index(failed_task)
+        
+        current = 0
+        for task in executed:
+            if task in step_tasks:
+                current = step_tasks.index(task)
+            if task == failed_task:
+                break
+        return current
+    
+    @traced("release.push_release")
     def push_release(self, version: str) -> PushResult:
         """
         Push changes to remote repository
@@ -113,10 +356,15 @@ class VersionManager(BaseScript):
                 error_message="Failed to push changes to remote"
             )
     
-    def calculate_next_version(self) -> Optional[VersionInfo]:
+    @traced("release.calculate_next_version")
+    def calculate_next_version(self, collect_commits: bool = True) -> Optional[VersionInfo]:
         """
         Calculate next version based on Conventional Commits
         
+        Args:
+            collect_commits: Whether the full list of analyzed commits is needed
+                             (False lets analysis stop at the first breaking change)
+        
         Returns:
             VersionInfo with calculated version details or None if error
         """
@@ -128,7 +376,7 @@ class VersionManager(BaseScript):
         
         try:
             next_version, maven_version, npm_version, commits, bump_type = \
-                self.conventional_commits.calculate_next_version(base_version)
+                self.conventional_commits.calculate_next_version(base_version, collect_commits=collect_commits)
             
             return VersionInfo(
                 base_version=base_version,
@@ -142,6 +390,7 @@ class VersionManager(BaseScript):
         except Exception:
             return None
     
+    @traced("release.validate_release")
     def validate_release(self, version: str) -> ValidationResult:
         """
         Validate version and check prerequisites for release
@@ -0,0 +1,9 @@
+"""
+Workflow Module
+Dependency-graph scheduling of release and publish steps
+"""
+
+from .scheduler import Workflow, Step, StepResult, WorkflowResult, format_result
+from .release import build_release_workflow
+
+__all__ = ['Workflow', 'Step', 'StepResult', 'WorkflowResult', 'format_result', 'build_release_workflow']
@@ -0,0 +1,87 @@
+"""
+Release Workflow
+Release and publish steps expressed as a dependency graph
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+from publishing import NpmPublisher, PublisherManager
+from publishing.base_builder import GitHubCredentials
+from versioning import VersionManager
+from versioning.version_manager import RELEASE_STEPS
+from .scheduler import Workflow
+
+
+HISTORY_PATH = Path("build") / "zmanager" / "workflow-timings.json"
+
+
+def build_release_workflow(
+    manager: VersionManager,
+    version: str,
+    credentials: Optional[GitHubCredentials] = None,
+    push: bool = True,
+    publish: bool = True,
+    skip_steps: Optional[List[str]] = None
+) -> Workflow:
+    """
+    Build the release workflow graph
+
+    The Gradle release steps run in order (the changelog is regenerated by the
+    releaseCommit task). Once the release commit exists, pushing and building
+    the JS bundle are independent and run concurrently; npm and Maven
+    publishing start as soon as their own prerequisites are done. Gradle steps
+    share the 'gradle' resource class, so only one runs at a time.
+
+    Args:
+        manager: VersionManager used for the release steps and the push
+        version: Version string to release
+        credentials: GitHub credentials for publishing (required if publish is True)
+        push: Whether to push the release commit and tag
+        publish: Whether to build and publish npm and Maven artifacts
+        skip_steps: Release steps already done (from a checkpoint); kept in the graph as no-ops
+
+    Returns:
+        Workflow ready to plan() or run()
+    """
+    project_root = manager.project_root
+    skip_steps = skip_steps or []
+    workflow = Workflow("release", history_file=project_root / HISTORY_PATH)
+
+    previous = None
+    for step, task, _ in RELEASE_STEPS:
+        if step in skip_steps:
+            workflow.add(step, lambda: True, deps=[previous] if previous else [],
+                         description=f"{task} (done, from checkpoint)")
+        elif step == "update_version" and manager.native_version_files:
+            workflow.add(step, lambda step=step: manager.run_release_step(version, step),
+                         deps=[previous] if previous else [], resource="local",
+                         description="Generate ZVersion.kt and podspec version (native)")
+        else:
+            workflow.add(step, lambda step=step: manager.run_release_step(version, step),
+                         deps=[previous] if previous else [], resource="gradle",
+                         description=f"./gradlew {task}")
+        previous = step
+
+    if push:
+        workflow.add("push", lambda: manager.push_release(version).success,
+                     deps=["release_commit"], resource="network",
+                     description=f"Push main and v{version}")
+
+    if publish:
+        publisher_manager = PublisherManager(project_root)
+        publish_deps = ["push"] if push else ["release_commit"]
+
+        # Builds the JS bundle and records its fingerprint, so the npm publisher
+        # later finds the artifacts up to date instead of rebuilding them
+        workflow.add("webpack_build", lambda: NpmPublisher(project_root=project_root).build_verify(),
+                     deps=["release_commit"], resource="gradle",
+                     description="JS production webpack bundle")
+        workflow.add("npm_publish", lambda: publisher_manager.publish_npm(credentials).success,
+                     deps=["webpack_build"] + publish_deps, resource="network",
+                     description="Publish npm packages")
+        workflow.add("maven_publish", lambda: publisher_manager.publish_maven(credentials).success,
+                     deps=publish_deps, resource="gradle",
+                     description="Build and publish Maven artifacts")
+
+    return workflow
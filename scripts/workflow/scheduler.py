@@ -0,0 +1,329 @@
+"""
+Workflow Scheduler
+Runs steps of a dependency graph in parallel, limited per resource class
+"""
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tools.tracing import span
+
+
+# Default concurrency per resource class. Gradle invocations on one project
+# serialize on its build lock anyway, and git commands on one repository on
+# its index lock, so those classes run one step at a time.
+DEFAULT_RESOURCE_LIMITS: Dict[str, int] = {
+    "gradle": 1,
+    "git": 1,
+    "network": 2,
+    "local": 4,
+}
+
+# Estimated duration (seconds) of a step that has never run, for dry-run plans
+DEFAULT_ESTIMATE = 1.0
+
+
+@dataclass
+class Step:
+    """A unit of work in a workflow"""
+    name: str
+    func: Callable[[], bool]
+    deps: List[str] = field(default_factory=list)
+    resource: str = "local"
+    description: str = ""
+
+
+@dataclass
+class StepResult:
+    """Outcome of one step"""
+    name: str
+    status: str  # 'success', 'failed', 'skipped' or 'planned' (dry run)
+    start: float = 0.0  # Seconds since the workflow started
+    duration: float = 0.0
+    error: Optional[str] = None
+    description: str = ""
+
+
+@dataclass
+class WorkflowResult:
+    """Outcome of a workflow run (or plan, for a dry run)"""
+    success: bool
+    steps: Dict[str, StepResult]
+    stages: List[List[str]]
+    critical_path: List[str]
+    critical_path_duration: float
+    total_duration: float = 0.0
+    dry_run: bool = False
+
+
+class Workflow:
+    """
+    Directed acyclic graph of steps
+
+    A step starts as soon as all of its dependencies succeeded and its
+    resource class has a free slot. When a step fails, every step that
+    depends on it (directly or not) is skipped; independent branches keep
+    running. Per-step durations can be kept in a history file so dry runs
+    can estimate the critical path.
+    """
+
+    def __init__(self, name: str, resource_limits: Optional[Dict[str, int]] = None,
+                 history_file: Optional[Path] = None):
+        """
+        Initialize workflow
+
+        Args:
+            name: Workflow name (used for tracing and the timing history)
+            resource_limits: Maximum concurrent steps per resource class
+            history_file: Optional JSON file with durations of previous runs
+        """
+        self.name = name
+        self.resource_limits = dict(DEFAULT_RESOURCE_LIMITS)
+        self.resource_limits.update(resource_limits or {})
+        self.history_file = history_file
+        self.steps: Dict[str, Step] = {}
+
+    def add(self, name: str, func: Callable[[], bool], deps: Optional[List[str]] = None,
+            resource: str = "local", description: str = "") -> Step:
+        """
+        Add a step
+
+        Args:
+            name: Unique step name
+            func: Callable returning True on success
+            deps: Names of steps that must succeed first
+            resource: Resource class limiting concurrency (see DEFAULT_RESOURCE_LIMITS)
+            description: Human readable description for plans
+
+        Returns:
+            The added Step
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        step = Step(name, func, list(deps or []), resource, description)
+        self.steps[name] = step
+        return step
+
+    def stages(self) -> List[List[str]]:
+        """
+        Group steps into stages; steps in the same stage are independent
+
+        Returns:
+            List of stages in execution order, each a list of step names
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        for step in self.steps.values():
+            missing = [dep for dep in step.deps if dep not in self.steps]
+            if missing:
+                raise ValueError(f"Step '{step.name}' depends on unknown step(s): {', '.join(missing)}")
+
+        remaining = {name: set(step.deps) for name, step in self.steps.items()}
+        stages = []
+        while remaining:
+            ready = [name for name in self.steps if name in remaining and not remaining[name]]
+            if not ready:
+                raise ValueError(f"Dependency cycle between steps: {', '.join(sorted(remaining))}")
+            stages.append(ready)
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return stages
+
+    def critical_path(self, durations: Dict[str, float]) -> Tuple[List[str], float]:
+        """
+        Find the longest chain of dependent steps
+
+        Resource limits are ignored, so this is a lower bound for the total
+        duration of the workflow.
+
+        Args:
+            durations: Duration of each step in seconds
+
+        Returns:
+            Tuple of (step names along the path, total duration)
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for stage in self.stages():
+            for name in stage:
+                deps = self.steps[name].deps
+                before = max(deps, key=lambda dep: finish[dep]) if deps else None
+                finish[name] = (finish[before] if before else 0.0) + durations.get(name, 0.0)
+                previous[name] = before
+
+        if not finish:
+            return [], 0.0
+        name = max(finish, key=lambda step_name: finish[step_name])
+        total = finish[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return list(reversed(path)), total
+
+    def plan(self) -> WorkflowResult:
+        """
+        Build a dry-run plan without running any step
+
+        Durations come from the timing history (or DEFAULT_ESTIMATE).
+
+        Returns:
+            WorkflowResult with 'planned' steps, stages and estimated critical path
+        """
+        stages = self.stages()
+        history = self._load_history()
+        estimates = {name: history.get(name, DEFAULT_ESTIMATE) for name in self.steps}
+        path, total = self.critical_path(estimates)
+        steps = {name: StepResult(name, "planned", duration=estimates[name], description=step.description)
+                 for name, step in self.steps.items()}
+        return WorkflowResult(True, steps, stages, path, total, dry_run=True)
+
+    def run(self, max_workers: int = 4) -> WorkflowResult:
+        """
+        Run all steps
+
+        Args:
+            max_workers: Maximum number of steps running at once
+
+        Returns:
+            WorkflowResult with per-step status and timing
+        """
+        stages = self.stages()
+        results: Dict[str, StepResult] = {}
+        pending = dict(self.steps)
+        in_use: Dict[str, int] = {}
+        origin = time.monotonic()
+
+        def execute(step: Step) -> StepResult:
+            start = time.monotonic()
+            try:
+                with span(f"{self.name}.{step.name}", "workflow", resource=step.resource) as s:
+                    success = bool(step.func())
+                    s.set(success=success)
+                error = None if success else "step reported failure"
+            except Exception as e:
+                success, error = False, f"{type(e).__name__}: {e}"
+            end = time.monotonic()
+            return StepResult(step.name, "success" if success else "failed",
+                              start=start - origin, duration=end - start, error=error)
+
+        with span(f"{self.name}.run", "workflow"), ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            running = {}
+            while pending or running:
+                # Steps are considered in insertion order, which breaks ties
+                for name in [name for name in self.steps if name in pending]:
+                    step = pending[name]
+                    blocked = [dep for dep in step.deps
+                               if dep in results and results[dep].status != "success"]
+                    if blocked:
+                        results[name] = StepResult(name, "skipped",
+                                                   error=f"dependency {', '.join(blocked)} did not succeed")
+                        del pending[name]
+                        continue
+                    if not all(dep in results for dep in step.deps):
+                        continue
+                    if in_use.get(step.resource, 0) >= self.resource_limits.get(step.resource, 1):
+                        continue
+                    in_use[step.resource] = in_use.get(step.resource, 0) + 1
+                    running[pool.submit(execute, step)] = step
+                    del pending[name]
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    results[step.name] = future.result()
+                    in_use[step.resource] -= 1
+
+        total = time.monotonic() - origin
+        durations = {name: result.duration for name, result in results.items() if result.status == "success"}
+        path, path_duration = self.critical_path(durations)
+        self._save_history(durations)
+
+        ordered = {name: results[name] for name in self.steps}
+        success = all(result.status == "success" for result in ordered.values())
+        return WorkflowResult(success, ordered, stages, path, path_duration, total_duration=total)
+
+    def _load_history(self) -> Dict[str, float]:
+        if self.history_file is None:
+            return {}
+        try:
+            with open(self.history_file, "r") as f:
+                data = json.load(f)
+            history = data.get(self.name, {}) if isinstance(data, dict) else {}
+            return {name: float(value) for name, value in history.items()}
+        except (OSError, json.JSONDecodeError, AttributeError, TypeError, ValueError):
+            return {}
+
+    def _save_history(self, durations: Dict[str, float]) -> None:
+        """Store the latest successful duration of each step; best effort"""
+        if self.history_file is None or not durations:
+            return
+        try:
+            with open(self.history_file, "r") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                data = {}
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        history = data.get(self.name) if isinstance(data.get(self.name), dict) else {}
+        history.update({name: round(duration, 3) for name, duration in durations.items()})
+        data[self.name] = history
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.history_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.history_file)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+
+def format_result(result: WorkflowResult) -> List[str]:
+    """
+    Render a plan or run result as text lines
+
+    Args:
+        result: WorkflowResult from Workflow.plan() or Workflow.run()
+
+    Returns:
+        Lines describing stages, per-step timing and the critical path
+    """
+    lines = []
+    for index, stage in enumerate(result.stages, 1):
+        lines.append(f"Stage {index}: {', '.join(stage)}")
+    lines.append("")
+
+    label = "estimate" if result.dry_run else "duration"
+    lines.append(f"  {'step':<28} {'status':<8} {'start':>8} {label:>9}")
+    for step in result.steps.values():
+        start = "" if result.dry_run or step.status == "skipped" else f"{step.start:7.1f}s"
+        duration = "" if step.status == "skipped" else f"{step.duration:8.1f}s"
+        line = f"  {step.name:<28} {step.status:<8} {start:>8} {duration:>9}"
+        if step.error:
+            line += f"  ({step.error})"
+        elif result.dry_run and step.description:
+            line += f"  {step.description}"
+        lines.append(line)
+    lines.append("")
+
+    if result.critical_path:
+        lines.append(f"Critical path ({result.critical_path_duration:.1f}s): {' -> '.join(result.critical_path)}")
+    if not result.dry_run:
+        lines.append(f"Total: {result.total_duration:.1f}s")
+    return lines
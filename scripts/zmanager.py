@@ -4,12 +4,17 @@ Zernikalos Manager
 Unified script for versioning and publishing Zernikalos artifacts
 """
 
+import os
 import sys
 from pathlib import Path
 from cli import create_parser
 from cli.version_cli import handle_version_command, handle_release_command
 from cli.publisher_cli import handle_publish_command, handle_status_command, handle_info_command
+from cli.assets_cli import handle_assets_command
 from common import BaseScript
+from tools import GradleTool, GRADLE_PROFILES
+from tools.gradle import GRADLE_PROFILE_ENV
+from tools.tracing import get_tracer
 
 
 
@@ -23,6 +28,35 @@ def main():
         parser.print_help()
         return 1
     
+    # Apply the Gradle execution profile to every GradleTool created from here on
+    if args.gradle_profile:
+        GradleTool.set_default_profile(args.gradle_profile)
+    elif (os.environ.get(GRADLE_PROFILE_ENV) or 'default') not in GRADLE_PROFILES:
+        # argparse validates --gradle-profile, but not the environment variable. BaseScript
+        # creates a GradleTool, so fall back to a valid profile before reporting the error
+        GradleTool.set_default_profile('default')
+        BaseScript("Zernikalos Manager").print_error(
+            f"Unknown Gradle profile in ${GRADLE_PROFILE_ENV}: {os.environ[GRADLE_PROFILE_ENV]}. "
+            f"Available: {', '.join(GRADLE_PROFILES)}"
+        )
+        return 1
+    
+    # Record timings of every step and subprocess if requested
+    tracer = get_tracer()
+    if args.trace:
+        tracer.enable()
+    
+    try:
+        with tracer.span(f"zmanager {args.command}", "command"):
+            return run_command(args, parser)
+    finally:
+        if args.trace:
+            tracer.write(Path(args.trace))
+            print(f"Trace written to {args.trace}")
+
+
+def run_command(args, parser) -> int:
+    """Route a parsed command to its handler"""
     # Initialize base script for common functionality
     base = BaseScript("Zernikalos Manager")
     
@@ -41,11 +75,14 @@ def main():
         return handle_release_command(args, base.project_root)
     
     elif args.command == 'status':
-        return handle_status_command(base.project_root)
+        return handle_status_command(base.project_root, args)
     
     elif args.command == 'info':
         return handle_info_command(args, base.project_root)
     
+    elif args.command == 'assets':
+        return handle_assets_command(args, base.project_root)
+    
     else:
         parser.print_help()
         return 1